@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the JSON backends which are installed for encoding and decoding single objects and batches.
+
+Usage: python benchmarks/backends.py
+"""
+
+from common import Order, new_order, run
+
+from jsontransform import ConfigurationError, JSONDecoder, JSONEncoder, _backends
+
+NUMBER = 20000
+BATCH_SIZE = 1000
+
+
+def main():
+    order = new_order(1)
+    orders = [new_order(index) for index in range(BATCH_SIZE)]
+    json_str = JSONEncoder().to_json_str(order)
+    json_strs = JSONEncoder().to_json_strs(orders)
+
+    for name in _backends.NAMES:
+        try:
+            _backends.get(name)
+        except ConfigurationError:
+            print("{:<40} not installed".format(name))
+            continue
+
+        encoder = JSONEncoder(backend=name)
+        decoder = JSONDecoder(backend=name)
+        run("{} to_json_str".format(name), lambda: encoder.to_json_str(order), NUMBER)
+        run("{} from_json_str".format(name), lambda: decoder.from_json_str(json_str, Order), NUMBER)
+        run("{} to_json_strs x{}".format(name, BATCH_SIZE), lambda: encoder.to_json_strs(orders), NUMBER // BATCH_SIZE)
+        run("{} from_json_strs x{}".format(name, BATCH_SIZE), lambda: decoder.from_json_strs(json_strs, Order),
+            NUMBER // BATCH_SIZE)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the interpreted encoding/decoding with the generated encode/decode functions.
+
+Usage: python benchmarks/codegen.py
+"""
+
+from common import Order, new_order, run
+
+from jsontransform import JSONDecoder, JSONEncoder
+
+NUMBER = 20000
+
+
+def main():
+    order = new_order(1)
+    encoded = JSONEncoder().to_json_dict(order)
+
+    for codegen in (False, True):
+        encoder = JSONEncoder(codegen=codegen)
+        decoder = JSONDecoder(codegen=codegen)
+
+        run("to_json_dict (codegen={})".format(codegen), lambda: encoder.to_json_dict(order), NUMBER)
+        run("from_json_dict (codegen={})".format(codegen), lambda: decoder.from_json_dict(encoded, Order), NUMBER)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jsontransform import JSONObject, field  # noqa: E402
+
+
+class Order(JSONObject):
+    def __init__(self):
+        self._id = 0
+        self._customer = u""
+        self._status = u""
+        self._total = 0.0
+        self._paid = False
+        self._items = []
+
+    @property
+    @field("id", required=True)
+    def id(self):
+        return self._id
+
+    @id.setter
+    def id(self, value):
+        self._id = value
+
+    @property
+    @field("customer")
+    def customer(self):
+        return self._customer
+
+    @customer.setter
+    def customer(self, value):
+        self._customer = value
+
+    @property
+    @field("status")
+    def status(self):
+        return self._status
+
+    @status.setter
+    def status(self, value):
+        self._status = value
+
+    @property
+    @field("total")
+    def total(self):
+        return self._total
+
+    @total.setter
+    def total(self, value):
+        self._total = value
+
+    @property
+    @field("paid")
+    def paid(self):
+        return self._paid
+
+    @paid.setter
+    def paid(self, value):
+        self._paid = value
+
+    @property
+    @field("items")
+    def items(self):
+        return self._items
+
+    @items.setter
+    def items(self, value):
+        self._items = value
+
+
+def new_order(index=0):
+    order = Order()
+    order.id = index
+    order.customer = u"customer {}".format(index)
+    order.status = u"shipped"
+    order.total = 42.5 + index
+    order.paid = bool(index % 2)
+    order.items = [u"item 1", u"item 2", u"item 3"]
+
+    return order
+
+
+def run(name, statement, number):
+    best = min(timeit.repeat(statement, number=number, repeat=5))
+    print("{:<40} {:>10.2f} us/op".format(name, best / number * 1e6))
@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare dateutil's isoparse with the built-in ISO 8601 parser of the decoder.
+
+Usage: python benchmarks/iso8601.py
+"""
+
+from common import run
+
+from dateutil import parser
+
+from jsontransform import _ISO8601
+
+NUMBER = 50000
+VALUES = ["2018-08-13", "2018-08-13T16:31:12Z", "20180813T163112.265+0200", "2018-08-13T16:31:12-05:30"]
+
+
+def main():
+    for value in VALUES:
+        if "T" in value:
+            run("isoparse {}".format(value), lambda: parser.isoparse(value), NUMBER)
+            run("_ISO8601 {}".format(value), lambda: _ISO8601.parse_datetime(value), NUMBER)
+        else:
+            run("isoparse {}".format(value), lambda: parser.isoparse(value).date(), NUMBER)
+            run("_ISO8601 {}".format(value), lambda: _ISO8601.parse_date(value), NUMBER)
+
+
+if __name__ == "__main__":
+    main()
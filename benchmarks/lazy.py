@@ -0,0 +1,43 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the eager with the lazy decoding of a document of which only a few top-level fields are read.
+
+Usage: python benchmarks/lazy.py
+"""
+
+from common import Order, new_order, run
+
+from jsontransform import JSONDecoder, JSONEncoder
+
+NUMBER = 2000
+
+
+def main():
+    order = new_order(1)
+    order.items = [new_order(index) for index in range(20)]
+    encoded = JSONEncoder().to_json_dict(order)
+    encoder = JSONEncoder()
+
+    for lazy in (False, True):
+        decoder = JSONDecoder(lazy=lazy)
+
+        def read_top_level_fields():
+            decoded = decoder.from_json_dict(encoded, Order)
+            return decoded.id, decoded.paid
+
+        def read_nested_fields():
+            decoded = decoder.from_json_dict(encoded, Order)
+            return [item.customer for item in decoded.items]
+
+        run("read 2 fields (lazy={})".format(lazy), read_top_level_fields, NUMBER)
+        run("read nested fields (lazy={})".format(lazy), read_nested_fields, NUMBER)
+        run(
+            "decode and encode (lazy={})".format(lazy),
+            lambda: encoder.to_json_dict(decoder.from_json_dict(encoded, Order)),
+            NUMBER
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measure how encoding and decoding a large batch of objects scales with the number of worker processes.
+
+Usage: python benchmarks/parallel.py [max workers]
+"""
+
+import multiprocessing
+import sys
+import timeit
+
+from common import new_order
+
+from jsontransform import dumps_many, loads_many
+
+COUNT = 200000
+
+
+def measure(name, statement):
+    best = min(timeit.repeat(statement, number=1, repeat=3))
+    print("{:<40} {:>10.2f} s {:>10.0f} objects/s".format(name, best, COUNT / best))
+
+
+def main():
+    max_workers = int(sys.argv[1]) if len(sys.argv) > 1 else multiprocessing.cpu_count()
+    orders = [new_order(index) for index in range(COUNT)]
+    json_strs = dumps_many(orders)
+
+    measure("dumps_many in process", lambda: dumps_many(orders))
+    measure("loads_many in process", lambda: loads_many(json_strs))
+
+    workers = 1
+    while workers <= max_workers:
+        measure("dumps_many workers={}".format(workers), lambda: dumps_many(orders, workers=workers))
+        measure("loads_many workers={}".format(workers), lambda: loads_many(json_strs, workers=workers))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
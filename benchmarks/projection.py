@@ -0,0 +1,33 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the decoding of all fields with the decoding of a few selected fields.
+
+Usage: python benchmarks/projection.py
+"""
+
+from common import Order, new_order, run
+
+from jsontransform import JSONDecoder, JSONEncoder
+
+NUMBER = 2000
+
+
+def main():
+    order = new_order(1)
+    order.items = [new_order(index) for index in range(20)]
+    encoded = JSONEncoder().to_json_dict(order)
+    decoder = JSONDecoder()
+
+    run("all fields", lambda: decoder.from_json_dict(encoded, Order), NUMBER)
+    run("only id, status", lambda: decoder.from_json_dict(encoded, Order, only=["id", "status"]), NUMBER)
+    run("only items.customer", lambda: decoder.from_json_dict(encoded, Order, only=["items.customer"]), NUMBER)
+    run(
+        "batch of 100, only id, status",
+        lambda: decoder.from_json_dicts([encoded] * 100, Order, only=["id", "status"]),
+        NUMBER // 100
+    )
+
+
+if __name__ == "__main__":
+    main()
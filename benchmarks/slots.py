@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compare the property fields with the slot fields by the memory of an instance, the attribute access and the
+encoding/decoding.
+
+Usage: python benchmarks/slots.py
+"""
+
+import sys
+
+from common import Order, new_order, run
+
+from jsontransform import JSONDecoder, JSONEncoder, JSONObject, slot_field
+
+NUMBER = 20000
+
+
+class SlotOrder(JSONObject):
+    id = slot_field("id", required=True, default=0)
+    customer = slot_field("customer", default=u"")
+    status = slot_field("status", default=u"")
+    total = slot_field("total", default=0.0)
+    paid = slot_field("paid", default=False)
+    items = slot_field("items", default_factory=list)
+
+
+def new_slot_order(index=0):
+    order = SlotOrder()
+    order.id = index
+    order.customer = u"customer {}".format(index)
+    order.status = u"shipped"
+    order.total = 42.5 + index
+    order.paid = bool(index % 2)
+    order.items = [u"item 1", u"item 2", u"item 3"]
+
+    return order
+
+
+def get_instance_size(instance):
+    size = sys.getsizeof(instance)
+    if hasattr(instance, "__dict__"):
+        size += sys.getsizeof(instance.__dict__)
+
+    return size
+
+
+def main():
+    for name, json_class, order in (("property", Order, new_order(1)), ("slot", SlotOrder, new_slot_order(1))):
+        print("{:<40} {:>10d} bytes".format("instance size ({})".format(name), get_instance_size(order)))
+
+        run("get attribute ({})".format(name), lambda: order.total, NUMBER * 10)
+        run("set attribute ({})".format(name), lambda: setattr(order, "total", 1.5), NUMBER * 10)
+        run("new instance ({})".format(name), json_class, NUMBER)
+
+        for codegen in (False, True):
+            encoder = JSONEncoder(codegen=codegen)
+            decoder = JSONDecoder(codegen=codegen)
+            encoded = encoder.to_json_dict(order)
+
+            run("to_json_dict ({}, codegen={})".format(name, codegen), lambda: encoder.to_json_dict(order), NUMBER)
+            run(
+                "from_json_dict ({}, codegen={})".format(name, codegen),
+                lambda: decoder.from_json_dict(encoded, json_class),
+                NUMBER
+            )
+
+
+if __name__ == "__main__":
+    main()
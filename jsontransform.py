@@ -1,15 +1,34 @@
 # -*- coding: utf-8 -*-
 
+import codecs
 import collections
+import contextlib
 import datetime
-import inspect
+import functools
+import importlib
+import io
 import itertools
 import json
+import json.encoder
+import mmap
+import os
+import pickle
 import re
 import sys
+import threading
+import weakref
 
-from dateutil import parser
-from decorator import decorator
+from dateutil import parser, tz
+
+try:
+    from collections.abc import Iterable
+except ImportError:
+    from collections import Iterable
+
+try:
+    import typing
+except ImportError:
+    typing = None
 
 __author__ = "Peter Morawski"
 __version__ = "1.0.1"
@@ -18,12 +37,49 @@ _DATE_FORMAT_REGEX = r"^([0-9]{4}-[0-9]{1,2}-[0-9]{1,2}|[0-9]{8})$"
 _DATETIME_FORMAT_REGEX = r"^([0-9]{4}-[0-9]{2}-[0-9]{2}|[0-9]{8})T([0-9]{2}(:[0-9]{2})?(:[0-9]{2})?|[0-9]{6}|[0-9]{4}" \
                          r")(\.[0-9]{3})?(Z|((\+|-)[0-9]{2}:?([0-9]{2})?))$"
 
+_WHITESPACE_PATTERN = re.compile(r"[ \t\n\r]*")
+_NUMBER_TAIL_PATTERN = re.compile(r"[0-9.eE+-]*")
+_ERROR_POSITION_PATTERN = re.compile(r"\(char ([0-9]+)")
+_DATE_FORMAT_PATTERN = re.compile(_DATE_FORMAT_REGEX)
+_DATETIME_FORMAT_PATTERN = re.compile(_DATETIME_FORMAT_REGEX)
+
+# the subset of the formats above which can be built directly without dateutil
+_FAST_DATE_PATTERN = re.compile(r"^([0-9]{4})(-?)([0-9]{2})\2([0-9]{2})$")
+_FAST_DATETIME_PATTERN = re.compile(
+    r"^([0-9]{4})(-?)([0-9]{2})\2([0-9]{2})T([0-9]{2})(?:(:?)([0-9]{2})(?:\6([0-9]{2})(?:\.([0-9]{1,6}))?)?)?"
+    r"(Z|[+-][0-9]{2}(?::?[0-9]{2})?)?$"
+)
+
 _JSON_FIELD_NAME = "_json_field_name"
 _JSON_FIELD_REQUIRED = "_json_field_required"
 _JSON_FIELD_MODE = "_json_field_mode"
+_JSON_FIELD_TYPE = "_json_field_type"
+_JSON_FIELD_MODULE = "_json_field_module"
+_JSON_SCHEMA = "_json_schema"
+_JSON_UNREGISTERED = "_json_unregistered"
+_JSON_TYPE_TAG = "_json_type_tag"
+_JSON_TYPE_KEY = "_json_type_key"
+_JSON_SLOT_FIELDS = "_json_slot_fields"
+_JSON_ALL_SLOT_FIELDS = "_json_all_slot_fields"
+
+TYPE_KEY = "@type"
+"""
+The default name of the key which contains the tag of a :func:`type_tag` decorated :class:`JSONObject` in a JSON
+document.
+"""
 
 _PY2 = 2
 
+CacheInfo = collections.namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+"""
+The statistics of a cache of the :class:`JSONDecoder` with the number of `hits` and `misses`, the `maxsize` of the
+cache and the current number of entries in it (`currsize`).
+"""
+
+_STRING_TYPES = (str, unicode) if sys.version_info.major == _PY2 else (str,)
+_SIMPLE_TYPES = frozenset([type(None), str, int, float, bool] + ([unicode] if sys.version_info.major == _PY2 else []))
+_NON_STRING_SIMPLE_TYPES = _SIMPLE_TYPES.difference(_STRING_TYPES)
+
 
 class ConfigurationError(Exception):
     """
@@ -46,12 +102,99 @@ class MissingObjectError(Exception):
     pass
 
 
-class JSONObject(object):
+class _JSONSlotField(object):
+    """
+    The declaration of a :func:`slot_field` which the metaclass of :class:`JSONObject` replaces with a slot.
+    """
+    _counter = itertools.count()
+
+    def __init__(self, field_name, required, mode, field_type, default, default_factory):
+        self.field_name = field_name
+        self.required = required
+        self.mode = mode
+        self.field_type = field_type
+        self.default = default
+        self.default_factory = default_factory
+        self.order = next(self._counter)
+        self.module = None
+        self.attribute = None
+        self.member = None
+        self.getter = None
+        self.setter = None
+
+    def bind(self, member):
+        """
+        :param member: The descriptor of the slot in which the value of the field is stored
+        """
+        self.member = member
+        self.getter = member.__get__
+        self.setter = member.__set__
+
+    @staticmethod
+    def new_instance(cls, *args, **kwargs):
+        """
+        The `__new__` of the classes which declare slot fields. It sets the defaults of all slot fields of a new
+        instance so they can be read before `__init__` assigns them.
+        """
+        instance = object.__new__(cls)
+        for setter, default, factory in cls._json_slot_defaults:
+            setter(instance, default if factory is None else factory())
+
+        return instance
+
+
+class _JSONObjectMeta(type):
+    """
+    Registers every subclass of :class:`JSONObject` as soon as it is defined so the decoder never has to search for it
+    and turns the :func:`slot_field` s of a class into `__slots__`.
+    """
+
+    def __new__(mcs, name, bases, namespace):
+        slot_fields = sorted(
+            (value for value in namespace.values() if isinstance(value, _JSONSlotField)), key=lambda value: value.order
+        )
+        if slot_fields:
+            namespace = dict(namespace)
+            slots = namespace.get("__slots__", ())
+            slots = (slots,) if isinstance(slots, _STRING_TYPES) else tuple(slots)
+            for attribute, value in list(namespace.items()):
+                if isinstance(value, _JSONSlotField):
+                    value.attribute = attribute
+                    value.module = namespace.get("__module__")
+                    del namespace[attribute]
+
+            namespace["__slots__"] = slots + tuple(slot_field.attribute for slot_field in slot_fields)
+            namespace[_JSON_SLOT_FIELDS] = tuple(slot_fields)
+            namespace.setdefault("__new__", _JSONSlotField.new_instance)
+
+        return super(_JSONObjectMeta, mcs).__new__(mcs, name, bases, namespace)
+
+    def __init__(cls, name, bases, namespace):
+        super(_JSONObjectMeta, cls).__init__(name, bases, namespace)
+
+        for slot_field in vars(cls).get(_JSON_SLOT_FIELDS, ()):
+            slot_field.bind(cls.__dict__[slot_field.attribute])
+
+        all_slot_fields = tuple(
+            slot_field for klass in reversed(cls.__mro__) for slot_field in vars(klass).get(_JSON_SLOT_FIELDS, ())
+        )
+        if all_slot_fields:
+            setattr(cls, _JSON_ALL_SLOT_FIELDS, all_slot_fields)
+            cls._json_slot_defaults = tuple(
+                (slot_field.setter, slot_field.default, slot_field.default_factory) for slot_field in all_slot_fields
+            )
+
+        if not namespace.get(_JSON_UNREGISTERED):
+            _registry.register(cls)
+
+
+class JSONObject(_JSONObjectMeta(str("_JSONObjectBase"), (object,), {_JSON_UNREGISTERED: True, "__slots__": ()})):
     """
     Every entity/class which is intended to be encodable and decodable to a JSON document **MUST** inherit/extend this
     class.
     """
-    pass
+    __slots__ = ()
+    _json_unregistered = True
 
 
 class FieldMode(object):
@@ -76,32 +219,104 @@ class FieldMode(object):
     """
 
 
-@decorator
-def field(func, field_name=None, required=False, mode=FieldMode.ENCODE_DECODE, *args, **kwargs):
+def field(field_name=None, required=False, mode=FieldMode.ENCODE_DECODE, field_type=None):
     """
     The :func:`field` decorator is used to mark that a :class:`property` inside a :class:`JSONObject` is a JSON field so
     it will appear in the JSON document when the :class:`JSONObject` is encoded or decoded.
 
+    The configuration of the field is attached to the getter once when the class body is evaluated so the getter itself
+    is returned unchanged and calling it doesn't have any overhead.
+
     .. note::
         * The brackets `()` after the @field decorator are important even when no additional arguments are given
         * The :class:`property` decorator must be at the top or else the function won't be recognized as a property
 
-    :param func: The method which is decorated with @property decorator.
     :param field_name: (optional) A name/alias for the field (how it should appear in the JSON document) since by \
     default the name of the property will be used.
     :param required: (optional) A `bool` which indicates if this field is mandatory for the decoding process. When a \
     field which is marked as required does NOT exist in the JSON document from which the JSONObject is decoded from, \
     a ConstraintViolationError will be raised. (False by default)
     :param mode: (optional) The FieldMode of the field. (ENCODE_DECODE by default)
+    :param field_type: (optional) The declared type of the field which is used to decode its value directly instead \
+    of guessing it. It can be `str`, `int`, `float`, `bool`, `datetime.date`, `datetime.datetime`, a JSONObject \
+    subclass (or its name as an `str` for classes which are defined later which is looked up in the module of the \
+    field first), `list`, `dict`, `typing.List[...]`, `typing.Dict[str, ...]` or `typing.Optional[...]` of one of \
+    these. A declared `str` is never decoded into a \
+    date/datetime and a declared `list` or `dict` is decoded as it is without searching for JSONObjects inside of \
+    it. (None by default)
     """
-    if not hasattr(func, _JSON_FIELD_NAME):
+    def mark_as_field(func):
         setattr(func, _JSON_FIELD_NAME, field_name or func.__name__)
-    if not hasattr(func, _JSON_FIELD_REQUIRED):
         setattr(func, _JSON_FIELD_REQUIRED, required)
-    if not hasattr(func, _JSON_FIELD_MODE):
         setattr(func, _JSON_FIELD_MODE, mode)
+        setattr(func, _JSON_FIELD_TYPE, field_type)
+        setattr(func, _JSON_FIELD_MODULE, func.__module__)
+
+        return func
+
+    return mark_as_field
+
+
+def slot_field(field_name=None, required=False, mode=FieldMode.ENCODE_DECODE, field_type=None, default=None,
+               default_factory=None):
+    """
+    Declare a JSON field of a :class:`JSONObject` whose value is stored in a `__slots__` entry instead of the `__dict__`
+    of the instance. It replaces the :class:`property`, the :func:`field` decorator, the setter and the private
+    attribute of a field so the attribute is read and written without calling any python function and the instances
+    of a class which only declares slot fields don't have a `__dict__` at all.
+
+    .. code-block:: python
+
+        class Car(JSONObject):
+            model_name = slot_field("modelName", required=True)
+            max_speed = slot_field("maxSpeed", default=0)
+            extras = slot_field(default_factory=list)
+
+    .. note::
+        The value of every slot field is set to its default before `__init__` is called. Like every other field a slot
+        field which is missing in a decoded JSON document is set to None. A class which uses slot fields can add
+        further attributes through its own `__slots__` but it can't add a `__dict__` attribute to them.
+
+    :param field_name: (optional) A name/alias for the field (how it should appear in the JSON document) since by \
+    default the name of the attribute will be used.
+    :param required: (optional) A `bool` which indicates if this field is mandatory for the decoding process. \
+    (False by default)
+    :param mode: (optional) The FieldMode of the field. (ENCODE_DECODE by default)
+    :param field_type: (optional) The declared type of the field. For more information you can look at the doc of \
+    :func:`field`. (None by default)
+    :param default: (optional) The value of the field in a new instance. (None by default)
+    :param default_factory: (optional) A function without arguments which creates the value of the field in a new \
+    instance *e.g.* `list` for mutable values which must NOT be shared between the instances. (None by default)
+    """
+    return _JSONSlotField(field_name, required, mode, field_type, default, default_factory)
+
+
+def type_tag(tag, key=TYPE_KEY):
+    """
+    The :func:`type_tag` class decorator declares a tag which identifies a :class:`JSONObject` in a JSON document. The
+    tag is written into every encoded document of the class and when a document which contains a known tag is decoded
+    without a target the class is resolved directly from the tag instead of searching the most matching
+    :class:`JSONObject`. Documents without a tag or with an unknown tag are still decoded by searching the most matching
+    :class:`JSONObject`.
+
+    .. note::
+        The tag is **NOT** inherited *i.e.* every subclass which should be tagged needs its own tag.
+
+    :param tag: The tag of the JSONObject (how it should appear in the JSON document)
+    :param key: (optional) The key under which the tag is stored in the JSON document. (`TYPE_KEY` by default)
+    """
+    def mark_with_type_tag(json_class):
+        setattr(json_class, _JSON_TYPE_TAG, tag)
+        setattr(json_class, _JSON_TYPE_KEY, key)
+        _JSONSchema.invalidate(json_class)
+        _registry.register_type_tag(json_class, key, tag)
 
-    return func(*args, **kwargs)
+        return json_class
+
+    return mark_with_type_tag
+
+
+_encode_json_str = json.encoder.encode_basestring_ascii
 
 
 class JSONEncoder(object):
@@ -116,6 +331,23 @@ class JSONEncoder(object):
     DATE_FORMAT = "%Y-%m-%d"
     DATETIME_TZ_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
     DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+    STREAM_CHUNK_SIZE = 64 * 1024
+    """
+    The minimum number of characters which are collected before they are written into the file-like object when a
+    :class:`JSONObject` is streamed.
+    """
+
+    def __init__(self, codegen=False, backend=None):
+        """
+        :param codegen: (optional) A `bool` which indicates if a specialized encode function should be generated and \
+        cached for every JSONObject class the first time it is encoded instead of interpreting its fields for every \
+        object. (False by default)
+        :param backend: (optional) The name of the JSON library which turns the encoded `dict` s into JSON documents. \
+        When this is empty then the backend which was selected with :func:`set_backend` is used. \
+        For more information you can look at the doc of :func:`set_backend`.
+        """
+        self.codegen = codegen
+        self.backend = backend
 
     def to_json_str(self, json_object):
         """
@@ -128,19 +360,169 @@ class JSONEncoder(object):
 
         :return: An str which contains the JSON representation of the passed JSONObject
         """
-        return json.dumps(self.to_json_dict(json_object))
+        return _backends.get(self.backend).dumps(self.to_json_dict(json_object))
+
+    def to_json_bytes(self, json_object):
+        """
+        Encode an instance of a :class:`JSONObject` into UTF-8 encoded `bytes` which contain a JSON document. Backends
+        which produce bytes themselves like `orjson` don't create an intermediate `str`.
+
+        :param json_object: The instance of the JSONObject which should be encoded
+
+        :raises ConfigurationError: When the JSONObject of which an instance was passed does NOT define any JSON fields
+        :raises TypeError: When the type of a field in the JSONObject is not encodable
+
+        :return: The bytes which contain the JSON representation of the passed JSONObject
+        """
+        return _backends.get(self.backend).dumpb(self.to_json_dict(json_object))
 
-    def to_json_file(self, json_object, json_file):
+    def to_json_file(self, json_object, json_file, stream=False):
         """
         Encode an instance of a :class:`JSONObject` and write the result into a `write()` supporting file-like object.
 
         :param json_object: The instance of the JSONObject which should be encoded
-        :param json_file: A write() supporting file-like object
+        :param json_file: A write() supporting file-like object which is opened in text or binary mode. UTF-8 encoded \
+        `bytes` are written into a binary file
+        :param stream: (optional) A `bool` which indicates if the JSONObject should be written in chunks while it is \
+        encoded instead of building the complete `dict` first. Iterators and generators inside of the JSONObject are \
+        consumed lazily in this mode. (False by default)
+
+        :raises ConfigurationError: When the JSONObject of which an instance was passed does NOT define any JSON fields
+        :raises TypeError: When the type of a field in the JSONObject is not encodable
+        """
+        binary = _JSONCommon.is_binary_file(json_file)
+        if not stream:
+            backend = _backends.get(self.backend)
+            json_dict = self.to_json_dict(json_object)
+            json_file.write(backend.dumpb(json_dict) if binary else backend.dumps(json_dict))
+            return
+
+        write = _JSONCommon.get_text_writer(json_file, binary)
+        chunk = []
+        chunk_size = 0
+        for piece in self.iterencode(json_object):
+            chunk.append(piece)
+            chunk_size += len(piece)
+
+            if chunk_size >= self.STREAM_CHUNK_SIZE:
+                write("".join(chunk))
+                chunk = []
+                chunk_size = 0
+
+        if chunk:
+            write("".join(chunk))
+
+    def to_json_lines(self, json_objects, json_file, workers=None):
+        """
+        Encode instances of :class:`JSONObject` s into a `write()` supporting file-like object as JSON Lines *i.e.*
+        every JSONObject is written as a JSON document in its own line. The lines are collected and written in chunks
+        instead of calling `write()` for every JSONObject.
+
+        :param json_objects: An iterable of the JSONObjects which should be encoded
+        :param json_file: A write() supporting file-like object which is opened in text or binary mode. UTF-8 encoded \
+        `bytes` are written into a binary file
+        :param workers: (optional) The number of processes which encode the JSONObjects. Every chunk which was encoded \
+        by a worker is written at once. For more information you can look at the doc of :func:`to_json_strs`.
+
+        :raises ConfigurationError: When a JSONObject of which an instance was passed does NOT define any JSON fields
+        :raises TypeError: When the type of a field in a JSONObject is not encodable
+        """
+        write = _JSONCommon.get_text_writer(json_file, _JSONCommon.is_binary_file(json_file))
+        if workers:
+            for json_lines in self._encode_in_processes(json_objects, workers, "\n"):
+                write(json_lines + "\n")
+            return
+
+        dumps = _backends.get(self.backend).dumps
+        chunk = []
+        chunk_size = 0
+        for json_object in json_objects:
+            line = dumps(self.to_json_dict(json_object))
+            chunk.append(line)
+            chunk_size += len(line) + 1
+
+            if chunk_size >= self.STREAM_CHUNK_SIZE:
+                chunk.append("")
+                write("\n".join(chunk))
+                chunk = []
+                chunk_size = 0
+
+        if chunk:
+            chunk.append("")
+            write("\n".join(chunk))
+
+    def iterencode(self, json_object):
+        """
+        Encode an instance of a :class:`JSONObject` into a JSON document piece by piece without building an
+        intermediate `dict`. The pieces are the same JSON document which :func:`to_json_str` returns.
+
+        :param json_object: The instance of the JSONObject which should be encoded
 
         :raises ConfigurationError: When the JSONObject of which an instance was passed does NOT define any JSON fields
         :raises TypeError: When the type of a field in the JSONObject is not encodable
+
+        :return: A generator which yields the `str` pieces of the JSON document
         """
-        json.dump(self.to_json_dict(json_object), json_file)
+        return self._iterencode_json_object(json_object)
+
+    def _iterencode_json_object(self, json_object):
+        schema = _JSONSchema.of(type(json_object))
+        if not schema.fields:
+            raise ConfigurationError("The class doesn't define any fields which can be serialized into JSON")
+
+        separator = "{"
+        if schema.type_tag is not None:
+            yield "{}{}: {}".format(separator, _encode_json_str(schema.type_key), _encode_json_str(schema.type_tag))
+            separator = ", "
+
+        for json_field in schema.encode_fields:
+            yield "{}{}: ".format(separator, _encode_json_str(json_field.name))
+            separator = ", "
+            for piece in self._iterencode_value(json_field.getter(json_object)):
+                yield piece
+
+        yield "{}" if separator == "{" else "}"
+
+    def _iterencode_value(self, value):
+        # subclasses of str go through the handlers since a codec may be registered for them
+        if value.__class__ in _STRING_TYPES:
+            yield _encode_json_str(value)
+            return
+        if value is None or value is True or value is False:
+            yield json.dumps(value)
+            return
+
+        handler = _codecs.encode_handlers.get(value.__class__)
+        if handler is None:
+            handler = _codecs.resolve_encode_handler(value.__class__)
+
+        if handler == JSONEncoder._sanitize_simple_value:
+            yield json.dumps(value)
+        elif handler == JSONEncoder._sanitize_json_object:
+            for piece in self._iterencode_json_object(value):
+                yield piece
+        elif handler == JSONEncoder._sanitize_dict:
+            separator = "{"
+            for key in value.keys():
+                encoded_key = key if isinstance(key, _STRING_TYPES) else json.dumps(key)
+                yield "{}{}: ".format(separator, _encode_json_str(encoded_key))
+                separator = ", "
+                for piece in self._iterencode_value(value[key]):
+                    yield piece
+
+            yield "{}" if separator == "{" else "}"
+        elif handler == JSONEncoder._sanitize_iterable:
+            separator = "["
+            for item in value:
+                yield separator
+                separator = ", "
+                for piece in self._iterencode_value(item):
+                    yield piece
+
+            yield "[]" if separator == "[" else "]"
+        else:
+            for piece in self._iterencode_value(handler(self, value)):
+                yield piece
 
     def to_json_dict(self, json_object):
         """
@@ -153,20 +535,133 @@ class JSONEncoder(object):
 
         :return: A dict which represents the passed JSONObject and is JSON conform
         """
-        result = {}
-        properties = _JSONCommon.get_decorated_properties(json_object)
-        if not properties.keys():
+        schema = _JSONSchema.of(type(json_object))
+        if not schema.fields:
             raise ConfigurationError("The class doesn't define any fields which can be serialized into JSON")
+        if self.codegen:
+            return schema.get_encode_function()(json_object, self._get_sanitized_value)
+
+        result = {}
+        if schema.type_tag is not None:
+            result[schema.type_key] = schema.type_tag
+        for json_field in schema.encode_fields:
+            result[json_field.name] = self._get_sanitized_value(json_field.getter(json_object))
+
+        return result
 
-        for key in properties.keys():
-            property_value = properties[key].fget(json_object)
+    def to_json_dicts(self, json_objects):
+        """
+        Encode instances of :class:`JSONObject` s into python `dict` s. The fields of every JSONObject class are only
+        looked up once for all of its instances instead of once for every instance.
+
+        :param json_objects: An iterable of the JSONObjects which should be encoded
+
+        :raises ConfigurationError: When a JSONObject of which an instance was passed does NOT define any JSON fields
+        :raises TypeError: When the type of a field in a JSONObject is not encodable
+
+        :return: A list with a JSON conform dict for every JSONObject in the same order as the passed JSONObjects
+        """
+        encode_functions = {}
+        result = []
+        for json_object in json_objects:
+            json_class = type(json_object)
+            encode = encode_functions.get(json_class)
+            if encode is None:
+                encode = encode_functions[json_class] = self._get_encode_function(json_class)
 
-            field_mode = _JSONFieldAttributes.get_mode(properties[key].fget)
-            if field_mode == FieldMode.ENCODE or field_mode == FieldMode.ENCODE_DECODE:
-                result[key] = self._get_sanitized_value(property_value)
+            result.append(encode(json_object))
 
         return result
 
+    def to_json_strs(self, json_objects, as_array=False, workers=None):
+        """
+        Encode instances of :class:`JSONObject` s into `str` s.
+
+        .. seealso::
+            For more information you can look at the doc of :func:`to_json_dicts`.
+
+        :param json_objects: An iterable of the JSONObjects which should be encoded
+        :param as_array: (optional) A `bool` which indicates if the JSONObjects should be encoded into a single `str` \
+        which contains a JSON array instead of a `str` for every JSONObject. (False by default)
+        :param workers: (optional) The number of processes which encode the JSONObjects. The JSONObjects are pickled \
+        and sent in chunks to a :class:`concurrent.futures.ProcessPoolExecutor` whose workers import the modules of \
+        all registered JSONObject classes once when they are started. The size of the chunks is derived from the \
+        pickled size of the first JSONObjects. Codecs which are registered at runtime must also be registered in the \
+        workers. Spreading the work requires Python 3.7 or newer. When this is empty then the JSONObjects are encoded \
+        in the current process
+
+        :raises ConfigurationError: When a JSONObject of which an instance was passed does NOT define any JSON fields \
+        or when workers are passed and the Python version is older than 3.7
+        :raises TypeError: When the type of a field in a JSONObject is not encodable
+
+        :return: A list with a str for every JSONObject in the same order as the passed JSONObjects or a single str \
+        with a JSON array when `as_array` is True
+        """
+        if workers and as_array:
+            return "[{}]".format(", ".join(self._encode_in_processes(json_objects, workers, ", ")))
+        if workers:
+            chunks = self._encode_in_processes(json_objects, workers)
+            return [json_str for json_strs in chunks for json_str in json_strs]
+
+        dumps = _backends.get(self.backend).dumps
+        json_dicts = self.to_json_dicts(json_objects)
+        if as_array:
+            return dumps(json_dicts)
+
+        return [dumps(json_dict) for json_dict in json_dicts]
+
+    def _encode_in_processes(self, json_objects, workers, separator=None):
+        """
+        Encode chunks of :class:`JSONObject` s into `str` s in worker processes.
+
+        :param json_objects: An iterable of the JSONObjects which should be encoded
+        :param workers: The number of processes
+        :param separator: (optional) The separator with which the strs of a chunk are joined
+
+        :return: A generator which yields a list of strs or a joined str for every chunk in the order of the JSONObjects
+        """
+        iterator = iter(json_objects)
+        sample = list(itertools.islice(iterator, _JSONWorker.SAMPLE_SIZE))
+        if not sample:
+            return
+
+        chunks = _JSONCommon.iter_chunks(itertools.chain(sample, iterator), _JSONWorker.get_chunk_size(sample))
+        initargs = (_registry.get_module_names(), None, {"codegen": self.codegen, "backend": self.backend})
+        for result in _JSONWorker.map(workers, initargs, _JSONWorker.encode, chunks, separator):
+            yield result
+
+    def _get_encode_function(self, json_class):
+        """
+        Get a function which encodes an instance of a :class:`JSONObject` class into a `dict` without looking up the
+        fields of the class again.
+
+        :param json_class: The type of the JSONObject
+
+        :raises ConfigurationError: When the JSONObject does NOT define any JSON fields
+
+        :return: A function with the signature `encode(json_object)`
+        """
+        schema = _JSONSchema.of(json_class)
+        if not schema.fields:
+            raise ConfigurationError("The class doesn't define any fields which can be serialized into JSON")
+
+        sanitize = self._get_sanitized_value
+        if self.codegen:
+            to_dict = schema.get_encode_function()
+            return lambda json_object: to_dict(json_object, sanitize)
+
+        type_key, type_tag = schema.type_key, schema.type_tag
+        fields = [(json_field.name, json_field.getter) for json_field in schema.encode_fields]
+
+        def encode(json_object):
+            result = {} if type_tag is None else {type_key: type_tag}
+            for name, getter in fields:
+                result[name] = sanitize(getter(json_object))
+
+            return result
+
+        return encode
+
     def _get_sanitized_value(self, value):
         """
         Sanitizes a value so that it can be encoded to a JSON document.
@@ -177,33 +672,42 @@ class JSONEncoder(object):
 
         :return: The sanitized value
         """
-        if value is None:
-            return value
-        elif _JSONCommon.value_is_simple_type(value):
-            return value
-        elif isinstance(value, dict):
-            result = {}
-            for key in value.keys():
-                result[key] = self._get_sanitized_value(value[key])
+        handler = _codecs.encode_handlers.get(value.__class__)
+        if handler is None:
+            handler = _codecs.resolve_encode_handler(value.__class__)
 
-            return result
-        elif _JSONCommon.value_not_str_and_iterable(value):
-            result = []
-            for item in value:
-                result.append(self._get_sanitized_value(item))
+        return handler(self, value)
 
-            return result
-        elif isinstance(value, JSONObject):
-            return dumpd(value)
-        elif isinstance(value, datetime.datetime):
-            if value.tzinfo:
-                return value.strftime(self.DATETIME_TZ_FORMAT)
-            else:
-                return value.strftime(self.DATETIME_FORMAT)
-        elif isinstance(value, datetime.date):
-            return value.strftime(self.DATE_FORMAT)
+    def _sanitize_simple_value(self, value):
+        return value
+
+    def _sanitize_dict(self, value):
+        result = {}
+        for key in value.keys():
+            result[key] = self._get_sanitized_value(value[key])
+
+        return result
+
+    def _sanitize_iterable(self, value):
+        return [self._get_sanitized_value(item) for item in value]
+
+    def _sanitize_json_object(self, value):
+        return self.to_json_dict(value)
+
+    def _sanitize_datetime(self, value):
+        if value.tzinfo:
+            return value.strftime(self.DATETIME_TZ_FORMAT)
         else:
-            raise TypeError("The object type `{}` is not JSON encodable".format(type(value)))
+            return value.strftime(self.DATETIME_FORMAT)
+
+    def _sanitize_date(self, value):
+        return value.strftime(self.DATE_FORMAT)
+
+    def _sanitize_raw_value(self, value):
+        return value.value
+
+    def _sanitize_unknown_value(self, value):
+        raise TypeError("The object type `{}` is not JSON encodable".format(type(value)))
 
 
 class JSONDecoder(object):
@@ -215,17 +719,71 @@ class JSONDecoder(object):
     - a `dict`
     - a `write()` supporting file-like object
     """
-    _KEY_OCCURRENCES = "occurrences"
-    _KEY_OBJECT = "object"
-    _KEY_PROPERTIES_AMOUNT = "properties_amount"
+    def __init__(self, codegen=False, autodetect_cache_size=128, sniff_dates=True, date_cache_size=None, backend=None,
+                 lazy=False):
+        """
+        :param codegen: (optional) A `bool` which indicates if a specialized decode function should be generated and \
+        cached for every JSONObject class the first time it is decoded instead of interpreting its fields for every \
+        dict. (False by default)
+        :param autodetect_cache_size: (optional) The maximum number of distinct key sets for which the result of the \
+        automatic target detection is remembered. The least recently used key set is evicted when the cache is full \
+        and 0 or None disables the cache. (128 by default)
+        :param sniff_dates: (optional) A `bool` which indicates if the `str` values of fields without a declared type \
+        should be checked if they contain an ISO 8601 date/datetime and decoded into a date/datetime. Fields which \
+        declare `str`, `datetime.date` or `datetime.datetime` as their type are never checked. (True by default)
+        :param date_cache_size: (optional) The maximum number of ISO 8601 `str`s for which the parsed date/datetime is \
+        remembered so documents which repeat the same dates don't parse them again. The least recently used `str` is \
+        evicted when the cache is full and 0 or None disables the cache. (None by default)
+        :param backend: (optional) The name of the JSON library which parses the JSON documents. When this is empty \
+        then the backend which was selected with :func:`set_backend` is used. For more information you can look at \
+        the doc of :func:`set_backend`.
+        :param lazy: (optional) A `bool` which indicates if the decoded JSONObjects should only set the fields whose \
+        values don't have to be decoded *i.e.* numbers, booleans and nulls. Nested JSONObjects, lists, dicts and \
+        `str` s which may contain a date are kept as they are and decoded the first time their field is read. Reading \
+        any other attribute *e.g.* the private attribute behind a property or a method decodes all pending values \
+        first. A field which was never read is encoded again without touching its value. The JSONObjects are \
+        instances of a subclass of the target so the errors which are raised while a value is decoded are raised when \
+        its field is read. JSONObjects which are decoded in worker processes are not lazy. (False by default)
+        """
+        self.codegen = codegen
+        self.backend = backend
+        self.lazy = lazy
+        self.sniff_dates = sniff_dates
+        self._autodetect_cache = _LRUCache(autodetect_cache_size) if autodetect_cache_size else None
+        self._autodetect_generation = None
+        self._date_cache = _LRUCache(date_cache_size) if date_cache_size else None
+
+    def autodetect_cache_info(self):
+        """
+        Get the statistics of the cache which remembers the result of the automatic target detection.
+
+        :return: A CacheInfo or None when the cache is disabled
+        """
+        if self._autodetect_cache is None:
+            return None
+
+        return self._autodetect_cache.info()
+
+    def date_cache_info(self):
+        """
+        Get the statistics of the cache which remembers the parsed dates/datetimes.
 
-    def from_json_str(self, json_str, target=None):
+        :return: A CacheInfo or None when the cache is disabled
+        """
+        if self._date_cache is None:
+            return None
+
+        return self._date_cache.info()
+
+    def from_json_str(self, json_str, target=None, only=None):
         """
         Decode an `str` into a :class:`JSONObject`. The `str` **MUST** contain a JSON document.
 
         :param json_str: The str which should be decoded
         :param target: (optional) The type of the target JSONObject into which this str should be decoded. When this \
         is empty then the target JSONObject will be searched automatically
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
 
         :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields
         :raises TypeError: When the signature of the passed target did NOT match the signature of the JSON document \
@@ -236,16 +794,37 @@ class JSONDecoder(object):
 
         :return: A JSONObject which matched the signature of the JSON document from the str and with the values of it
         """
-        return self.from_json_dict(json.loads(json_str), target)
+        return self.from_json_dict(_backends.get(self.backend).loads(json_str), target, only)
+
+    def from_json_bytes(self, json_bytes, target=None, only=None):
+        """
+        Decode UTF-8 encoded `bytes`, a `bytearray` or a `memoryview` into a :class:`JSONObject`. Backends which parse
+        bytes themselves like `orjson` don't create an intermediate `str`.
+
+        .. seealso::
+            For more information about the raised errors you can look at the doc of :func:`from_json_str`.
+
+        :param json_bytes: The bytes, bytearray or memoryview which should be decoded
+        :param target: (optional) The type of the target JSONObject into which the bytes should be decoded. When this \
+        is empty then the target JSONObject will be searched automatically
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :return: A JSONObject which matched the signature of the JSON document from the bytes and with the values of it
+        """
+        return self.from_json_dict(_backends.get(self.backend).loadb(json_bytes), target, only)
 
-    def from_json_file(self, json_file, target=None):
+    def from_json_file(self, json_file, target=None, only=None):
         """
         Decode a `read()` supporting file-like object into a :class:`JSONObject`. The file-like object **MUST** contain
         a valid JSON document.
 
-        :param json_file: The read() supporting file-like object which should be decoded into a JSONObject
+        :param json_file: The read() supporting file-like object which should be decoded into a JSONObject. It can be \
+        opened in text mode or in binary mode in which case it must return UTF-8 encoded `bytes`
         :param target: (optional) The type of the target JSONObject into which this file-like object should be \
         decoded. When this is empty then the target JSONObject will be searched automatically
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
 
         :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields
         :raises TypeError: When the signature of the passed target did NOT match the signature of the JSON document \
@@ -257,18 +836,175 @@ class JSONDecoder(object):
         :return: A JSONObject which matched the signature of the JSON document which the read() supporting file-like \
         object returned and with the values of it
         """
-        return self.from_json_dict(json.load(json_file), target)
+        backend = _backends.get(self.backend)
+        data = json_file.read()
+        if isinstance(data, _STRING_TYPES):
+            return self.from_json_dict(backend.loads(data), target, only)
+
+        return self.from_json_dict(backend.loadb(data), target, only)
+
+    def iter_json_file(self, json_file, target=None, array_path=None, only=None):
+        """
+        Decode the JSON objects of a JSON array from a `read()` supporting file-like object one by one into
+        :class:`JSONObject` s. The array is parsed incrementally so only the element which is currently decoded is kept
+        in memory instead of the whole document.
+
+        .. code-block:: python
+
+            with open("export.json", "rb") as export:
+                for car in decoder.iter_json_file(export, Car, array_path="items"):
+                    print(car.model_name)
+
+        :param json_file: The read() supporting file-like object which returns either `str` or UTF-8 encoded `bytes`
+        :param target: (optional) The type of the target JSONObject into which every element should be decoded. When \
+        this is empty then the target JSONObject will be searched automatically for every element
+        :param array_path: (optional) The dot separated keys which lead from the top-level JSON object to the array \
+        *e.g.* `items` or `data.items`. The values of the keys which precede the array are skipped but they are \
+        parsed completely. When this is empty then the document itself must be the array
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :raises ValueError: When the file-like object doesn't contain a valid JSON document or the array can't be found
+        :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields
+        :raises TypeError: When the signature of the passed target did NOT match the signature of an element i.e. \
+        they had no fields in common
+        :raises MissingObjectError: When no target JSONObject was specified AND no matching JSONObject could be found
+        :raises ConstraintViolationError: When a field of an element violated a constraint which is defined on the \
+        target JSONObject e.g. a required field is missing
+
+        :return: A generator which yields a JSONObject for every element of the array
+        """
+        only = _JSONProjection.compile(only)
+        for json_dict in _JSONArrayReader(json_file, array_path):
+            yield self.from_json_dict(json_dict, target, only)
+
+    def iter_json_lines(self, json_file, target=None, only=None):
+        """
+        Decode JSON Lines *i.e.* one JSON document per line from a `read()` supporting file-like object one by one into
+        :class:`JSONObject` s. Empty lines are skipped and the message of every raised error starts with the number of
+        the line which couldn't be decoded.
+
+        :param json_file: The iterable file-like object which returns either `str` or UTF-8 encoded `bytes` lines
+        :param target: (optional) The type of the target JSONObject into which every line should be decoded. When \
+        this is empty then the target JSONObject will be searched automatically for every line
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :raises ValueError: When a line doesn't contain a valid JSON document or a value of a line is invalid *e.g.* \
+        a date which doesn't exist
+        :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields
+        :raises TypeError: When a line doesn't contain a JSON object or the signature of the passed target did NOT \
+        match the signature of a line i.e. they had no fields in common
+        :raises MissingObjectError: When no target JSONObject was specified AND no matching JSONObject could be found
+        :raises ConstraintViolationError: When a field of a line violated a constraint which is defined on the target \
+        JSONObject e.g. a required field is missing
+
+        :return: A generator which yields a JSONObject for every non-empty line
+        """
+        backend = _backends.get(self.backend)
+        only = _JSONProjection.compile(only)
+        for line_number, line in enumerate(json_file, 1):
+            if not line.strip():
+                continue
+
+            try:
+                json_dict = backend.loads(line) if isinstance(line, _STRING_TYPES) else backend.loadb(line)
+            except ValueError as e:
+                raise ValueError("Line {}: {}".format(line_number, e))
+            if not isinstance(json_dict, dict):
+                raise TypeError("Line {}: Expected a JSON object but found `{}`".format(line_number, type(json_dict)))
+
+            try:
+                json_object = self.from_json_dict(json_dict, target, only)
+            except ValueError as e:
+                # subclasses of ValueError like JSONDecodeError don't accept a single message
+                raise ValueError("Line {}: {}".format(line_number, e))
+            except (ConfigurationError, ConstraintViolationError, MissingObjectError, TypeError) as e:
+                raise type(e)("Line {}: {}".format(line_number, e))
+
+            yield json_object
+
+    def from_json_path(self, path, target=None, only=None):
+        """
+        Decode the file at a path into a :class:`JSONObject`. The file is memory-mapped and parsed straight from the
+        mapped pages instead of reading it into an `str` first. Backends which parse bytes themselves like `orjson`
+        don't copy the file at all while the other backends decode it into a single `str`.
 
-    def from_json_dict(self, json_dict, target=None):
+        .. seealso::
+            For more information about the raised errors you can look at the doc of :func:`from_json_str`.
+
+        :param path: The path of the UTF-8 encoded file which should be decoded
+        :param target: (optional) The type of the target JSONObject into which the file should be decoded. When this \
+        is empty then the target JSONObject will be searched automatically
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :return: A JSONObject which matched the signature of the JSON document in the file and with the values of it
+        """
+        with _JSONCommon.map_file(path) as mapped:
+            json_dict = _backends.get(self.backend).loadb(b"" if mapped is None else mapped)
+
+        return self.from_json_dict(json_dict, target, only)
+
+    def iter_json_path(self, path, target=None, array_path=None, lines=False, only=None):
+        """
+        Decode the JSON objects of a JSON array or of JSON Lines from the file at a path one by one into
+        :class:`JSONObject` s. The file is memory-mapped so only the element/line which is currently decoded is copied
+        into the memory of the process and the mapped pages can be dropped by the operating system at any time.
+
+        .. seealso::
+            For more information you can look at the doc of :func:`iter_json_file` and :func:`iter_json_lines`.
+
+        :param path: The path of the UTF-8 encoded file which should be decoded
+        :param target: (optional) The type of the target JSONObject into which every element/line should be decoded. \
+        When this is empty then the target JSONObject will be searched automatically for every element/line
+        :param array_path: (optional) The dot separated keys which lead from the top-level JSON object to the array \
+        *e.g.* `items` or `data.items`. When this is empty then the document itself must be the array
+        :param lines: (optional) A `bool` which indicates if the file contains JSON Lines instead of a JSON array. \
+        (False by default)
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :raises ConfigurationError: When an array_path is passed for JSON Lines
+
+        :return: A generator which yields a JSONObject for every element of the array or every non-empty line
+        """
+        if lines and array_path:
+            raise ConfigurationError("JSON Lines don't have an array which could be found with an array_path")
+
+        with _JSONCommon.map_file(path) as mapped:
+            json_file = io.BytesIO() if mapped is None else _JSONMappedReader(mapped)
+            if lines:
+                json_objects = self.iter_json_lines(iter(json_file.readline, b""), target, only)
+            else:
+                json_objects = self.iter_json_file(json_file, target, array_path, only)
+
+            for json_object in json_objects:
+                yield json_object
+
+    def from_json_dict(self, json_dict, target=None, only=None):
         """
         Decode a python `dict` into a :class:`JSONObject`. The `dict` **MUST** be JSON conform so it cannot contain
         other object instances.
 
+        .. code-block:: python
+
+            order = decoder.from_json_dict(json_dict, Order, only=["id", "status", "owner.name"])
+
         :param json_dict: The dict which should be decoded
         :param target: (optional) The type of the target JSONObject into which this dict should be decoded. When this \
         is empty then the target JSONObject will be searched automatically
-
-        :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields
+        :param only: (optional) An iterable of the names of the fields (as they appear in the JSON document) which \
+        should be decoded. The fields of a nested JSONObject are selected with a dot separated path *e.g.* \
+        `owner.name` which selects the field `name` of the JSONObject in the field `owner` or of every JSONObject when \
+        the field contains a list or a dict of them. The values of the other fields are neither decoded nor set so \
+        they keep the value which the JSONObject got in its `__init__` and only the required fields which are \
+        selected are validated. The target is still searched with all keys of the dict. The decoder is neither lazy \
+        nor uses generated functions for the selected fields. When this is None or an empty iterable then all fields \
+        are decoded
+
+        :raises ConfigurationError: When the target JSONObject does NOT define any JSON fields or when a name in \
+        `only` (without a dot) doesn't match any decodable field of the target
         :raises TypeError: When the signature of the passed target did NOT match the signature of the passed dict i.e. \
         they had no fields in common
         :raises MissingObjectError: When no target JSONObject was specified AND no matching JSONObject could be found
@@ -277,23 +1013,201 @@ class JSONDecoder(object):
 
         :return: A JSONObject which matched the signature of the dict and with the values of it
         """
+        if only is not None:
+            only = _JSONProjection.compile(only)
+        if only is not None:
+            return self._decode_projected(json_dict, target, only)
         if target is None:
-            target = self._get_most_matching_json_object(json_dict)
+            target = _registry.get_tagged_json_object(json_dict) or self._get_most_matching_json_object(json_dict)
+
+        schema = _JSONSchema.of(target)
+        if self.lazy and schema.fields:
+            return schema.get_lazy_decode_function(target)(self, json_dict)
+        if self.codegen and schema.fields:
+            return schema.get_decode_function(target)(self, json_dict)
 
         result = target()
         self.validate_required_fields(result, json_dict)
-        properties = _JSONCommon.get_decorated_properties(result)
-        if not properties:
+        if not schema.fields:
             raise ConfigurationError("The JSONObject `{}` doesn't define any fields".format(target.__name__))
-        if all(properties.get(key) is None for key in json_dict.keys()):
+        if schema.match_names.isdisjoint(json_dict):
             raise TypeError("No matching fields found to build a JSONObject with the type `{}`".format(type(result)))
 
-        for key in properties.keys():
-            field_mode = _JSONFieldAttributes.get_mode(properties[key].fget)
+        for json_field in schema.decode_fields:
+            value = json_dict.get(json_field.name)
+            if json_field.field_type is None:
+                json_field.setter(result, self._revert_sanitized_value(value))
+            else:
+                json_field.setter(result, json_field.get_reverter()(self, value))
+
+        return result
+
+    def from_json_dicts(self, json_dicts, target=None, only=None):
+        """
+        Decode python `dict` s into :class:`JSONObject` s. The automatic target detection runs only once for every set
+        of keys and the fields of every JSONObject class are only looked up once for all of its dicts.
+
+        :param json_dicts: An iterable of the dicts which should be decoded
+        :param target: (optional) The type of the target JSONObject into which every dict should be decoded. When this \
+        is empty then the target JSONObject will be searched automatically
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :raises ConfigurationError: When a target JSONObject does NOT define any JSON fields
+        :raises TypeError: When the signature of a target did NOT match the signature of a dict i.e. they had no \
+        fields in common
+        :raises MissingObjectError: When no target JSONObject was specified AND no matching JSONObject could be found
+        :raises ConstraintViolationError: When a field inside a dict violated a constraint which is defined on the \
+        target JSONObject e.g. a required field is missing
+
+        :return: A list with a JSONObject for every dict in the same order as the passed dicts
+        """
+        only = _JSONProjection.compile(only)
+        decode_functions = {}
+        targets_by_keys = {}
+        result = []
+        for json_dict in json_dicts:
+            json_class = target
+            if json_class is None:
+                json_class = _registry.get_tagged_json_object(json_dict)
+            if json_class is None:
+                keys = tuple(json_dict)
+                json_class = targets_by_keys.get(keys)
+                if json_class is None:
+                    json_class = targets_by_keys[keys] = self._get_most_matching_json_object(json_dict)
+
+            decode = decode_functions.get(json_class)
+            if decode is None:
+                decode = decode_functions[json_class] = self._get_decode_function(json_class, only)
+
+            result.append(decode(json_dict))
+
+        return result
+
+    def from_json_strs(self, json_strs, target=None, workers=None, only=None):
+        """
+        Decode `str` s into :class:`JSONObject` s. Every `str` **MUST** contain a JSON document.
+
+        .. seealso::
+            For more information you can look at the doc of :func:`from_json_dicts`.
+
+        :param json_strs: An iterable of the strs or UTF-8 encoded bytes which should be decoded
+        :param target: (optional) The type of the target JSONObject into which every str should be decoded. When this \
+        is empty then the target JSONObject will be searched automatically
+        :param workers: (optional) The number of processes which decode the strs. When this is empty then the strs are \
+        decoded in the current process. For more information you can look at the doc of :func:`iter_json_strs`.
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :return: A list with a JSONObject for every str in the same order as the passed strs
+        """
+        if workers:
+            return list(self.iter_json_strs(json_strs, target, workers, only=only))
+
+        backend = _backends.get(self.backend)
+        return self.from_json_dicts(
+            (backend.loads(json_str) if isinstance(json_str, _STRING_TYPES) else backend.loadb(json_str)
+             for json_str in json_strs), target, only
+        )
+
+    def iter_json_strs(self, json_strs, target=None, workers=None, chunk_size=512, only=None):
+        """
+        Decode `str` s or `bytes` into :class:`JSONObject` s and optionally spread the work across processes. The strs
+        are sent in chunks to a :class:`concurrent.futures.ProcessPoolExecutor` whose workers import the modules of all
+        registered JSONObject classes and create their decoder once when they are started. Only a few chunks per worker
+        are decoded at the same time so the strs are consumed lazily.
+
+        .. note::
+            The decoded JSONObjects are pickled to return them from the workers so their classes must be importable
+            *i.e.* defined at the top level of a module. Spreading the work requires Python 3.7 or newer.
+
+        .. seealso::
+            For more information you can look at the doc of :func:`from_json_dicts`.
+
+        :param json_strs: An iterable of the strs or bytes which should be decoded
+        :param target: (optional) The type of the target JSONObject into which every str should be decoded. When this \
+        is empty then the target JSONObject will be searched automatically
+        :param workers: (optional) The number of processes which decode the strs. When this is empty then the strs are \
+        decoded in the current process
+        :param chunk_size: (optional) The number of strs which are sent to a worker at once. (512 by default)
+        :param only: (optional) The names of the fields which should be decoded. For more information you can look at \
+        the doc of :func:`from_json_dict`.
+
+        :raises ConfigurationError: When workers are passed and the Python version is older than 3.7
+
+        :return: A generator which yields a JSONObject for every str in the same order as the passed strs
+        """
+        if not workers:
+            only = _JSONProjection.compile(only)
+            for chunk in _JSONCommon.iter_chunks(json_strs, chunk_size):
+                for json_object in self.from_json_strs(chunk, target, only=only):
+                    yield json_object
+            return
+
+        options = {
+            "codegen": self.codegen,
+            "autodetect_cache_size": self._autodetect_cache.maxsize if self._autodetect_cache else None,
+            "sniff_dates": self.sniff_dates,
+            "date_cache_size": self._date_cache.maxsize if self._date_cache else None,
+            "backend": self.backend,
+        }
+        chunks = _JSONCommon.iter_chunks(json_strs, chunk_size)
+        initargs = (_registry.get_module_names(), options, None)
+        for json_objects in _JSONWorker.map(workers, initargs, _JSONWorker.decode, chunks, target, only):
+            for json_object in json_objects:
+                yield json_object
+
+    def _get_decode_function(self, target, projection=None):
+        """
+        Get a function which decodes a `dict` into a :class:`JSONObject` class without looking up the fields of the
+        class again.
+
+        :param target: The type of the JSONObject
+        :param projection: (optional) The compiled `only` argument or None to decode all fields
+
+        :return: A function with the signature `decode(json_dict)`
+        """
+        if projection is not None:
+            return lambda json_dict: self._decode_projected(json_dict, target, projection)
+
+        schema = _JSONSchema.of(target)
+        if self.lazy and schema.fields:
+            from_dict = schema.get_lazy_decode_function(target)
+            return lambda json_dict: from_dict(self, json_dict)
+        if self.codegen and schema.fields:
+            from_dict = schema.get_decode_function(target)
+            return lambda json_dict: from_dict(self, json_dict)
+
+        return lambda json_dict: self.from_json_dict(json_dict, target)
+
+    def _decode_projected(self, json_dict, target, projection):
+        """
+        Decode a `dict` into a :class:`JSONObject` while only the fields of a projection are decoded and set.
+
+        :param json_dict: The dict which should be decoded
+        :param target: The type of the target JSONObject or None to search it automatically
+        :param projection: The compiled `only` argument
+
+        :return: A JSONObject whose selected fields have the values of the dict
+        """
+        if target is None:
+            target = _registry.get_tagged_json_object(json_dict) or self._get_most_matching_json_object(json_dict)
+
+        schema = _JSONSchema.of(target)
+        required_names, plan = projection.get_plan(schema)
+        for field_name in required_names:
+            if field_name not in json_dict:
+                raise ConstraintViolationError(
+                    "The field `{}` is missing in the object `{}`".format(field_name, target.__name__)
+                )
+        if not schema.fields:
+            raise ConfigurationError("The JSONObject `{}` doesn't define any fields".format(target.__name__))
+        if schema.match_names.isdisjoint(json_dict):
+            raise TypeError("No matching fields found to build a JSONObject with the type `{}`".format(target))
 
-            if field_mode == FieldMode.DECODE or field_mode == FieldMode.ENCODE_DECODE:
-                value = self._revert_sanitized_value(json_dict.get(key))
-                properties[key].fset(result, value)
+        result = target()
+        for name, setter, revert in plan:
+            setter(result, revert(self, json_dict.get(name)))
 
         return result
 
@@ -309,20 +1223,19 @@ class JSONDecoder(object):
 
         :return: The reverted value of the sanitized value
         """
-        if sanitized_value is None:
+        if sanitized_value.__class__ in _NON_STRING_SIMPLE_TYPES:
             return sanitized_value
-        elif _JSONCommon.value_is_simple_type(sanitized_value):
-            if isinstance(sanitized_value, str) or sys.version_info.major == _PY2 and isinstance(sanitized_value,
-                                                                                                 unicode):
-                if re.match(_DATE_FORMAT_REGEX, sanitized_value):
-                    return parser.isoparse(sanitized_value).date()
-                elif re.match(_DATETIME_FORMAT_REGEX, sanitized_value):
-                    return parser.isoparse(sanitized_value)
+        elif sanitized_value.__class__ in _STRING_TYPES or isinstance(sanitized_value, _STRING_TYPES):
+            if self.sniff_dates:
+                if _DATE_FORMAT_PATTERN.match(sanitized_value):
+                    return self._revert_date(sanitized_value)
+                elif _DATETIME_FORMAT_PATTERN.match(sanitized_value):
+                    return self._revert_datetime(sanitized_value)
 
             return sanitized_value
         elif isinstance(sanitized_value, dict):
             try:
-                return loadd(sanitized_value)
+                return self.from_json_dict(sanitized_value)
             except MissingObjectError:
                 pass
 
@@ -333,150 +1246,1689 @@ class JSONDecoder(object):
                 result.append(self._revert_sanitized_value(item))
 
             return result
+        elif isinstance(sanitized_value, (int, float)):
+            return sanitized_value
         else:
             raise TypeError(
                 "The sanitization for the object type `{}` cannot be reverted".format(type(sanitized_value))
             )
 
-    def _get_most_matching_json_object(self, json_dict):
+    def _revert_date(self, date_str):
         """
-        Given a `dict` get the :class:`JSONObject` which matches it the most.
+        Decode an ISO 8601 formatted `str` into a :class:`datetime.date`.
 
-        :param json_dict: The dict for which a JSONObject should be searched
+        :param date_str: The str which contains the date
 
-        :raises MissingObjectError: When no matching JSONObject could be found
+        :raises ValueError: When the str is not a valid ISO 8601 date
 
-        :return: The type of the matching JSONObject
+        :return: The datetime.date of the str
         """
+        return self._parse_cached(_ISO8601.parse_date, date_str)
 
-        def search_by_json_object(json_object):
-            result = []
-
-            for obj in json_object.__subclasses__():
-                property_occurrences = 0
-                properties = _JSONCommon.get_decorated_properties(obj())
+    def _revert_datetime(self, datetime_str):
+        """
+        Decode an ISO 8601 formatted `str` into a :class:`datetime.datetime`.
 
-                for dict_property in json_dict.keys():
-                    for json_object_property in properties.keys():
-                        if dict_property == json_object_property:
-                            property_occurrences += 1
-                            break
+        :param datetime_str: The str which contains the datetime
 
-                if property_occurrences:
-                    result.append({
-                        self._KEY_OCCURRENCES: property_occurrences,
-                        self._KEY_OBJECT: obj,
-                        self._KEY_PROPERTIES_AMOUNT: len(properties.keys())
-                    })
+        :raises ValueError: When the str is not a valid ISO 8601 datetime
 
-                matching_sub_objects = search_by_json_object(obj)
-                for matched_object in matching_sub_objects:
-                    result.append(matched_object)
+        :return: The datetime.datetime of the str
+        """
+        return self._parse_cached(_ISO8601.parse_datetime, datetime_str)
 
-            return result
+    def _parse_cached(self, parse, value):
+        cache = self._date_cache
+        if cache is None:
+            return parse(value)
 
-        matching_objects = search_by_json_object(JSONObject)
-        if matching_objects:
-            matching_objects = sorted(matching_objects, key=lambda x: x[self._KEY_OCCURRENCES], reverse=True)
-            most_matching_objects = [
-                item for item in next(itertools.groupby(matching_objects, lambda x: x[self._KEY_OCCURRENCES]))[1]
-            ]
+        # dates and datetimes are immutable so the same instance can be shared between documents and threads
+        key = (parse, value)
+        result = cache.get(key)
+        if result is None:
+            result = parse(value)
+            cache.put(key, result)
 
-            # search if there is an object which has the exact same amount of properties as the passed dict
-            for match in most_matching_objects:
-                if match[self._KEY_PROPERTIES_AMOUNT] == len(json_dict.keys()):
-                    return match[self._KEY_OBJECT]
+        return result
 
-            return most_matching_objects[0][self._KEY_OBJECT]
+    def _get_most_matching_json_object(self, json_dict):
+        """
+        Given a `dict` get the :class:`JSONObject` which matches it the most.
+
+        :param json_dict: The dict for which a JSONObject should be searched
+
+        :raises MissingObjectError: When no matching JSONObject could be found
+
+        :return: The type of the matching JSONObject
+        """
+        cache = self._autodetect_cache
+        if cache is None:
+            return _registry.get_most_matching_json_object(json_dict)
+
+        # a newly defined or collected JSONObject class can change the result for any key set
+        if self._autodetect_generation != _registry.generation:
+            cache.clear()
+            self._autodetect_generation = _registry.generation
+
+        key = frozenset(json_dict)
+        target = cache.get(key)
+        if target is None:
+            try:
+                target = _registry.get_most_matching_json_object(json_dict)
+            except MissingObjectError:
+                target = MissingObjectError
+
+            cache.put(key, target)
+
+        if target is MissingObjectError:
+            raise MissingObjectError("No matching JSONObject could be found")
+
+        return target
+
+    @staticmethod
+    def validate_required_fields(json_object, json_dict):
+        """
+        Validate if a `dict` which will be decoded satisfied all required fields of the :class:`JSONObject` into which
+        it will be decoded.
+
+        :param json_object: The instance of the JSONObject into which the dict will be decoded
+        :param json_dict: The dict which should be validated
+
+        :raises ConstraintValidationError: When a required field is missing
+        """
+        for field_name in _JSONSchema.of(type(json_object)).required_names:
+            if field_name not in json_dict:
+                raise ConstraintViolationError(
+                    "The field `{}` is missing in the object `{}`".format(field_name, json_object.__class__.__name__)
+                )
+
+
+class _JSONCommon(object):
+    @staticmethod
+    def is_binary_file(json_file):
+        """
+        Check if a file-like object expects `bytes` *i.e.* it was opened in binary mode.
+
+        :param json_file: The file-like object which should be checked
+
+        :return: True if the file-like object expects bytes; False if it expects `str` s
+        """
+        if isinstance(json_file, io.TextIOBase):
+            return False
+        if isinstance(json_file, (io.RawIOBase, io.BufferedIOBase)):
+            return True
+
+        return "b" in getattr(json_file, "mode", "")
+
+    @staticmethod
+    def get_text_writer(json_file, binary):
+        """
+        :param json_file: A write() supporting file-like object
+        :param binary: A `bool` which indicates if the file-like object expects `bytes`
+
+        :return: A function which writes an `str` into the file-like object and encodes it with UTF-8 when it's binary
+        """
+        if binary:
+            return lambda text: json_file.write(text.encode("utf-8"))
+
+        return json_file.write
+
+    @staticmethod
+    @contextlib.contextmanager
+    def map_file(path):
+        """
+        Memory-map a file read-only so it can be parsed without copying it into the memory of the process.
+
+        :param path: The path of the file
+
+        :return: A context manager which returns the :class:`mmap.mmap` of the file or None when the file is empty \
+        because an empty file can't be mapped
+        """
+        with open(path, "rb") as json_file:
+            if os.fstat(json_file.fileno()).st_size == 0:
+                yield None
+                return
+
+            mapped = mmap.mmap(json_file.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                yield mapped
+            finally:
+                mapped.close()
+
+    @staticmethod
+    def iter_chunks(iterable, chunk_size):
+        """
+        Split an iterable into `list` s while consuming it lazily.
+
+        :param iterable: The iterable which should be split
+        :param chunk_size: The maximum length of a chunk
+
+        :return: A generator which yields the chunks in the order of the iterable
+        """
+        iterator = iter(iterable)
+        chunk = list(itertools.islice(iterator, chunk_size))
+        while chunk:
+            yield chunk
+            chunk = list(itertools.islice(iterator, chunk_size))
+
+
+class _JSONField(object):
+    """
+    The compiled description of a single :func:`field` of a :class:`JSONObject`.
+    """
+    __slots__ = (
+        "name", "member", "getter", "setter", "required", "mode", "field_type", "attribute", "module", "_reverter"
+    )
+
+    def __init__(self, name, member, required, mode, field_type, getter=None, setter=None, attribute=None,
+                 module=None):
+        self.name = name
+        self.member = member
+        self.getter = getter or member.fget
+        self.setter = setter or member.fset
+        self.required = required
+        self.mode = mode
+        self.field_type = field_type
+        self.attribute = attribute
+        self.module = module
+        self._reverter = None
+
+    def get_reverter(self):
+        """
+        Get the function which decodes a value of the declared type of the field and create it on the first call so
+        declared types which reference classes that are defined later can be resolved.
+
+        :raises ConfigurationError: When the declared type of the field is not supported
+
+        :return: A function with the signature `revert(decoder, value)`
+        """
+        if self._reverter is None:
+            self._reverter = _JSONFieldTypes.get_reverter(self.field_type, self.module)
+
+        return self._reverter
+
+    @property
+    def encodable(self):
+        return self.mode == FieldMode.ENCODE or self.mode == FieldMode.ENCODE_DECODE
+
+    @property
+    def decodable(self):
+        return self.mode == FieldMode.DECODE or self.mode == FieldMode.ENCODE_DECODE
+
+
+class _JSONSchema(object):
+    """
+    The compiled field layout of a :class:`JSONObject` class. It is built once per class and stored inside the
+    `__dict__` of the class itself so a subclass or a redefined class never reuses a stale schema.
+    """
+
+    def __init__(self, fields, type_key=None, type_tag=None):
+        self.fields = tuple(fields)
+        self.names = frozenset(json_field.name for json_field in self.fields)
+        self.type_key = type_key
+        self.type_tag = type_tag
+        self.match_names = self.names if type_tag is None else self.names.union([type_key])
+        self.encode_fields = tuple(json_field for json_field in self.fields if json_field.encodable)
+        self.decode_fields = tuple(json_field for json_field in self.fields if json_field.decodable)
+        self.required_names = tuple(json_field.name for json_field in self.fields if json_field.required)
+        self._encode_function = None
+        self._decode_function = None
+        self._lazy_decode_function = None
+
+    @classmethod
+    def of(cls, json_class):
+        """
+        Get the schema of a :class:`JSONObject` class and build it when it doesn't exist yet.
+
+        :param json_class: The type of the JSONObject of which the schema should be returned
+
+        :return: The _JSONSchema of the passed JSONObject type
+        """
+        schema = json_class.__dict__.get(_JSON_SCHEMA)
+        if schema is None:
+            schema = cls._build(json_class)
+            setattr(json_class, _JSON_SCHEMA, schema)
+
+        return schema
+
+    def get_encode_function(self):
+        """
+        Get the generated encode function of the schema and generate it on the first call.
+
+        :return: A function with the signature `to_dict(json_object, sanitize)` which encodes an instance of the \
+        JSONObject into a dict and passes every value which isn't a simple type to `sanitize`
+        """
+        if self._encode_function is None:
+            self._encode_function = _JSONCodeGenerator.generate_encode_function(self)
+
+        return self._encode_function
+
+    def get_decode_function(self, json_class):
+        """
+        Get the generated decode function of the schema and generate it on the first call.
+
+        :param json_class: The type of the JSONObject to which the schema belongs
+
+        :return: A function with the signature `from_dict(decoder, json_dict)` which validates the dict, \
+        instantiates the JSONObject and sets all decodable fields while reverting every value which isn't a simple \
+        type with the decoder
+        """
+        if self._decode_function is None:
+            self._decode_function = _JSONCodeGenerator.generate_decode_function(json_class, self)
+
+        return self._decode_function
+
+    def get_lazy_decode_function(self, json_class):
+        """
+        Get the function which decodes a `dict` into a lazy :class:`JSONObject` and create it on the first call.
+
+        :param json_class: The type of the JSONObject to which the schema belongs
+
+        :return: A function with the signature `from_dict(decoder, json_dict)` which validates the dict and returns \
+        an instance of the lazy subclass of the JSONObject
+        """
+        if self._lazy_decode_function is None:
+            self._lazy_decode_function = _JSONLazyDecoding.create_decode_function(json_class, self)
+
+        return self._lazy_decode_function
+
+    @classmethod
+    def invalidate(cls, json_class):
+        """
+        Drop the cached schema of a :class:`JSONObject` class *e.g.* after fields were added to it at runtime.
+
+        :param json_class: The type of the JSONObject whose schema should be rebuilt on the next access
+        """
+        if _JSON_SCHEMA in json_class.__dict__:
+            delattr(json_class, _JSON_SCHEMA)
+            _registry.refresh(json_class)
+
+    @classmethod
+    def _build(cls, json_class):
+        fields = collections.OrderedDict()
+        slot_fields = {
+            slot_field.attribute: slot_field for slot_field in getattr(json_class, _JSON_ALL_SLOT_FIELDS, ())
+        }
+
+        for name in cls._get_member_names(json_class):
+            member = cls._lookup(json_class, name)
+            slot_field = slot_fields.get(name)
+            if slot_field is not None and member is slot_field.member:
+                field_name = slot_field.field_name or name
+                fields[field_name] = _JSONField(
+                    field_name, member, slot_field.required, slot_field.mode, slot_field.field_type,
+                    slot_field.getter, slot_field.setter, name, slot_field.module
+                )
+                continue
+            if not isinstance(member, property):
+                continue
+
+            field_name = _JSONFieldAttributes.get_field_name(member.fget)
+            if field_name:
+                fields[field_name] = _JSONField(
+                    field_name,
+                    member,
+                    _JSONFieldAttributes.get_required(member.fget),
+                    _JSONFieldAttributes.get_mode(member.fget),
+                    _JSONFieldAttributes.get_type(member.fget),
+                    attribute=name,
+                    module=_JSONFieldAttributes.get_module(member.fget)
+                )
+
+        return cls(fields.values(), json_class.__dict__.get(_JSON_TYPE_KEY), json_class.__dict__.get(_JSON_TYPE_TAG))
+
+    @staticmethod
+    def _get_member_names(json_class):
+        # walk the MRO from the base to the subclass so the fields keep their declaration order
+        result = []
+        seen = set()
+        for klass in reversed(json_class.__mro__):
+            # the slots of a class are sorted by their name so the slot fields are ordered by their declaration
+            slot_names = [slot_field.attribute for slot_field in vars(klass).get(_JSON_SLOT_FIELDS, ())]
+            for name in slot_names + list(vars(klass)):
+                if name not in seen:
+                    seen.add(name)
+                    result.append(name)
+
+        return result
+
+    @staticmethod
+    def _lookup(json_class, name):
+        for klass in json_class.__mro__:
+            if name in vars(klass):
+                return vars(klass)[name]
+
+        return None
+
+
+class _LRUCache(object):
+    """
+    A thread safe mapping with a maximum size which evicts the least recently used entry when it is full and counts its
+    hits and misses.
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._data = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, key):
+        """
+        Get the value of a key and mark it as the most recently used entry.
+
+        :param key: The key of the entry
+
+        :return: The value of the entry or None when the key isn't cached
+        """
+        with self._lock:
+            value = self._data.pop(key, None)
+            if value is None:
+                self._misses += 1
+                return None
+
+            self._data[key] = value
+            self._hits += 1
+
+            return value
+
+    def put(self, key, value):
+        """
+        Add an entry to the cache and evict the least recently used entry when the cache is full.
+
+        :param key: The key of the entry
+        :param value: The value of the entry which must NOT be None
+        """
+        with self._lock:
+            self._data.pop(key, None)
+            self._data[key] = value
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        """
+        Remove all entries from the cache while keeping its statistics.
+        """
+        with self._lock:
+            self._data.clear()
+
+    def info(self):
+        """
+        :return: A CacheInfo with the statistics of the cache
+        """
+        with self._lock:
+            return CacheInfo(self._hits, self._misses, self.maxsize, len(self._data))
+
+
+class _JSONArrayReader(object):
+    """
+    Reads the elements of a JSON array from a `read()` supporting file-like object one by one. Only the element which
+    is currently decoded is kept in the buffer so the memory is bounded by the size of the biggest element and not by
+    the size of the document.
+    """
+    CHUNK_SIZE = 64 * 1024
+    PARTIAL_TOKEN_SIZE = 16
+    """
+    The number of characters at the end of the buffer in which an error may be caused by a literal, a number or an
+    escape sequence which continues in the next chunk *e.g.* `-Infin` or `\\u00`.
+    """
+
+    _scanner = json.JSONDecoder()
+
+    def __init__(self, json_file, array_path=None):
+        """
+        :param json_file: The read() supporting file-like object which returns either `str` or UTF-8 encoded `bytes`
+        :param array_path: (optional) The dot separated keys which lead from the top-level JSON object to the array \
+        *e.g.* `items` or `data.items`. When this is empty then the document itself must be the array
+        """
+        self._json_file = json_file
+        self._keys = array_path.split(".") if array_path else []
+        self._buffer = ""
+        self._position = 0
+        self._offset = 0
+        self._eof = False
+        self._text_decoder = None
+
+    def __iter__(self):
+        self._enter_array()
+        if self._peek() == "]":
+            self._position += 1
+            return
+
+        while True:
+            yield self._decode_value()
+
+            separator = self._peek()
+            self._position += 1
+            if separator == "]":
+                return
+            if separator != ",":
+                raise self._error("Expecting ',' delimiter or ']'")
+
+    def _enter_array(self):
+        for key in self._keys:
+            self._expect("{")
+            while True:
+                if self._peek() != "\"":
+                    raise self._error("The key `{}` of the array path wasn't found".format(key))
+                current_key = self._decode_value()
+                self._expect(":")
+                if current_key == key:
+                    break
+
+                self._decode_value()
+                if self._peek() != ",":
+                    raise self._error("The key `{}` of the array path wasn't found".format(key))
+                self._position += 1
+
+        self._expect("[")
+
+    def _expect(self, char):
+        if self._peek() != char:
+            raise self._error("Expecting '{}'".format(char))
+        self._position += 1
+
+    def _peek(self):
+        while True:
+            self._position = _WHITESPACE_PATTERN.match(self._buffer, self._position).end()
+            if self._position < len(self._buffer) or not self._read():
+                return self._buffer[self._position:self._position + 1]
+
+    def _decode_value(self):
+        self._peek()
+        while True:
+            try:
+                value, end = self._scanner.raw_decode(self._buffer, self._position)
+            except ValueError as e:
+                # a syntax error in the middle of the buffer is raised without reading the rest of the file
+                if self._is_partial(e) and self._read():
+                    continue
+                raise self._error("Expecting a valid JSON value")
+
+            # a number at the end of the buffer might continue in the next chunk e.g. `1.` of `1.5`, only a number ends
+            # with a digit
+            is_number = self._buffer[end - 1].isdigit()
+            if is_number and _NUMBER_TAIL_PATTERN.match(self._buffer, end).end() == len(self._buffer) and self._read():
+                continue
+
+            self._position = end
+            return value
+
+    def _read(self):
+        """
+        Append the next chunk of the file-like object to the buffer and drop the already consumed part of it. The chunk
+        grows with the buffer so a big element which has to be scanned repeatedly is read in a logarithmic number of
+        steps.
+
+        :return: False when the end of the file-like object was reached
+        """
+        if self._eof:
+            return False
+
+        chunk = self._json_file.read(max(self.CHUNK_SIZE, len(self._buffer) - self._position))
+        self._eof = not chunk
+        if not isinstance(chunk, _STRING_TYPES):
+            if self._text_decoder is None:
+                self._text_decoder = codecs.getincrementaldecoder("utf-8")()
+            chunk = self._text_decoder.decode(chunk, self._eof)
+
+        self._offset += self._position
+        self._buffer = self._buffer[self._position:] + chunk
+        self._position = 0
+
+        return not self._eof
+
+    def _is_partial(self, error):
+        """
+        Check if the error of the scanner may be caused by the end of the buffer instead of invalid JSON.
+
+        :param error: The ValueError of the scanner
+
+        :return: True if reading the next chunk may resolve the error
+        """
+        message = str(error)
+        if message.startswith("Unterminated string"):
+            return True
+
+        # Python 2 doesn't add the position to the error
+        position = getattr(error, "pos", None)
+        if position is None:
+            match = _ERROR_POSITION_PATTERN.search(message)
+            position = int(match.group(1)) if match else len(self._buffer)
+
+        return position >= len(self._buffer) - self.PARTIAL_TOKEN_SIZE
+
+    def _error(self, message):
+        return ValueError("{}: char {}".format(message, self._offset + self._position))
+
+
+class _JSONMappedReader(object):
+    """
+    Reads a memory-mapped file sequentially and tells the operating system to drop the pages which were already read
+    from the process (when it supports it) so the resident memory doesn't grow with the size of the file.
+    """
+    RELEASE_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, mapped):
+        """
+        :param mapped: The :class:`mmap.mmap` of the file
+        """
+        self._mapped = mapped
+        self._released = 0
+        self._can_release = hasattr(mapped, "madvise") and hasattr(mmap, "MADV_DONTNEED")
+
+    def read(self, size=-1):
+        data = self._mapped.read(size)
+        self._release()
+
+        return data
+
+    def readline(self):
+        line = self._mapped.readline()
+        self._release()
+
+        return line
+
+    def _release(self):
+        if not self._can_release:
+            return
+
+        end = self._mapped.tell() // mmap.PAGESIZE * mmap.PAGESIZE
+        if end - self._released >= self.RELEASE_SIZE:
+            self._mapped.madvise(mmap.MADV_DONTNEED, self._released, end - self._released)
+            self._released = end
+
+
+class _JSONObjectRegistry(object):
+    """
+    Keeps track of every :class:`JSONObject` subclass and maintains an index from the field names to the classes which
+    define them. The classes are only referenced weakly so a redefined or garbage collected class disappears from the
+    registry together with its type.
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._lock = threading.RLock()
+        self._sequence = itertools.count()
+        self._pending = []
+        self._type_tags = {}
+        self._references = {}
+        self._order = {}
+        self._preorder = {}
+        self._indexed_names = {}
+        self._index = {}
+
+    def register(self, json_class):
+        """
+        Register a :class:`JSONObject` class. Its fields are indexed lazily the next time the registry is searched.
+
+        :param json_class: The type of the JSONObject which should be registered
+        """
+        with self._lock:
+            reference = weakref.ref(json_class, self._forget)
+            self._references[reference] = reference
+            self._order[reference] = next(self._sequence)
+            # the position in a depth-first search over the subclasses of JSONObject, a class is found under the first
+            # of its bases
+            base_keys = [
+                self._preorder[self._references[weakref.ref(base)]] for base in json_class.__bases__
+                if weakref.ref(base) in self._references
+            ]
+            self._preorder[reference] = (min(base_keys) if base_keys else ()) + (self._order[reference],)
+            self._pending.append(reference)
+            self.generation += 1
+
+    def get_module_names(self):
+        """
+        :return: A set with the names of the modules in which the registered :class:`JSONObject` classes are defined
+        """
+        with self._lock:
+            json_classes = [reference() for reference in self._order]
+
+        return set(json_class.__module__ for json_class in json_classes if json_class is not None)
+
+    def register_type_tag(self, json_class, key, tag):
+        """
+        Register the tag of a :func:`type_tag` decorated :class:`JSONObject` class. A class which is defined later with
+        the same key and tag *e.g.* a redefined class replaces the previous one.
+
+        :param json_class: The type of the JSONObject which should be registered
+        :param key: The key under which the tag is stored in a JSON document
+        :param tag: The tag of the JSONObject
+        """
+        with self._lock:
+            reference = self._references.get(weakref.ref(json_class))
+            if reference is None:
+                raise ConfigurationError("Only subclasses of JSONObject can be tagged")
+
+            self._type_tags.setdefault(key, {})[tag] = reference
+            self.generation += 1
+
+    def get_tagged_json_object(self, json_dict):
+        """
+        Given a `dict` get the :class:`JSONObject` which is registered for the type tag inside the dict.
+
+        :param json_dict: The dict for which a JSONObject should be searched
+
+        :return: The type of the tagged JSONObject or None when the dict doesn't contain a known tag
+        """
+        for key, tags in self._type_tags.items():
+            tag = json_dict.get(key)
+            if tag is None:
+                continue
+
+            try:
+                reference = tags.get(tag)
+            except TypeError:
+                continue
+
+            if reference is not None:
+                return reference()
+
+        return None
+
+    def get_json_object_by_name(self, name, module=None):
+        """
+        Get a registered :class:`JSONObject` class by its name. The classes of the module are searched first and only
+        when the module doesn't define a class with the name all the other registered classes are searched. When
+        multiple classes of the same module have the name (*e.g.* a redefined class) the one which was defined last is
+        returned.
+
+        :param name: The name of the JSONObject class
+        :param module: (optional) The name of the module in which the class is searched first
+
+        :raises ConfigurationError: When no JSONObject with the name is registered or when it is not defined in the \
+        module but in multiple other modules
+
+        :return: The type of the JSONObject
+        """
+        with self._lock:
+            references = sorted(self._order, key=self._order.get)
+
+        matches = [
+            json_class for json_class in (reference() for reference in references)
+            if json_class is not None and json_class.__name__ == name
+        ]
+        if not matches:
+            raise ConfigurationError("No JSONObject with the name `{}` could be found".format(name))
+
+        local_matches = [json_class for json_class in matches if json_class.__module__ == module]
+        if local_matches:
+            return local_matches[-1]
+
+        module_names = sorted(set(json_class.__module__ for json_class in matches))
+        if len(module_names) > 1:
+            raise ConfigurationError("The name `{}` is ambiguous since JSONObjects with it are defined in the modules "
+                                     "{}".format(name, ", ".join(module_names)))
+
+        return matches[-1]
+
+    def refresh(self, json_class):
+        """
+        Index the fields of an already registered :class:`JSONObject` class again *e.g.* after its schema changed.
+
+        :param json_class: The type of the JSONObject which should be indexed again
+        """
+        with self._lock:
+            reference = self._references.get(weakref.ref(json_class))
+            if reference in self._indexed_names:
+                self._remove_from_index(reference)
+                self._pending.append(reference)
+                self.generation += 1
+
+    def get_most_matching_json_object(self, json_dict):
+        """
+        Given a `dict` get the :class:`JSONObject` which matches it the most *i.e.* the class which has the most fields
+        in common with the dict. When multiple classes have the same amount of fields in common then the class which has
+        exactly as many fields as the dict has keys is preferred. Any remaining tie is resolved by the order of a \
+        depth-first search over the subclasses of :class:`JSONObject` *i.e.* a subclass comes right after its base.
+
+        :param json_dict: The dict for which a JSONObject should be searched
+
+        :raises MissingObjectError: When no matching JSONObject could be found
+
+        :return: The type of the matching JSONObject
+        """
+        if self._pending:
+            self._index_pending()
+
+        occurrences = {}
+        for key in json_dict:
+            for reference in self._index.get(key, ()):
+                occurrences[reference] = occurrences.get(reference, 0) + 1
+
+        if not occurrences:
+            raise MissingObjectError("No matching JSONObject could be found")
+
+        most_occurrences = max(occurrences.values())
+        candidates = sorted(
+            (reference for reference in occurrences if occurrences[reference] == most_occurrences),
+            key=lambda reference: self._preorder.get(reference, ())
+        )
+
+        # search if there is an object which has the exact same amount of properties as the passed dict
+        for reference in candidates:
+            if len(self._indexed_names.get(reference, ())) == len(json_dict):
+                return reference()
+
+        return candidates[0]()
+
+    def _index_pending(self):
+        with self._lock:
+            for reference in self._pending:
+                json_class = reference()
+                if json_class is None or reference in self._indexed_names:
+                    continue
+
+                names = _JSONSchema.of(json_class).names
+                self._indexed_names[reference] = names
+                for name in names:
+                    self._index.setdefault(name, []).append(reference)
+
+            del self._pending[:]
+
+    def _remove_from_index(self, reference):
+        for name in self._indexed_names.pop(reference, ()):
+            references = self._index[name]
+            references.remove(reference)
+            if not references:
+                del self._index[name]
+
+    def _forget(self, reference):
+        with self._lock:
+            self._remove_from_index(reference)
+            self._references.pop(reference, None)
+            self._order.pop(reference, None)
+            self._preorder.pop(reference, None)
+            for tags in self._type_tags.values():
+                for tag in [tag for tag in tags if tags[tag] is reference]:
+                    del tags[tag]
+            if reference in self._pending:
+                self._pending.remove(reference)
+            self.generation += 1
+
+
+class _JSONCodeGenerator(object):
+    """
+    Generates straight-line encode/decode functions out of a :class:`_JSONSchema` so the field list and the field modes
+    don't have to be interpreted again for every object.
+    """
+
+    @classmethod
+    def generate_encode_function(cls, schema):
+        namespace = {"simple_types": _SIMPLE_TYPES}
+        lines = ["def to_dict(json_object, sanitize):", "    result = {}"]
+        if schema.type_tag is not None:
+            lines.append("    result[{!r}] = {!r}".format(schema.type_key, schema.type_tag))
+
+        for index, json_field in enumerate(schema.encode_fields):
+            getter_name = "getter_{}".format(index)
+            namespace[getter_name] = json_field.getter
+            lines.append("    value = {}(json_object)".format(getter_name))
+            lines.append("    result[{!r}] = value if value.__class__ in simple_types else sanitize(value)".format(
+                json_field.name
+            ))
+
+        lines.append("    return result")
+
+        return cls._compile(lines, namespace, "to_dict")
+
+    @classmethod
+    def generate_decode_function(cls, json_class, schema):
+        namespace = {
+            "json_class": json_class,
+            "names": schema.match_names,
+            "simple_types": _NON_STRING_SIMPLE_TYPES,
+            "ConstraintViolationError": ConstraintViolationError
+        }
+        lines = ["def from_dict(decoder, json_dict):", "    revert = decoder._revert_sanitized_value"]
+
+        for field_name in schema.required_names:
+            lines.append("    if {!r} not in json_dict:".format(field_name))
+            lines.append("        raise ConstraintViolationError({!r})".format(
+                "The field `{}` is missing in the object `{}`".format(field_name, json_class.__name__)
+            ))
+
+        lines.append("    if names.isdisjoint(json_dict):")
+        lines.append("        raise TypeError({!r})".format(
+            "No matching fields found to build a JSONObject with the type `{}`".format(json_class)
+        ))
+        lines.append("    result = json_class()")
+
+        for index, json_field in enumerate(schema.decode_fields):
+            setter_name = "setter_{}".format(index)
+            namespace[setter_name] = json_field.setter
+            lines.append("    value = json_dict.get({!r})".format(json_field.name))
+
+            if json_field.field_type is None:
+                lines.append("    {}(result, value if value.__class__ in simple_types else revert(value))".format(
+                    setter_name
+                ))
+            else:
+                field_name = "field_{}".format(index)
+                namespace[field_name] = json_field
+                lines.append("    {}(result, {}.get_reverter()(decoder, value))".format(setter_name, field_name))
+
+        lines.append("    return result")
+
+        return cls._compile(lines, namespace, "from_dict")
+
+    @staticmethod
+    def _compile(lines, namespace, function_name):
+        exec(compile("\n".join(lines), "<jsontransform-{}>".format(function_name), "exec"), namespace)
+        return namespace[function_name]
+
+
+class _JSONRawValue(object):
+    """
+    A value of a lazy :class:`JSONObject` which was never decoded and is encoded again as it is.
+    """
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+
+class _JSONLazyField(object):
+    """
+    The descriptor of a field of a lazy :class:`JSONObject` which decodes the pending value of the field when it's read
+    for the first time and stores it with the setter of the field.
+    """
+    __slots__ = ("name", "getter", "setter", "revert")
+
+    def __init__(self, name, getter, setter, revert):
+        self.name = name
+        self.getter = getter
+        self.setter = setter
+        self.revert = revert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        pending = _JSONLazyDecoding.get_pending(instance)
+        if pending and self.name in pending:
+            self.decode(instance, pending)
+
+        return _JSONLazyDecoding.read(instance, self.getter)
+
+    def __set__(self, instance, value):
+        pending = _JSONLazyDecoding.get_pending(instance)
+        if pending:
+            pending.pop(self.name, None)
+
+        self.setter(instance, value)
+
+    def decode(self, instance, pending):
+        """
+        Decode the pending value of the field and store it with the setter of the field.
+
+        :param instance: The instance of a lazy JSONObject
+        :param pending: The dict with the pending values of the instance
+        """
+        value = self.revert(instance._json_decoder, pending[self.name])
+        pending.pop(self.name, None)
+        self.setter(instance, value)
+
+    def get_encodable(self, instance):
+        """
+        The getter which is used to encode the field so a pending value is encoded without decoding it first.
+        """
+        pending = _JSONLazyDecoding.get_pending(instance)
+        if pending and self.name in pending:
+            return _JSONRawValue(pending[self.name])
+
+        return _JSONLazyDecoding.read(instance, self.getter)
+
+
+class _JSONLazyDecoding(object):
+    """
+    Creates the lazy subclass of a :class:`JSONObject` class and the function which decodes a `dict` into it. The
+    subclass replaces every decodable field with a :class:`_JSONLazyField` and stores the pending values and the
+    decoder in additional slots so it works for classes with and without a `__dict__`. Any other attribute *e.g.* the
+    private attribute behind a property or a method decodes all pending values before it is read since it may use
+    them.
+    """
+    _AS_IT_IS = "as it is"
+    _UNTYPED = "untyped"
+    _TYPED = "typed"
+
+    @staticmethod
+    def get_pending(instance):
+        """
+        :param instance: The instance of a lazy JSONObject
+
+        :return: The dict with the pending values of the instance by their field name or None while it is created
+        """
+        try:
+            return instance._json_pending
+        except AttributeError:
+            return None
+
+    @staticmethod
+    def read(instance, getter):
+        """
+        Call the getter of a field while the attributes which it reads don't decode the pending values.
+
+        :param instance: The instance of a lazy JSONObject
+        :param getter: The getter of the field
+
+        :return: The value of the field
+        """
+        try:
+            reading = instance._json_reading
+        except AttributeError:
+            return getter(instance)
+
+        instance._json_reading = True
+        try:
+            return getter(instance)
+        finally:
+            instance._json_reading = reading
+
+    @staticmethod
+    def decode_pending(instance):
+        """
+        Decode all pending values of a lazy JSONObject.
+
+        :param instance: The instance of a lazy JSONObject
+        """
+        pending = _JSONLazyDecoding.get_pending(instance)
+        lazy_fields = type(instance)._json_lazy_fields
+        while pending:
+            lazy_fields[next(iter(pending))].decode(instance, pending)
+
+    @classmethod
+    def create_decode_function(cls, json_class, schema):
+        lazy_class = cls._create_lazy_class(json_class, schema)
+        plan = [
+            (json_field.name, json_field.setter, cls._get_kind(json_field)) for json_field in schema.decode_fields
+        ]
+        required_names = schema.required_names
+        match_names = schema.match_names
+        as_it_is, untyped = cls._AS_IT_IS, cls._UNTYPED
+
+        def from_dict(decoder, json_dict):
+            for field_name in required_names:
+                if field_name not in json_dict:
+                    raise ConstraintViolationError(
+                        "The field `{}` is missing in the object `{}`".format(field_name, json_class.__name__)
+                    )
+            if match_names.isdisjoint(json_dict):
+                raise TypeError("No matching fields found to build a JSONObject with the type `{}`".format(json_class))
+
+            # strs are only decoded when they may contain a date
+            eager_types = _NON_STRING_SIMPLE_TYPES if decoder.sniff_dates else _SIMPLE_TYPES
+            result = lazy_class()
+            pending = {}
+            for name, setter, kind in plan:
+                value = json_dict.get(name)
+                if kind is as_it_is or value is None or (kind is untyped and value.__class__ in eager_types):
+                    setter(result, value)
+                else:
+                    pending[name] = value
+
+            result._json_decoder = decoder
+            result._json_reading = False
+            result._json_pending = pending
+
+            return result
+
+        _JSONSchema.of(lazy_class)._lazy_decode_function = from_dict
+
+        return from_dict
+
+    @classmethod
+    def _get_kind(cls, json_field):
+        if json_field.field_type is None:
+            return cls._UNTYPED
+        if json_field.get_reverter() is _JSONFieldTypes._revert_as_it_is:
+            return cls._AS_IT_IS
+
+        return cls._TYPED
+
+    @classmethod
+    def _create_lazy_class(cls, json_class, schema):
+        namespace = {
+            "__slots__": ("_json_decoder", "_json_pending", "_json_reading"),
+            "__module__": json_class.__module__,
+            "__doc__": json_class.__doc__,
+            "__reduce_ex__": cls._reduce_ex,
+            _JSON_UNREGISTERED: True,
+        }
+        fields = []
+        lazy_fields = {}
+        for json_field in schema.fields:
+            getter = json_field.getter
+            if json_field.decodable:
+                revert = JSONDecoder._revert_sanitized_value
+                if json_field.field_type is not None:
+                    revert = json_field.get_reverter()
+
+                lazy_field = lazy_fields[json_field.name] = _JSONLazyField(
+                    json_field.name, json_field.getter, json_field.setter, revert
+                )
+                namespace[json_field.attribute] = lazy_field
+                getter = lazy_field.get_encodable
+
+            fields.append(_JSONField(
+                json_field.name, json_field.member, json_field.required, json_field.mode, json_field.field_type,
+                getter, json_field.setter, json_field.attribute, json_field.module
+            ))
+
+        field_attributes = frozenset(
+            [json_field.attribute for json_field in schema.fields if json_field.name in lazy_fields] +
+            list(namespace["__slots__"])
+        )
+        get_attribute = json_class.__getattribute__
+        decode_pending = cls.decode_pending
+
+        def __getattribute__(instance, name):
+            if name not in field_attributes:
+                pending = _JSONLazyDecoding.get_pending(instance)
+                if pending and not instance._json_reading:
+                    decode_pending(instance)
+
+            return get_attribute(instance, name)
+
+        namespace["__getattribute__"] = __getattribute__
+        namespace["_json_lazy_fields"] = lazy_fields
+        namespace[_JSON_SCHEMA] = _JSONSchema(fields, schema.type_key, schema.type_tag)
+        lazy_class = type(json_class)(str(json_class.__name__), (json_class,), namespace)
+        lazy_class.__qualname__ = getattr(json_class, "__qualname__", json_class.__name__)
+
+        return lazy_class
+
+    @staticmethod
+    def _reduce_ex(json_object, protocol):
+        # a lazy JSONObject is decoded completely and pickled/copied as an instance of its target class
+        _JSONLazyDecoding.decode_pending(json_object)
+
+        decoder = json_object._json_decoder
+        del json_object._json_decoder
+        del json_object._json_pending
+        del json_object._json_reading
+        try:
+            reduced = object.__reduce_ex__(json_object, max(protocol, 2))
+        finally:
+            json_object._json_decoder = decoder
+            json_object._json_reading = False
+            json_object._json_pending = {}
+
+        json_class = type(json_object).__base__
+
+        return (json_class.__new__, (json_class,)) + tuple(reduced[2:])
+
+
+class _JSONProjection(object):
+    """
+    The compiled `only` argument of the decode functions. It contains the selected fields of a JSON object by their
+    name which map to None when the whole value is selected or to the projection of the nested JSON objects when only
+    some of their fields are selected with a dot separated path.
+    """
+
+    def __init__(self, top_level=False):
+        self.fields = {}
+        self.top_level = top_level
+        self._plans = {}
+
+    @classmethod
+    def compile(cls, only):
+        """
+        :param only: An iterable of dot separated paths, a single path, an already compiled projection or None
+
+        :return: The _JSONProjection or None when all fields should be decoded *i.e.* when `only` is None or empty
+        """
+        if only is None or isinstance(only, cls):
+            return only
+        if isinstance(only, _STRING_TYPES):
+            only = [only]
+
+        result = cls(top_level=True)
+        for path in only:
+            projection = result
+            names = path.split(".")
+            for name in names[:-1]:
+                if name in projection.fields and projection.fields[name] is None:
+                    # the whole value of the field is already selected
+                    break
+
+                projection = projection.fields.setdefault(name, cls())
+            else:
+                projection.fields[names[-1]] = None
+
+        return result if result.fields else None
+
+    def get_plan(self, schema):
+        """
+        Get the fields of a :class:`JSONObject` class which are selected by the projection and create them on the first
+        call for the class.
+
+        :param schema: The _JSONSchema of the JSONObject
+
+        :raises ConfigurationError: When a name of the top level of the projection doesn't match any decodable field \
+        of the JSONObject *e.g.* because of a typo
+
+        :return: A tuple with the names of the selected required fields and a list with the name, the setter and the \
+        function with the signature `revert(decoder, value)` of every selected decodable field
+        """
+        plan = self._plans.get(schema)
+        if plan is None:
+            steps = []
+            for json_field in schema.decode_fields:
+                if json_field.name not in self.fields:
+                    continue
+
+                projection = self.fields[json_field.name]
+                if projection is not None:
+                    revert = _JSONFieldTypes.get_projected_reverter(
+                        json_field.field_type, projection, json_field.module
+                    )
+                elif json_field.field_type is None:
+                    revert = JSONDecoder._revert_sanitized_value
+                else:
+                    revert = json_field.get_reverter()
+
+                steps.append((json_field.name, json_field.setter, revert))
+
+            if self.top_level and len(steps) < len(self.fields):
+                unknown_names = sorted(set(self.fields).difference(name for name, _, _ in steps))
+                raise ConfigurationError("The JSONObject doesn't have the decodable fields {} which are selected by "
+                                         "only".format(", ".join("`{}`".format(name) for name in unknown_names)))
+
+            required_names = tuple(name for name in schema.required_names if name in self.fields)
+            plan = self._plans[schema] = (required_names, steps)
+
+        return plan
+
+    def revert_untyped(self, decoder, value):
+        """
+        Decode the value of a field without a declared type. A dict is decoded into the JSONObject which matches it the
+        most or, when there is none, into a dict which only contains the selected keys.
+        """
+        if isinstance(value, list):
+            return [self.revert_untyped(decoder, item) for item in value]
+        if not isinstance(value, dict):
+            return decoder._revert_sanitized_value(value)
+
+        try:
+            return decoder._decode_projected(value, None, self)
+        except MissingObjectError:
+            pass
+
+        result = {}
+        for name, projection in self.fields.items():
+            if name in value:
+                if projection is None:
+                    result[name] = decoder._revert_sanitized_value(value[name])
+                else:
+                    result[name] = projection.revert_untyped(decoder, value[name])
+
+        return result
+
+
+class _JSONFieldTypes(object):
+    """
+    Creates the functions which decode the value of a :func:`field` with a declared type.
+    """
+
+    @classmethod
+    def get_reverter(cls, field_type, module=None):
+        """
+        Create the function which decodes a value of a declared field type.
+
+        :param field_type: The declared type of the field
+        :param module: (optional) The name of the module in which the field is declared and in which the names of \
+        JSONObjects are looked up first
+
+        :raises ConfigurationError: When the declared type is not supported
+
+        :return: A function with the signature `revert(decoder, value)`
+        """
+        field_type = cls._resolve(field_type, module)
+        decode = _codecs.get_decode(field_type)
+        if decode is not None:
+            return cls._get_codec_reverter(decode)
+        if isinstance(field_type, type) and issubclass(field_type, JSONObject):
+            return cls._get_json_object_reverter(field_type)
+        if field_type is list or field_type is dict or field_type in _STRING_TYPES:
+            return cls._revert_as_it_is
+        if field_type is int or field_type is bool:
+            return cls._revert_as_it_is
+        if field_type is float:
+            return cls._revert_float
+        if field_type is datetime.datetime:
+            return cls._revert_datetime
+        if field_type is datetime.date:
+            return cls._revert_date
+
+        origin, args = cls._get_origin_and_args(field_type)
+        if (origin is list or origin is dict) and not args:
+            return cls._revert_as_it_is
+        if origin is list and len(args) == 1:
+            return cls._get_list_reverter(cls.get_reverter(args[0], module))
+        if origin is dict and len(args) == 2:
+            return cls._get_dict_reverter(cls.get_reverter(args[1], module))
+        if origin is getattr(typing, "Union", None) or type(field_type).__name__ == "UnionType":
+            if len(args) == 1:
+                return cls.get_reverter(args[0], module)
+
+        raise ConfigurationError("The field type `{}` is not supported".format(field_type))
+
+    @classmethod
+    def get_projected_reverter(cls, field_type, projection, module=None):
+        """
+        Create the function which decodes a value of a declared field type while only the fields of a projection are
+        decoded for the JSONObjects inside of it *i.e.* the JSONObject itself or the items of a list or dict of them.
+
+        :param field_type: The declared type of the field or None when the field doesn't declare a type
+        :param projection: The compiled `only` argument for the value of the field
+        :param module: (optional) The name of the module in which the field is declared
+
+        :raises ConfigurationError: When the declared type is not supported
+
+        :return: A function with the signature `revert(decoder, value)`
+        """
+        if field_type is None:
+            return projection.revert_untyped
+
+        field_type = cls._resolve(field_type, module)
+        if _codecs.get_decode(field_type) is None:
+            if isinstance(field_type, type) and issubclass(field_type, JSONObject):
+                return cls._get_json_object_reverter(field_type, projection)
+
+            origin, args = cls._get_origin_and_args(field_type)
+            if origin is list and len(args) == 1:
+                return cls._get_list_reverter(cls.get_projected_reverter(args[0], projection, module))
+            if origin is dict and len(args) == 2:
+                return cls._get_dict_reverter(cls.get_projected_reverter(args[1], projection, module))
+            if origin is getattr(typing, "Union", None) or type(field_type).__name__ == "UnionType":
+                if len(args) == 1:
+                    return cls.get_projected_reverter(args[0], projection, module)
+
+        return cls.get_reverter(field_type, module)
+
+    @staticmethod
+    def _resolve(field_type, module):
+        if isinstance(field_type, str) or hasattr(field_type, "__forward_arg__"):
+            return _registry.get_json_object_by_name(getattr(field_type, "__forward_arg__", field_type), module)
+
+        return field_type
+
+    @staticmethod
+    def _get_origin_and_args(field_type):
+        origin = getattr(field_type, "__origin__", None)
+        origin = getattr(origin, "__extra__", origin)
+        args = [arg for arg in getattr(field_type, "__args__", None) or () if arg is not type(None)]
+
+        return origin, args
+
+    @staticmethod
+    def _revert_as_it_is(decoder, value):
+        return value
+
+    @staticmethod
+    def _revert_float(decoder, value):
+        # JSON doesn't distinguish between 1 and 1.0 so an integral float may be encoded without a fraction
+        if isinstance(value, int) and not isinstance(value, bool):
+            return float(value)
+
+        return value
+
+    @staticmethod
+    def _revert_date(decoder, value):
+        if value is None:
+            return None
+        if not isinstance(value, _STRING_TYPES):
+            raise TypeError("A `datetime.date` cannot be decoded from the type `{}`".format(type(value)))
+
+        return decoder._revert_date(value)
+
+    @staticmethod
+    def _revert_datetime(decoder, value):
+        if value is None:
+            return None
+        if not isinstance(value, _STRING_TYPES):
+            raise TypeError("A `datetime.datetime` cannot be decoded from the type `{}`".format(type(value)))
+
+        return decoder._revert_datetime(value)
+
+    @staticmethod
+    def _get_codec_reverter(decode):
+        def revert_with_codec(decoder, value):
+            if value is None:
+                return None
+
+            return decode(value)
+
+        return revert_with_codec
+
+    @staticmethod
+    def _get_json_object_reverter(json_class, projection=None):
+        def revert_json_object(decoder, value):
+            if value is None:
+                return None
+            if not isinstance(value, dict):
+                raise TypeError("A `{}` cannot be decoded from the type `{}`".format(json_class.__name__, type(value)))
+
+            # a tagged document may contain a subclass of the declared JSONObject
+            target = _registry.get_tagged_json_object(value)
+            if target is None or not issubclass(target, json_class):
+                target = json_class
+            if projection is not None:
+                return decoder._decode_projected(value, target, projection)
+
+            return decoder.from_json_dict(value, target)
+
+        return revert_json_object
+
+    @staticmethod
+    def _get_list_reverter(revert_item):
+        def revert_list(decoder, value):
+            if value is None:
+                return None
+
+            return [revert_item(decoder, item) for item in value]
+
+        return revert_list
+
+    @staticmethod
+    def _get_dict_reverter(revert_item):
+        def revert_dict(decoder, value):
+            if value is None:
+                return None
+
+            return {key: revert_item(decoder, value[key]) for key in value}
+
+        return revert_dict
+
+
+class _ISO8601(object):
+    """
+    Parses the ISO 8601 dates and datetimes which the :class:`JSONDecoder` recognizes by building the
+    :class:`datetime.date`/:class:`datetime.datetime` directly. Everything which isn't covered by the fast path *e.g.*
+    the hour 24 or invalid values is passed to :func:`dateutil.parser.isoparse`.
+    """
+    _tzinfos = {}
+
+    @classmethod
+    def parse_date(cls, date_str):
+        """
+        Parse an ISO 8601 date in the extended (`YYYY-MM-DD`) or the basic (`YYYYMMDD`) format.
+
+        :param date_str: The str which contains the date
+
+        :raises ValueError: When the str is not a valid ISO 8601 date
+
+        :return: The datetime.date of the str
+        """
+        match = _FAST_DATE_PATTERN.match(date_str)
+        if match:
+            try:
+                return datetime.date(int(match.group(1)), int(match.group(3)), int(match.group(4)))
+            except ValueError:
+                pass
 
-        raise MissingObjectError("No matching JSONObject could be found")
+        return parser.isoparse(date_str).date()
 
-    @staticmethod
-    def validate_required_fields(json_object, json_dict):
+    @classmethod
+    def parse_datetime(cls, datetime_str):
         """
-        Validate if a `dict` which will be decoded satisfied all required fields of the :class:`JSONObject` into which
-        it will be decoded.
+        Parse an ISO 8601 datetime with a date in the extended or the basic format, a time in the extended
+        (`hh[:mm[:ss[.ffffff]]]`) or the basic (`hh[mm[ss[.ffffff]]]`) format and an optional UTC offset (`Z`, `±hh`,
+        `±hhmm` or `±hh:mm`).
 
-        :param json_object: The instance of the JSONObject into which the dict will be decoded
-        :param json_dict: The dict which should be validated
+        :param datetime_str: The str which contains the datetime
 
-        :raises ConstraintValidationError: When a required field is missing
-        """
-        required_field_names = []
-        properties = _JSONCommon.get_decorated_properties(json_object)
-        for key in properties.keys():
-            if _JSONFieldAttributes.get_required(properties[key].fget):
-                required_field_names.append(key)
+        :raises ValueError: When the str is not a valid ISO 8601 datetime
 
-        for field_name in required_field_names:
-            if field_name not in json_dict.keys():
-                raise ConstraintViolationError(
-                    "The field `{}` is missing in the object `{}`".format(field_name, json_object.__class__.__name__)
+        :return: The datetime.datetime of the str
+        """
+        match = _FAST_DATETIME_PATTERN.match(datetime_str)
+        if match:
+            year, _, month, day, hour, _, minute, second, fraction, offset = match.groups()
+            try:
+                return datetime.datetime(
+                    int(year), int(month), int(day), int(hour), int(minute or 0), int(second or 0),
+                    int(fraction.ljust(6, "0")) if fraction else 0,
+                    cls._get_tzinfo(offset) if offset else None
                 )
+            except ValueError:
+                pass
 
+        return parser.isoparse(datetime_str)
 
-class _JSONCommon(object):
     @classmethod
-    def get_decorated_properties(cls, json_object):
+    def _get_tzinfo(cls, offset):
+        tzinfo = cls._tzinfos.get(offset)
+        if tzinfo is None:
+            if offset == "Z":
+                minutes = 0
+            else:
+                hours, minutes = int(offset[1:3]), int(offset[-2:] if len(offset) > 3 else 0)
+                if hours >= 24 or minutes >= 60:
+                    raise ValueError("The UTC offset `{}` is out of range".format(offset))
+
+                minutes += hours * 60
+                if offset[0] == "-":
+                    minutes = -minutes
+
+            # the same tzinfo types as dateutil's parser so the result doesn't depend on the parser which was used
+            tzinfo = tz.UTC if minutes == 0 else tz.tzoffset(None, minutes * 60)
+
+            cls._tzinfos[offset] = tzinfo
+
+        return tzinfo
+
+
+class _JSONCodecs(object):
+    """
+    Resolves the function which sanitizes a value during the encoding by the type of the value. The function of every
+    type is resolved once by walking the MRO of the type (the codecs which were registered with :func:`register_codec`
+    first and then the built-in types) and cached so the common types need a single dict lookup.
+    """
+
+    def __init__(self):
+        self.encode_handlers = {}
+        self._codecs = {}
+        self._lock = threading.Lock()
+
+    def register(self, value_type, encode, decode=None):
         """
-        Get all properties from a :class:`JSONObject` which are annotated with the :func:`field()` decorator.
+        Register a codec for a type and drop all resolved handlers since the codec may apply to subclasses as well.
 
-        :param json_object: The instance of the JSONObject of which the decorated properties should be extracted
+        :param value_type: The type for which the codec should be used
+        :param encode: A function which converts a value of the type into a JSON encodable value
+        :param decode: (optional) A function which converts a JSON value back into the type
 
-        :return: A `dict` containing all properties which are decorated with the field() decorator with the pattern \
-        {"fieldName": <property getter function>}
+        :raises ConfigurationError: When the type is one of the types which are written as they are
         """
-        result = {}
+        # the encoders write the simple types directly without looking up their handler
+        if value_type in _SIMPLE_TYPES:
+            raise ConfigurationError("No codec can be registered for the type `{}`".format(value_type.__name__))
 
-        for member in inspect.getmembers(type(json_object)):
-            if isinstance(member[1], property):
-                if hasattr(member[1].fget, "__wrapped__"):
-                    member[1].fget(json_object)
-                    wrapper = member[1].fget.__wrapped__
+        with self._lock:
+            self._codecs[value_type] = (encode, decode)
+            self.encode_handlers = {}
 
-                    if _JSONFieldAttributes.get_field_name(wrapper):
-                        result[_JSONFieldAttributes.get_field_name(wrapper)] = member[1]
+    def unregister(self, value_type):
+        """
+        Remove the codec of a type.
 
-        return result
+        :param value_type: The type whose codec should be removed
+        """
+        with self._lock:
+            self._codecs.pop(value_type, None)
+            self.encode_handlers = {}
 
-    @classmethod
-    def value_is_simple_type(cls, value):
+    def resolve_encode_handler(self, value_type):
         """
-        Check if a value is a 'simple' type *i.e.* a type which does **NOT** require further work to be encoded/decoded.
+        Resolve and cache the function which sanitizes values of a type.
 
-        :param value: The value which should be checked
+        :param value_type: The type of the value which should be sanitized
 
-        :return: True if the type of the value is simple; False otherwise
+        :return: A function with the signature `sanitize(encoder, value)`
         """
-        result = (
-                isinstance(value, str) or
-                isinstance(value, int) or
-                isinstance(value, float) or
-                isinstance(value, bool)
-        )
+        encode_handlers = self.encode_handlers
+        mro = getattr(value_type, "__mro__", (value_type,))
+        handler = None
+        for klass in mro:
+            if klass in self._codecs:
+                handler = self._get_codec_handler(self._codecs[klass][0])
+                break
+
+        if handler is None:
+            builtin_handlers = self._get_builtin_handlers()
+            for klass in mro:
+                if klass in builtin_handlers:
+                    handler = builtin_handlers[klass]
+                    break
+
+        if handler is None:
+            if issubclass(value_type, Iterable):
+                handler = JSONEncoder._sanitize_iterable
+            else:
+                handler = JSONEncoder._sanitize_unknown_value
 
-        if not result and sys.version_info.major == _PY2:
-            result = isinstance(value, unicode)
+        encode_handlers[value_type] = handler
 
-        return result
+        return handler
 
-    @classmethod
-    def value_not_str_and_iterable(cls, value):
+    def get_decode(self, value_type):
         """
-        Check if the type of a value is **NOT** `str`/`unicode` and if the value **IS** iterable.
+        Get the function which converts a JSON value back into a type which has a registered codec.
 
-        :param value: The value which should be checked
+        :param value_type: The declared type of the value
 
-        :return: True if the value is iterable and NOT an str/unicode; False otherwise
+        :return: A function with the signature `decode(value)` or None when no codec is registered for the type
         """
-        if sys.version_info.major == _PY2:
-            if isinstance(value, unicode):
-                return False
+        for klass in getattr(value_type, "__mro__", ()):
+            if klass in self._codecs:
+                return self._codecs[klass][1] or value_type
 
-        if isinstance(value, str):
-            return False
+        return None
+
+    @staticmethod
+    def _get_codec_handler(encode):
+        def sanitize_with_codec(encoder, value):
+            return encoder._get_sanitized_value(encode(value))
+
+        return sanitize_with_codec
+
+    @staticmethod
+    def _get_builtin_handlers():
+        handlers = {
+            dict: JSONEncoder._sanitize_dict,
+            list: JSONEncoder._sanitize_iterable,
+            tuple: JSONEncoder._sanitize_iterable,
+            set: JSONEncoder._sanitize_iterable,
+            frozenset: JSONEncoder._sanitize_iterable,
+            JSONObject: JSONEncoder._sanitize_json_object,
+            datetime.datetime: JSONEncoder._sanitize_datetime,
+            datetime.date: JSONEncoder._sanitize_date,
+            _JSONRawValue: JSONEncoder._sanitize_raw_value
+        }
+        for simple_type in _SIMPLE_TYPES:
+            handlers[simple_type] = JSONEncoder._sanitize_simple_value
+
+        return handlers
+
+
+class _JSONBackend(object):
+    """
+    A JSON library which turns JSON conform python values into JSON documents and back.
+    """
+
+    def __init__(self, name, dumps, loads, dumpb=None, loadb=None):
+        """
+        :param name: The name of the library
+        :param dumps: A function which encodes a JSON conform value into an `str`
+        :param loads: A function which decodes an `str` or UTF-8 encoded `bytes` into a JSON conform value
+        :param dumpb: (optional) A function which encodes a JSON conform value into UTF-8 encoded `bytes`. By default \
+        the str of `dumps` is encoded
+        :param loadb: (optional) A function which decodes UTF-8 encoded `bytes`, a `bytearray` or a `memoryview` into \
+        a JSON conform value. By default they are decoded into an str for `loads`
+        """
+        self.name = name
+        self.dumps = dumps
+        self.loads = loads
+        self.dumpb = dumpb or (lambda value: dumps(value).encode("utf-8"))
+        self.loadb = loadb or (lambda data: loads(codecs.utf_8_decode(data, "strict", True)[0]))
+
+
+class _JSONBackends(object):
+    """
+    Loads the supported JSON libraries lazily and remembers the backend which is used when an encoder or decoder
+    doesn't select one.
+    """
+    NAMES = ("orjson", "ujson", "json")
+    """
+    The names of the supported JSON libraries ordered from the fastest to the slowest one.
+    """
+
+    def __init__(self):
+        self.default = "json"
+        self._backends = {}
+
+    def get(self, name=None):
+        """
+        :param name: (optional) The name of the backend or "auto" for the fastest installed one. When this is empty \
+        then the default backend is returned
+
+        :raises ConfigurationError: When the backend is unknown or its library isn't installed
+
+        :return: The _JSONBackend
+        """
+        name = name or self.default
+        backend = self._backends.get(name)
+        if backend is None:
+            backend = self._backends[name] = self._load(name)
+
+        return backend
+
+    def set_default(self, name):
+        """
+        :param name: The name of the backend which is used when an encoder or decoder doesn't select one
 
-        return isinstance(value, collections.Iterable)
+        :raises ConfigurationError: When the backend is unknown or its library isn't installed
+        """
+        self.get(name)
+        self.default = name
+
+    def _load(self, name):
+        if name == "auto":
+            for backend_name in self.NAMES:
+                try:
+                    return self.get(backend_name)
+                except ConfigurationError:
+                    continue
+        if name == "json":
+            return _JSONBackend(name, json.dumps, json.loads)
+        if name not in self.NAMES:
+            raise ConfigurationError("Unknown JSON backend `{}`. Choose one of {}".format(name, ", ".join(self.NAMES)))
+
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            raise ConfigurationError("The library of the JSON backend `{}` isn't installed".format(name))
+
+        if name == "orjson":
+            dumpb = functools.partial(module.dumps, option=module.OPT_NON_STR_KEYS)
+
+            # orjson only accepts the buffers of bytes, bytearrays and memoryviews e.g. not of an mmap
+            def loadb(data):
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    return module.loads(data)
+
+                # the view is released even when the traceback of an error keeps this frame alive so the buffer
+                # e.g. an mmap can be closed
+                with memoryview(data) as view:
+                    return module.loads(view)
+
+            return _JSONBackend(name, lambda value: dumpb(value).decode("utf-8"), module.loads, dumpb, loadb)
+
+        return _JSONBackend(name, lambda value: module.dumps(value, escape_forward_slashes=False), module.loads)
 
 
 class _JSONFieldAttributes(object):
@@ -516,6 +2968,30 @@ class _JSONFieldAttributes(object):
         """
         return cls._get_field_attribute(func, _JSON_FIELD_MODE)
 
+    @classmethod
+    def get_type(cls, func):
+        """
+        Get the value of the _JSON_FIELD_TYPE attribute of a method which is annotated with the :class:`property` and
+        the :func:`field` decorator.
+
+        :param func: The method which is annotated with the property and the field decorator
+
+        :return: The declared type of the field/property or None when no type was declared
+        """
+        return cls._get_field_attribute(func, _JSON_FIELD_TYPE)
+
+    @classmethod
+    def get_module(cls, func):
+        """
+        Get the value of the _JSON_FIELD_MODULE attribute of a method which is annotated with the :class:`property` and
+        the :func:`field` decorator.
+
+        :param func: The method which is annotated with the property and the field decorator
+
+        :return: The name of the module in which the field/property is declared
+        """
+        return cls._get_field_attribute(func, _JSON_FIELD_MODULE)
+
     @classmethod
     def _get_field_attribute(cls, func, attr_name):
         if hasattr(func, attr_name):
@@ -527,18 +3003,230 @@ class _JSONFieldAttributes(object):
         return None
 
 
+class _JSONWorker(object):
+    """
+    The entry points of the processes which encode and decode JSON documents for :func:`JSONEncoder.to_json_strs`,
+    :func:`JSONEncoder.to_json_lines` and :func:`JSONDecoder.iter_json_strs`.
+    """
+    SAMPLE_SIZE = 32
+    CHUNK_PAYLOAD_SIZE = 256 * 1024
+    MAX_CHUNK_SIZE = 4096
+
+    encoder = None
+    decoder = None
+
+    @classmethod
+    def initialize(cls, module_names, decoder_options, encoder_options):
+        """
+        Import the modules which define the :class:`JSONObject` classes so they are registered for the automatic
+        target detection and create the encoder/decoder of the worker.
+
+        :param module_names: The names of the modules which should be imported
+        :param decoder_options: The keyword arguments for the :class:`JSONDecoder` of the worker or None
+        :param encoder_options: The keyword arguments for the :class:`JSONEncoder` of the worker or None
+        """
+        for module_name in module_names:
+            if module_name != "__main__":
+                importlib.import_module(module_name)
+
+        if decoder_options is not None:
+            cls.decoder = JSONDecoder(**decoder_options)
+        if encoder_options is not None:
+            cls.encoder = JSONEncoder(**encoder_options)
+
+    @classmethod
+    def decode(cls, json_strs, target, only=None):
+        """
+        :return: A list with a JSONObject for every str in the same order as the passed strs
+        """
+        return cls.decoder.from_json_strs(json_strs, target, only=only)
+
+    @classmethod
+    def encode(cls, json_objects, separator):
+        """
+        :return: A list with a str for every JSONObject in the same order as the passed JSONObjects or a single str \
+        in which they are joined with the separator when it isn't None
+        """
+        json_strs = cls.encoder.to_json_strs(json_objects)
+        if separator is None:
+            return json_strs
+
+        return separator.join(json_strs)
+
+    @classmethod
+    def get_chunk_size(cls, sample):
+        """
+        Get the number of objects which should be sent to a worker at once. Every chunk is pickled to send it to a
+        worker so the size of the pickled sample is measured and the chunks are sized to carry about
+        `CHUNK_PAYLOAD_SIZE` bytes which makes the fixed cost of a task small compared to the work it contains.
+
+        :param sample: A non-empty list of the first objects
+
+        :return: The number of objects per chunk
+        """
+        object_size = max(1, len(pickle.dumps(sample, pickle.HIGHEST_PROTOCOL)) // len(sample))
+
+        return max(1, min(cls.MAX_CHUNK_SIZE, cls.CHUNK_PAYLOAD_SIZE // object_size))
+
+    @staticmethod
+    def map(workers, initargs, function, chunks, *args):
+        """
+        Call a function for every chunk in a :class:`concurrent.futures.ProcessPoolExecutor`. Only two chunks per
+        worker are submitted at the same time so the chunks are consumed lazily.
+
+        :param workers: The number of processes
+        :param initargs: The arguments for :func:`initialize` which is called once in every process
+        :param function: The function which is called with every chunk and the additional arguments
+        :param chunks: An iterable of the chunks
+
+        :raises ConfigurationError: When the Python version is older than 3.7 which added the initializer of the \
+        ProcessPoolExecutor
+
+        :return: A generator which yields the results in the same order as the chunks
+        """
+        if sys.version_info < (3, 7):
+            raise ConfigurationError("Spreading the work across worker processes requires Python 3.7 or newer")
+
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(workers, initializer=_JSONWorker.initialize, initargs=initargs) as executor:
+            pending = collections.deque()
+            for chunk in chunks:
+                pending.append(executor.submit(function, chunk, *args))
+                if len(pending) > 2 * workers:
+                    yield pending.popleft().result()
+
+            while pending:
+                yield pending.popleft().result()
+
+
+_registry = _JSONObjectRegistry()
+_codecs = _JSONCodecs()
+_backends = _JSONBackends()
 _encoder = JSONEncoder()
 _decoder = JSONDecoder()
 
 
-def dump(json_object, json_file):
+def register_codec(value_type, encode, decode=None):
+    """
+    Register a codec which makes a type encodable *e.g.* :class:`decimal.Decimal`, :class:`uuid.UUID` or
+    :class:`enum.Enum`. The codec is used for the type and all of its subclasses when a value is encoded and for the
+    fields which declare the type (or a subclass of it) as their **field_type** when a JSON document is decoded.
+
+    .. code-block:: python
+
+        register_codec(decimal.Decimal, str)
+        register_codec(enum.Enum, lambda member: member.value)
+
+    :param value_type: The type for which the codec should be used
+    :param encode: A function which converts a value of the type into a JSON encodable value
+    :param decode: (optional) A function which converts a JSON value back into the type. By default the declared \
+    field type itself is called with the JSON value *e.g.* `Decimal("1.5")` or `Color("red")`.
+
+    :raises ConfigurationError: When the type is `str`, `int`, `float`, `bool` or `NoneType` since their values are \
+    always written as they are. Their subclasses can have a codec.
+    """
+    _codecs.register(value_type, encode, decode)
+
+
+def unregister_codec(value_type):
+    """
+    Remove a codec which was registered with :func:`register_codec`.
+
+    :param value_type: The type whose codec should be removed
+    """
+    _codecs.unregister(value_type)
+
+
+def set_backend(name):
+    """
+    Select the JSON library which turns the encoded `dict` s into JSON documents and parses the JSON documents for all
+    :class:`JSONEncoder` s and :class:`JSONDecoder` s which don't select a backend themselves *i.e.* also for the
+    shortcut functions like :func:`dumps`, :func:`loads` etc. Only JSON conform values reach the backend so dates and
+    datetimes are encoded the same way by every backend.
+
+    - "json": the `json` module of the standard library (default)
+    - "orjson": `orjson <https://pypi.org/project/orjson/>`_ which writes the JSON documents without whitespace
+    - "ujson": `ujson <https://pypi.org/project/ujson/>`_
+    - "auto": the fastest of them which is installed
+
+    The incremental functions like :func:`iter_load` and the streaming mode of :func:`dump` always use the `json`
+    module.
+
+    :param name: The name of the backend
+
+    :raises ConfigurationError: When the backend is unknown or its library isn't installed
+    """
+    _backends.set_default(name)
+
+
+def enable_codegen(enabled=True):
+    """
+    Turn the generation of specialized encode and decode functions for the shortcut functions like :func:`dumpd`,
+    :func:`loadd` etc. on or off.
+
+    .. seealso::
+        For more information you can look at the `codegen` parameter of :class:`JSONEncoder` and :class:`JSONDecoder`.
+
+    :param enabled: (optional) True to generate the functions; False to interpret the fields of every object (True by \
+    default)
+    """
+    _encoder.codegen = enabled
+    _decoder.codegen = enabled
+
+
+def enable_lazy_decoding(enabled=True):
+    """
+    Turn the lazy decoding of the shortcut functions like :func:`loadd`, :func:`loads` etc. on or off.
+
+    .. seealso::
+        For more information you can look at the `lazy` parameter of :class:`JSONDecoder`.
+
+    :param enabled: (optional) True to decode the nested values when their field is read for the first time; False to \
+    decode every value immediately (True by default)
+    """
+    _decoder.lazy = enabled
+
+
+def autodetect_cache_info():
+    """
+    Get the statistics of the cache which is used by the shortcut functions like :func:`loadd` to remember the result of
+    the automatic target detection.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.autodetect_cache_info`.
+    """
+    return _decoder.autodetect_cache_info()
+
+
+def dump(json_object, json_file, stream=False):
     """
     Shortcut for instantiating a new :class:`JSONEncoder` and calling the :func:`to_json_file` function.
 
     .. seealso::
         For more information you can look at the doc of :func:`JSONEncoder.to_json_file`.
     """
-    _encoder.to_json_file(json_object, json_file)
+    _encoder.to_json_file(json_object, json_file, stream)
+
+
+def dump_lines(json_objects, json_file, workers=None):
+    """
+    Shortcut for instantiating a new :class:`JSONEncoder` and calling the :func:`to_json_lines` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONEncoder.to_json_lines`.
+    """
+    _encoder.to_json_lines(json_objects, json_file, workers)
+
+
+def dumpb(json_object):
+    """
+    Shortcut for instantiating a new :class:`JSONEncoder` and calling the :func:`to_json_bytes` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONEncoder.to_json_bytes`.
+    """
+    return _encoder.to_json_bytes(json_object)
 
 
 def dumps(json_object):
@@ -561,31 +3249,170 @@ def dumpd(json_object):
     return _encoder.to_json_dict(json_object)
 
 
-def load(json_file, target=None):
+def dumpd_many(json_objects):
+    """
+    Shortcut for instantiating a new :class:`JSONEncoder` and calling the :func:`to_json_dicts` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONEncoder.to_json_dicts`.
+    """
+    return _encoder.to_json_dicts(json_objects)
+
+
+def dumps_many(json_objects, as_array=False, workers=None):
+    """
+    Shortcut for instantiating a new :class:`JSONEncoder` and calling the :func:`to_json_strs` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONEncoder.to_json_strs`.
+    """
+    return _encoder.to_json_strs(json_objects, as_array, workers)
+
+
+def load(json_file, target=None, only=None):
     """
     Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_file` function.
 
     .. seealso::
         For more information you can look at the doc of :func:`JSONDecoder.from_json_file`.
     """
-    return _decoder.from_json_file(json_file, target)
+    return _decoder.from_json_file(json_file, target, only)
+
+
+def iter_load(json_file, target=None, array_path=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`iter_json_file` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.iter_json_file`.
+    """
+    return _decoder.iter_json_file(json_file, target, array_path, only)
+
+
+def iter_load_lines(json_file, target=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`iter_json_lines` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.iter_json_lines`.
+    """
+    return _decoder.iter_json_lines(json_file, target, only)
+
+
+def load_lines(json_file, target=None, only=None):
+    """
+    Decode all JSON Lines of a file-like object into a `list` of :class:`JSONObject` s.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.iter_json_lines`.
+    """
+    return list(_decoder.iter_json_lines(json_file, target, only))
+
+
+def loadb(json_bytes, target=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_bytes` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.from_json_bytes`.
+    """
+    return _decoder.from_json_bytes(json_bytes, target, only)
+
+
+def load_path(path, target=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_path` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.from_json_path`.
+    """
+    return _decoder.from_json_path(path, target, only)
+
+
+def iter_load_path(path, target=None, array_path=None, lines=False, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`iter_json_path` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.iter_json_path`.
+    """
+    return _decoder.iter_json_path(path, target, array_path, lines, only)
 
 
-def loads(json_str, target=None):
+def loads(json_str, target=None, only=None):
     """
     Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_str` function.
 
     .. seealso::
         For more information you can look at the doc of :func:`JSONDecoder.from_json_str`.
     """
-    return _decoder.from_json_str(json_str, target)
+    return _decoder.from_json_str(json_str, target, only)
 
 
-def loadd(json_dict, target=None):
+def loadd(json_dict, target=None, only=None):
     """
     Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_dict` function.
 
     .. seealso::
         For more information you can look at the doc of :func:`JSONDecoder.from_json_dict`.
     """
-    return _decoder.from_json_dict(json_dict, target)
+    return _decoder.from_json_dict(json_dict, target, only)
+
+
+def loadd_many(json_dicts, target=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_dicts` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.from_json_dicts`.
+    """
+    return _decoder.from_json_dicts(json_dicts, target, only)
+
+
+def iter_loads_many(json_strs, target=None, workers=None, chunk_size=512, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`iter_json_strs` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.iter_json_strs`.
+    """
+    return _decoder.iter_json_strs(json_strs, target, workers, chunk_size, only)
+
+
+def loads_many(json_strs, target=None, workers=None, only=None):
+    """
+    Shortcut for instantiating a new :class:`JSONDecoder` and calling the :func:`from_json_strs` function.
+
+    .. seealso::
+        For more information you can look at the doc of :func:`JSONDecoder.from_json_strs`.
+    """
+    return _decoder.from_json_strs(json_strs, target, workers, only)
+
+
+def _get_asyncio_functions():
+    # the repository itself can be imported as a package next to the top-level module of the distribution
+    if __package__:
+        return importlib.import_module(".jsontransform_asyncio", __package__)
+
+    return importlib.import_module("jsontransform_asyncio")
+
+
+if sys.version_info >= (3, 5):
+    # asyncio is only imported when one of the functions is called the first time
+    def async_load(reader, target=None, decoder=None, offload_size=None, executor=None, only=None):
+        """
+        Read a JSON document from an asyncio stream and decode it into a :class:`JSONObject` (Python 3.5+).
+
+        .. seealso::
+            For more information you can look at the doc of :func:`jsontransform_asyncio.async_load`.
+        """
+        return _get_asyncio_functions().async_load(reader, target, decoder, offload_size, executor, only)
+
+    def async_dump(json_object, writer, encoder=None, encoding="utf-8"):
+        """
+        Encode a :class:`JSONObject` and write it to an asyncio stream in chunks (Python 3.5+).
+
+        .. seealso::
+            For more information you can look at the doc of :func:`jsontransform_asyncio.async_dump`.
+        """
+        return _get_asyncio_functions().async_dump(json_object, writer, encoder, encoding)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+"""
+The asyncio functions of json-transform. They are defined in their own module because the `async` syntax is only
+available since Python 3.5. :mod:`jsontransform` wraps them on these versions with functions which import this
+module on their first call so :mod:`asyncio` is only imported when it's used.
+"""
+
+import asyncio
+import importlib
+import inspect
+
+__author__ = "Peter Morawski"
+
+
+async def async_load(reader, target=None, decoder=None, offload_size=None, executor=None, only=None):
+    """
+    Read a JSON document from an :class:`asyncio.StreamReader` or any object with an awaitable `read()` *e.g.* a file of
+    `aiofiles` until its end and decode it into a :class:`JSONObject`.
+
+    :param reader: The object with an awaitable read() which returns either `str` or UTF-8 encoded `bytes`
+    :param target: (optional) The type of the target JSONObject into which the document should be decoded. When this \
+    is empty then the target JSONObject will be searched automatically
+    :param decoder: (optional) The :class:`JSONDecoder` which decodes the document. By default the decoder of the \
+    shortcut functions like :func:`loads` is used
+    :param offload_size: (optional) The minimum length of a document which is decoded with `executor` instead of \
+    blocking the event loop while it is decoded. When this is empty then every document is decoded in the event loop
+    :param executor: (optional) The :class:`concurrent.futures.Executor` which decodes the big documents. When this is \
+    empty then the default executor of the event loop is used. The decoder is NOT picklable so it must be an executor \
+    which runs in the same process *e.g.* a :class:`concurrent.futures.ThreadPoolExecutor`
+    :param only: (optional) The names of the fields which should be decoded. For more information you can look at the \
+    doc of :func:`JSONDecoder.from_json_dict`.
+
+    .. seealso::
+        For more information about the raised errors you can look at the doc of :func:`JSONDecoder.from_json_str`.
+
+    :return: A JSONObject which matched the signature of the JSON document and with the values of it
+    """
+    decoder = decoder or _get_jsontransform()._decoder
+    data = await reader.read()
+    decode = decoder.from_json_str if isinstance(data, str) else decoder.from_json_bytes
+    if offload_size is None or len(data) < offload_size:
+        return decode(data, target, only)
+
+    loop = asyncio.get_event_loop()
+    return await loop.run_in_executor(executor, decode, data, target, only)
+
+
+async def async_dump(json_object, writer, encoder=None, encoding="utf-8"):
+    """
+    Encode an instance of a :class:`JSONObject` and write it in chunks into an :class:`asyncio.StreamWriter` or any
+    object with a `write()` which returns None or an awaitable. After every chunk the `drain()` of the writer is awaited
+    when it has one so the writer can apply backpressure and the event loop isn't blocked by a big JSONObject.
+
+    :param json_object: The instance of the JSONObject which should be encoded
+    :param writer: The object with a write() and an optional awaitable drain()
+    :param encoder: (optional) The :class:`JSONEncoder` which encodes the JSONObject. By default the encoder of the \
+    shortcut functions like :func:`dumps` is used
+    :param encoding: (optional) The encoding of the `bytes` which are written. When this is empty then `str` s are \
+    written. ("utf-8" by default)
+
+    :raises ConfigurationError: When the JSONObject of which an instance was passed does NOT define any JSON fields
+    :raises TypeError: When the type of a field in the JSONObject is not encodable
+    """
+    encoder = encoder or _get_jsontransform()._encoder
+    drain = getattr(writer, "drain", None)
+    chunk = []
+    chunk_size = 0
+    for piece in encoder.iterencode(json_object):
+        chunk.append(piece)
+        chunk_size += len(piece)
+
+        if chunk_size >= encoder.STREAM_CHUNK_SIZE:
+            await _write(writer, drain, "".join(chunk), encoding)
+            chunk = []
+            chunk_size = 0
+
+    if chunk:
+        await _write(writer, drain, "".join(chunk), encoding)
+
+
+def _get_jsontransform():
+    if __package__:
+        return importlib.import_module(".jsontransform", __package__)
+
+    return importlib.import_module("jsontransform")
+
+
+async def _write(writer, drain, data, encoding):
+    result = writer.write(data.encode(encoding) if encoding else data)
+    if inspect.isawaitable(result):
+        await result
+
+    if drain is not None:
+        await drain()
+    else:
+        await asyncio.sleep(0)
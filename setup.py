@@ -13,9 +13,9 @@ setuptools.setup(
     long_description=long_description,
     long_description_content_type="text/markdown",
     url="https://github.com/Peter-Morawski/json-transform",
-    install_requires=["decorator>=4.3.0", "python-dateutil>=2.7.0"],
+    install_requires=["python-dateutil>=2.7.0"],
     test_suite="test_suite",
-    py_modules=["jsontransform"],
+    py_modules=["jsontransform", "jsontransform_asyncio"],
     license="MIT License",
     classifiers=(
         "Development Status :: 5 - Production/Stable",
@@ -1,10 +1,24 @@
 # -*- coding: utf-8 -*-
 
+import sys
 import unittest
 
-from tests.deserialization import DictDeserialization, DictDeserializationISO8601Compliance, \
-    DictDeserializationWithFieldMode, DictDeserializationWithRequiredField
-from tests.serialization import DictSerialization, DictSerializationWithFieldMode, DictSerializationWithTimes
+from tests.backends import BinaryEncoding, JSONBackends
+from tests.deserialization import BatchDeserialization, DictDeserialization, DictDeserializationAutodetectCache, \
+    DictDeserializationISO8601Compliance, DictDeserializationWithCodec, DictDeserializationWithCodegen, \
+    DictDeserializationWithDateCache, DictDeserializationWithFieldMode, DictDeserializationWithFieldModeAndCodegen, \
+    DictDeserializationWithFieldType, DictDeserializationWithLazyDecoding, DictDeserializationWithRequiredField, \
+    DictDeserializationWithRequiredFieldAndCodegen, DictDeserializationWithScalarFieldType, \
+    DictDeserializationWithTypeTag, ISO8601Parser, JSONLinesDeserialization, LazyDeserialization, \
+    MappedFileDeserialization, ParallelDeserialization, ProjectedDeserialization, StreamDeserialization
+from tests.schema import JSONObjectRegistryIndex, JSONSchemaCache, SlotFields
+from tests.serialization import BatchSerialization, DictSerialization, DictSerializationWithCodec, \
+    DictSerializationWithCodegen, DictSerializationWithFieldMode, DictSerializationWithFieldModeAndCodegen, \
+    DictSerializationWithTimes, DictSerializationWithTypeTag, JSONLinesSerialization, ParallelSerialization, \
+    StreamSerialization
+
+if sys.version_info >= (3, 5):
+    from tests.asyncstreams import AsyncStreams
 
 
 def create_test_suite():
@@ -16,6 +30,40 @@ def create_test_suite():
     suite.addTest(unittest.makeSuite(DictDeserializationISO8601Compliance))
     suite.addTests(unittest.makeSuite(DictDeserializationWithFieldMode))
     suite.addTests(unittest.makeSuite(DictSerializationWithFieldMode))
+    suite.addTest(unittest.makeSuite(DictSerializationWithCodegen))
+    suite.addTests(unittest.makeSuite(DictDeserializationWithCodegen))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithRequiredFieldAndCodegen))
+    suite.addTests(unittest.makeSuite(DictDeserializationWithFieldModeAndCodegen))
+    suite.addTest(unittest.makeSuite(DictSerializationWithFieldModeAndCodegen))
+    suite.addTest(unittest.makeSuite(DictDeserializationAutodetectCache))
+    suite.addTest(unittest.makeSuite(DictSerializationWithTypeTag))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithTypeTag))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithFieldType))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithScalarFieldType))
+    suite.addTest(unittest.makeSuite(ISO8601Parser))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithDateCache))
+    suite.addTest(unittest.makeSuite(DictSerializationWithCodec))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithCodec))
+    suite.addTest(unittest.makeSuite(StreamSerialization))
+    suite.addTest(unittest.makeSuite(StreamDeserialization))
+    suite.addTest(unittest.makeSuite(JSONLinesSerialization))
+    suite.addTest(unittest.makeSuite(JSONLinesDeserialization))
+    suite.addTest(unittest.makeSuite(BatchSerialization))
+    suite.addTest(unittest.makeSuite(BatchDeserialization))
+    suite.addTest(unittest.makeSuite(ParallelDeserialization))
+    suite.addTest(unittest.makeSuite(ParallelSerialization))
+    suite.addTest(unittest.makeSuite(JSONBackends))
+    suite.addTest(unittest.makeSuite(BinaryEncoding))
+    suite.addTest(unittest.makeSuite(MappedFileDeserialization))
+    suite.addTest(unittest.makeSuite(JSONSchemaCache))
+    suite.addTest(unittest.makeSuite(JSONObjectRegistryIndex))
+    suite.addTest(unittest.makeSuite(SlotFields))
+    suite.addTest(unittest.makeSuite(DictDeserializationWithLazyDecoding))
+    suite.addTest(unittest.makeSuite(LazyDeserialization))
+    suite.addTest(unittest.makeSuite(ProjectedDeserialization))
+
+    if sys.version_info >= (3, 5):
+        suite.addTest(unittest.makeSuite(AsyncStreams))
 
     return suite
 
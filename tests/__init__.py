@@ -1,5 +1,12 @@
 # -*- coding: utf-8 -*-
 
+import sys
+
+from . import backends
 from . import deserialization
+from . import schema
 from . import serialization
 from . import datastructure
+
+if sys.version_info >= (3, 5):
+    from . import asyncstreams
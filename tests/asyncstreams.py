@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+
+import asyncio
+import concurrent.futures
+import os
+import re
+import subprocess
+import sys
+import unittest
+
+from jsontransform import ConfigurationError, JSONDecoder, JSONEncoder, async_dump, async_load, dumps
+from .datastructure import Container, Dog, JSONObjectWithoutFields
+
+
+class _BufferWriter(object):
+    def __init__(self):
+        self.chunks = []
+        self.drains = 0
+
+    def write(self, data):
+        self.chunks.append(data)
+
+    async def drain(self):
+        self.drains += 1
+
+
+class _AsyncFile(object):
+    def __init__(self, data=""):
+        self.data = data
+
+    async def read(self):
+        return self.data
+
+    async def write(self, data):
+        self.data += data
+
+
+class AsyncStreams(unittest.TestCase):
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self._loop.close()
+
+    def _run(self, coroutine):
+        return self._loop.run_until_complete(coroutine)
+
+    def _load_from_stream_reader(self, data, **kwargs):
+        async def load():
+            reader = asyncio.StreamReader()
+            reader.feed_data(data)
+            reader.feed_eof()
+
+            return await async_load(reader, **kwargs)
+
+        return self._run(load())
+
+    def test_load_from_stream_reader(self):
+        actual = self._load_from_stream_reader(b'{"container": "2018-01-01"}')
+
+        self.assertIs(Container, type(actual))
+        self.assertEqual("2018-01-01", actual.container.isoformat())
+
+    def test_load_with_target_and_decoder(self):
+        actual = self._load_from_stream_reader(
+            b'{"container": "2018-01-01"}', target=Container, decoder=JSONDecoder(sniff_dates=False)
+        )
+
+        self.assertEqual("2018-01-01", actual.container)
+
+    def test_load_big_document_in_executor(self):
+        with concurrent.futures.ThreadPoolExecutor(1) as executor:
+            actual = self._load_from_stream_reader(b'{"container": [1, 2, 3]}', offload_size=10, executor=executor)
+
+        self.assertEqual([1, 2, 3], actual.container)
+
+    def test_load_from_async_file(self):
+        actual = self._run(async_load(_AsyncFile('{"@type": "dog", "petName": "Rex", "breed": "Pug"}')))
+
+        self.assertIs(Dog, type(actual))
+
+    def test_dump_awaits_drain_after_every_chunk(self):
+        container = Container()
+        container.container = list(range(1000))
+        encoder = JSONEncoder()
+        encoder.STREAM_CHUNK_SIZE = 100
+        writer = _BufferWriter()
+        self._run(async_dump(container, writer, encoder))
+
+        self.assertGreater(len(writer.chunks), 1)
+        self.assertEqual(len(writer.chunks), writer.drains)
+        self.assertEqual(dumps(container).encode("utf-8"), b"".join(writer.chunks))
+
+    def test_dump_into_async_file(self):
+        async_file = _AsyncFile()
+        self._run(async_dump(Dog(), async_file, encoding=None))
+
+        self.assertEqual(dumps(Dog()), async_file.data)
+
+    def test_round_trip_through_stream(self):
+        async def round_trip():
+            reader = asyncio.StreamReader()
+            container = Container()
+            container.container = {"key": u"über"}
+
+            class Writer(object):
+                @staticmethod
+                def write(data):
+                    reader.feed_data(data)
+
+            await async_dump(container, Writer())
+            reader.feed_eof()
+
+            return await async_load(reader)
+
+        self.assertEqual({"key": u"über"}, self._run(round_trip()).container)
+
+    def test_dump_object_without_fields(self):
+        with self.assertRaises(ConfigurationError):
+            self._run(async_dump(JSONObjectWithoutFields(), _BufferWriter()))
+
+    def test_import_as_package(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        package = os.path.basename(root)
+        if not re.match(r"^[A-Za-z_][A-Za-z0-9_]*$", package):
+            self.skipTest("the directory of the repository isn't a valid package name")
+
+        code = (
+            "import {0}; functions = {0}.jsontransform._get_asyncio_functions(); "
+            "print(functions is {0}.jsontransform_asyncio and functions._get_jsontransform() is {0}.jsontransform)"
+        ).format(package)
+        env = dict(os.environ, PYTHONPATH=os.path.dirname(root))
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=os.path.dirname(root), env=env)
+
+        self.assertEqual(b"True", output.strip())
+
+    def test_asyncio_is_imported_on_the_first_call(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        code = "import sys, jsontransform; print('asyncio' in sys.modules)"
+        output = subprocess.check_output([sys.executable, "-c", code], cwd=root)
+
+        self.assertEqual(b"False", output.strip())
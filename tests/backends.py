@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import io
+import json
+import unittest
+
+from jsontransform import ConfigurationError, JSONDecoder, JSONEncoder, _backends, dump, dump_lines, dumpb, dumps, \
+    iter_load_lines, load, loadb, loads, set_backend
+from .datastructure import Container, Dog
+
+
+def _get_installed_backend_names():
+    names = []
+    for name in _backends.NAMES:
+        try:
+            _backends.get(name)
+        except ConfigurationError:
+            continue
+
+        names.append(name)
+
+    return names
+
+
+class JSONBackends(unittest.TestCase):
+    def setUp(self):
+        self._container = Container()
+        self._container.container = {
+            "word": u"über/unter",
+            "ratio_x": 1.5,
+            "values": [1, None, True],
+            "issued": datetime.date(2018, 1, 1),
+            1: "one"
+        }
+
+    def tearDown(self):
+        set_backend("json")
+
+    def test_every_installed_backend_encodes_the_same_document(self):
+        expected = json.loads(JSONEncoder().to_json_str(self._container))
+        for name in _get_installed_backend_names():
+            actual = JSONEncoder(backend=name).to_json_str(self._container)
+
+            self.assertEqual(expected, json.loads(actual), name)
+
+    def test_every_installed_backend_decodes_the_same_object(self):
+        document = JSONEncoder().to_json_str(self._container)
+        for name in _get_installed_backend_names():
+            decoder = JSONDecoder(backend=name)
+
+            self.assertEqual(loads(document).container, decoder.from_json_str(document).container, name)
+            self.assertEqual(loads(document).container, decoder.from_json_file(io.StringIO(document)).container, name)
+            self.assertIs(Dog, type(decoder.from_json_str(dumps(Dog()).encode("utf-8"))), name)
+
+    def test_global_backend(self):
+        for name in _get_installed_backend_names():
+            set_backend(name)
+
+            self.assertEqual(name, _backends.get().name)
+            self.assertEqual(self._container.container["word"], loads(dumps(self._container)).container["word"])
+
+    def test_instance_backend_wins(self):
+        set_backend(_get_installed_backend_names()[0])
+
+        self.assertEqual(json.dumps({"container": None}), JSONEncoder(backend="json").to_json_str(Container()))
+
+    def test_auto_selects_the_fastest_installed_backend(self):
+        self.assertEqual(_get_installed_backend_names()[0], _backends.get("auto").name)
+
+    def test_default_is_the_standard_library(self):
+        self.assertEqual(json.dumps({"container": None}), dumps(Container()))
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ConfigurationError):
+            set_backend("unknown")
+
+        with self.assertRaises(ConfigurationError):
+            JSONEncoder(backend="unknown").to_json_str(Container())
+
+
+class BinaryEncoding(unittest.TestCase):
+    def setUp(self):
+        self._container = Container()
+        self._container.container = {"word": u"über", "issued": datetime.date(2018, 1, 1)}
+        self._document = dumps(self._container).encode("utf-8")
+
+    def tearDown(self):
+        set_backend("json")
+
+    def test_dumpb_and_loadb(self):
+        for name in _get_installed_backend_names():
+            set_backend(name)
+            actual = dumpb(self._container)
+
+            self.assertIsInstance(actual, bytes, name)
+            self.assertEqual(json.loads(self._document.decode("utf-8")), json.loads(actual.decode("utf-8")), name)
+
+    def test_loadb_accepts_bytes_like_objects(self):
+        for name in _get_installed_backend_names():
+            decoder = JSONDecoder(backend=name)
+            for json_bytes in (self._document, bytearray(self._document), memoryview(self._document)):
+                actual = decoder.from_json_bytes(json_bytes, Container)
+
+                self.assertEqual(u"über", actual.container["word"], name)
+                self.assertEqual(datetime.date(2018, 1, 1), actual.container["issued"], name)
+
+        self.assertEqual(u"über", loadb(memoryview(self._document)).container["word"])
+
+    def test_binary_file(self):
+        for stream in (False, True):
+            binary_file = io.BytesIO()
+            dump(self._container, binary_file, stream)
+
+            self.assertEqual(self._document, binary_file.getvalue())
+            binary_file.seek(0)
+            self.assertEqual(u"über", load(binary_file).container["word"])
+
+    def test_binary_file_with_bytes_backend(self):
+        binary_file = io.BytesIO()
+        JSONEncoder(backend="auto").to_json_file(self._container, binary_file)
+        binary_file.seek(0)
+
+        self.assertEqual(u"über", JSONDecoder(backend="auto").from_json_file(binary_file).container["word"])
+
+    def test_binary_json_lines(self):
+        binary_file = io.BytesIO()
+        dump_lines([self._container, Container()], binary_file)
+        binary_file.seek(0)
+
+        self.assertEqual([self._container.container["word"], None],
+                         [json_object.container and json_object.container["word"]
+                          for json_object in iter_load_lines(binary_file, Container)])
+
+    def test_invalid_utf8(self):
+        with self.assertRaises(ValueError):
+            loadb(b'{"container": "\xff"}')
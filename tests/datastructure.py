@@ -1,8 +1,14 @@
 # -*- coding: utf-8 -*-
 
+import datetime
+import decimal
+import enum
+import uuid
+from typing import Dict, List
+
 from decorator import decorator
 
-from jsontransform import FieldMode, JSONObject, field
+from jsontransform import FieldMode, JSONObject, field, slot_field, type_tag
 
 
 @decorator
@@ -295,3 +301,238 @@ class ContainerWithFieldModeDecodeOnly(JSONObject):
     @decode_only.setter
     def decode_only(self, value):
         self._decode_only = value
+
+
+@type_tag("pet")
+class Pet(JSONObject):
+    TYPE_TAG = "pet"
+    PET_NAME_NAME = "petName"
+
+    def __init__(self):
+        self._pet_name = ""
+
+    @property
+    @field(PET_NAME_NAME)
+    def pet_name(self):
+        return self._pet_name
+
+    @pet_name.setter
+    def pet_name(self, value):
+        self._pet_name = value
+
+
+@type_tag("dog", key="kind")
+class Dog(Pet):
+    TYPE_TAG = "dog"
+    TYPE_KEY = "kind"
+    BREED_NAME = "breed"
+
+    def __init__(self):
+        super(Dog, self).__init__()
+        self._breed = ""
+
+    @property
+    @field(BREED_NAME)
+    def breed(self):
+        return self._breed
+
+    @breed.setter
+    def breed(self, value):
+        self._breed = value
+
+
+class Garage(JSONObject):
+    CAR_NAME = "car"
+    CARS_NAME = "cars"
+    CARS_BY_ID_NAME = "carsById"
+    METADATA_NAME = "metadata"
+    NEXT_GARAGE_NAME = "nextGarage"
+
+    def __init__(self):
+        self._car = None
+        self._cars = []
+        self._cars_by_id = {}
+        self._metadata = {}
+        self._next_garage = None
+
+    @property
+    @field(CAR_NAME, field_type=Car)
+    def car(self):
+        return self._car
+
+    @car.setter
+    def car(self, value):
+        self._car = value
+
+    @property
+    @field(CARS_NAME, field_type=List[Car])
+    def cars(self):
+        return self._cars
+
+    @cars.setter
+    def cars(self, value):
+        self._cars = value
+
+    @property
+    @field(CARS_BY_ID_NAME, field_type=Dict[str, Car])
+    def cars_by_id(self):
+        return self._cars_by_id
+
+    @cars_by_id.setter
+    def cars_by_id(self, value):
+        self._cars_by_id = value
+
+    @property
+    @field(METADATA_NAME, field_type=dict)
+    def metadata(self):
+        return self._metadata
+
+    @metadata.setter
+    def metadata(self, value):
+        self._metadata = value
+
+    @property
+    @field(NEXT_GARAGE_NAME, field_type="Garage")
+    def next_garage(self):
+        return self._next_garage
+
+    @next_garage.setter
+    def next_garage(self, value):
+        self._next_garage = value
+
+    def get_total_max_speed(self):
+        return sum(car.max_speed for car in self._cars)
+
+
+class TypedScalars(JSONObject):
+    TEXT_NAME = "text"
+    DAY_NAME = "day"
+    MOMENT_NAME = "moment"
+    COUNT_NAME = "count"
+    RATIO_NAME = "ratio"
+    FLAG_NAME = "flag"
+
+    def __init__(self):
+        self._text = None
+        self._day = None
+        self._moment = None
+        self._count = None
+        self._ratio = None
+        self._flag = None
+
+    @property
+    @field(TEXT_NAME, field_type=str)
+    def text(self):
+        return self._text
+
+    @text.setter
+    def text(self, value):
+        self._text = value
+
+    @property
+    @field(DAY_NAME, field_type=datetime.date)
+    def day(self):
+        return self._day
+
+    @day.setter
+    def day(self, value):
+        self._day = value
+
+    @property
+    @field(MOMENT_NAME, field_type=datetime.datetime)
+    def moment(self):
+        return self._moment
+
+    @moment.setter
+    def moment(self, value):
+        self._moment = value
+
+    @property
+    @field(COUNT_NAME, field_type=int)
+    def count(self):
+        return self._count
+
+    @count.setter
+    def count(self, value):
+        self._count = value
+
+    @property
+    @field(RATIO_NAME, field_type=float)
+    def ratio(self):
+        return self._ratio
+
+    @ratio.setter
+    def ratio(self, value):
+        self._ratio = value
+
+    @property
+    @field(FLAG_NAME, field_type=bool)
+    def flag(self):
+        return self._flag
+
+    @flag.setter
+    def flag(self, value):
+        self._flag = value
+
+
+class Color(enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Invoice(JSONObject):
+    AMOUNT_NAME = "amount"
+    REFERENCE_NAME = "reference"
+    COLOR_NAME = "color"
+
+    def __init__(self):
+        self._amount = None
+        self._reference = None
+        self._color = None
+
+    @property
+    @field(AMOUNT_NAME, field_type=decimal.Decimal)
+    def amount(self):
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = value
+
+    @property
+    @field(REFERENCE_NAME, field_type=uuid.UUID)
+    def reference(self):
+        return self._reference
+
+    @reference.setter
+    def reference(self, value):
+        self._reference = value
+
+    @property
+    @field(COLOR_NAME, field_type=Color)
+    def color(self):
+        return self._color
+
+    @color.setter
+    def color(self, value):
+        self._color = value
+
+
+class SlotCar(JSONObject):
+    MODEL_NAME_NAME = "modelName"
+    MAX_SPEED_NAME = "maxSpeed"
+
+    model_name = slot_field(MODEL_NAME_NAME, required=True)
+    max_speed = slot_field(MAX_SPEED_NAME, default=0)
+    extras = slot_field(default_factory=list)
+
+
+class ExtendedSlotCar(SlotCar):
+    HORSEPOWER_NAME = "horsepower"
+    REGISTRATION_NAME = "registration"
+
+    horsepower = slot_field(HORSEPOWER_NAME, field_type=int)
+    registration = slot_field(REGISTRATION_NAME, field_type=datetime.date, mode=FieldMode.DECODE)
+
+    def __init__(self, horsepower=100):
+        self.horsepower = horsepower
@@ -1,12 +1,31 @@
 # -*- coding: utf-8 -*-
 
 import datetime
+import decimal
+import enum
+import io
+import itertools
+import json
+import os
+import pickle
+import shutil
 import sys
+import tempfile
+import threading
 import unittest
+import uuid
 
-from jsontransform import ConfigurationError, ConstraintViolationError, MissingObjectError, _PY2, loadd
-from .datastructure import Car, Container, ContainerWithFieldModeDecodeOnly, ContainerWithFieldModeEncodeOnly, \
-    ExtendedCar, ExtendedExtendedCar, IssuePriority, JSONObjectWithRequiredField, JSONObjectWithoutFields
+from dateutil import parser, tz
+
+from jsontransform import ConfigurationError, ConstraintViolationError, JSONDecoder, JSONEncoder, JSONObject, \
+    MissingObjectError, TYPE_KEY, _ISO8601, _JSONLazyDecoding, _JSONMappedReader, _JSONSchema, _JSONWorker, _PY2, \
+    dump_lines, dumpd, dumpd_many, dumps, enable_codegen, enable_lazy_decoding, field, iter_load, iter_load_lines, \
+    iter_load_path, iter_loads_many, load_lines, load_path, loadd, loadd_many, loads_many, register_codec, slot_field, \
+    unregister_codec
+from .backends import _get_installed_backend_names
+from .datastructure import Car, Color, Container, ContainerWithFieldModeDecodeOnly, ContainerWithFieldModeEncodeOnly, \
+    Dog, ExtendedCar, ExtendedExtendedCar, Garage, Invoice, IssuePriority, JSONObjectWithRequiredField, \
+    JSONObjectWithoutFields, Pet, TypedScalars
 
 
 class DictDeserialization(unittest.TestCase):
@@ -1109,3 +1128,983 @@ class DictDeserializationWithFieldMode(unittest.TestCase):
 
         self.assertIsInstance(actual, ContainerWithFieldModeDecodeOnly)
         self.assertEqual(self._d[ContainerWithFieldModeDecodeOnly.DECODE_ONLY_NAME], actual.decode_only)
+
+
+class DictDeserializationWithCodegen(DictDeserialization):
+    def setUp(self):
+        enable_codegen()
+
+    def tearDown(self):
+        enable_codegen(False)
+
+    def test_decode_function_is_cached(self):
+        loadd({Container.CONTAINER_FIELD_NAME: 1}, Container)
+        schema = _JSONSchema.of(Container)
+
+        self.assertIs(schema.get_decode_function(Container), schema.get_decode_function(Container))
+
+    def test_decoder_instance_with_codegen(self):
+        d = {
+            ExtendedCar.FIELD_MODEL_NAME_NAME: "some car model",
+            ExtendedCar.FIELD_MAX_SPEED_NAME: 130,
+            ExtendedCar.FIELD_HORSEPOWER_NAME: 30
+        }
+        actual = JSONDecoder(codegen=True).from_json_dict(d, ExtendedCar)
+
+        self.assertEqual(d[ExtendedCar.FIELD_MODEL_NAME_NAME], actual.model_name)
+        self.assertEqual(d[ExtendedCar.FIELD_MAX_SPEED_NAME], actual.max_speed)
+        self.assertEqual(d[ExtendedCar.FIELD_HORSEPOWER_NAME], actual.horsepower)
+
+
+class DictDeserializationWithLazyDecoding(DictDeserialization):
+    def setUp(self):
+        enable_lazy_decoding()
+
+    def tearDown(self):
+        enable_lazy_decoding(False)
+
+    def test_not_deserializable_object(self):
+        actual = loadd({Container.CONTAINER_FIELD_NAME: Container()}, Container)
+
+        with self.assertRaises(TypeError):
+            actual.container
+
+    def test_list_with_not_deserializable_object(self):
+        actual = loadd({Container.CONTAINER_FIELD_NAME: [Container()]}, Container)
+
+        with self.assertRaises(TypeError):
+            actual.container
+
+
+class DictDeserializationWithRequiredFieldAndCodegen(DictDeserializationWithRequiredField):
+    def setUp(self):
+        enable_codegen()
+
+    def tearDown(self):
+        enable_codegen(False)
+
+
+class DictDeserializationWithFieldModeAndCodegen(DictDeserializationWithFieldMode):
+    def setUp(self):
+        super(DictDeserializationWithFieldModeAndCodegen, self).setUp()
+        enable_codegen()
+
+    def tearDown(self):
+        enable_codegen(False)
+
+
+class DictDeserializationAutodetectCache(unittest.TestCase):
+    def setUp(self):
+        self._decoder = JSONDecoder(autodetect_cache_size=2)
+        self._car = {Car.FIELD_MODEL_NAME_NAME: "some model", Car.FIELD_MAX_SPEED_NAME: 200}
+
+    def test_hits_and_misses(self):
+        self._decoder.from_json_dict(self._car)
+        self._decoder.from_json_dict(dict(self._car))
+        actual = self._decoder.autodetect_cache_info()
+
+        self.assertEqual((1, 1, 2, 1), actual)
+
+    def test_cached_result_is_the_same_target(self):
+        first = self._decoder.from_json_dict(self._car)
+        second = self._decoder.from_json_dict(self._car)
+
+        self.assertIs(type(first), type(second))
+        self.assertIsInstance(second, Car)
+
+    def test_least_recently_used_key_set_is_evicted(self):
+        self._decoder.from_json_dict(self._car)
+        self._decoder.from_json_dict({Container.CONTAINER_FIELD_NAME: 1})
+        self._decoder.from_json_dict({JSONObjectWithRequiredField.REQUIRED_FIELD_NAME: 1})
+        self._decoder.from_json_dict(self._car)
+
+        self.assertEqual(0, self._decoder.autodetect_cache_info().hits)
+        self.assertEqual(2, self._decoder.autodetect_cache_info().currsize)
+
+    def test_missing_object_is_cached(self):
+        for _ in range(2):
+            with self.assertRaises(MissingObjectError):
+                self._decoder.from_json_dict({"some_unknown_field": 1})
+
+        self.assertEqual(1, self._decoder.autodetect_cache_info().hits)
+
+    def test_cache_is_invalidated_when_a_class_is_defined(self):
+        d = {"someNewField": 1}
+        with self.assertRaises(MissingObjectError):
+            self._decoder.from_json_dict(d)
+
+        class NewObject(JSONObject):
+            @property
+            @field("someNewField")
+            def value(self):
+                return None
+
+            @value.setter
+            def value(self, value):
+                pass
+
+        self.assertIsInstance(self._decoder.from_json_dict(d), NewObject)
+
+    def test_disabled_cache(self):
+        self.assertIsNone(JSONDecoder(autodetect_cache_size=0).autodetect_cache_info())
+
+
+class DictDeserializationWithTypeTag(unittest.TestCase):
+    def test_tag_resolves_target(self):
+        actual = loadd({TYPE_KEY: Pet.TYPE_TAG, Dog.BREED_NAME: "beagle"})
+
+        self.assertIs(Pet, type(actual))
+
+    def test_tag_with_custom_key_resolves_target(self):
+        actual = loadd({Dog.TYPE_KEY: Dog.TYPE_TAG, Dog.PET_NAME_NAME: "snoopy"})
+
+        self.assertIs(Dog, type(actual))
+        self.assertEqual("snoopy", actual.pet_name)
+
+    def test_tag_inside_nested_dict(self):
+        actual = loadd({Container.CONTAINER_FIELD_NAME: {"key1": {Dog.TYPE_KEY: Dog.TYPE_TAG}}}, Container)
+
+        self.assertIs(Dog, type(actual.container["key1"]))
+
+    def test_tag_in_round_trip(self):
+        dog = Dog()
+        dog.breed = "beagle"
+        actual = loadd(dumpd(dog))
+
+        self.assertIs(Dog, type(actual))
+        self.assertEqual(dog.breed, actual.breed)
+
+    def test_payload_without_tag_falls_back_to_matching(self):
+        actual = loadd({Dog.PET_NAME_NAME: "snoopy", Dog.BREED_NAME: "beagle"})
+
+        self.assertIs(Dog, type(actual))
+
+    def test_unknown_tag_falls_back_to_matching(self):
+        actual = loadd({Dog.TYPE_KEY: "unknown", Dog.PET_NAME_NAME: "snoopy", Dog.BREED_NAME: "beagle"})
+
+        self.assertIs(Dog, type(actual))
+
+
+class DictDeserializationWithFieldType(unittest.TestCase):
+    def setUp(self):
+        self._decoder = JSONDecoder()
+        self._car = {Car.FIELD_MODEL_NAME_NAME: "some model", Car.FIELD_MAX_SPEED_NAME: 200}
+
+    def test_json_object(self):
+        actual = self._decoder.from_json_dict({Garage.CAR_NAME: self._car}, Garage)
+
+        self.assertIsInstance(actual.car, Car)
+        self.assertEqual(self._car[Car.FIELD_MODEL_NAME_NAME], actual.car.model_name)
+
+    def test_json_object_is_not_searched(self):
+        self._decoder.from_json_dict({Garage.CAR_NAME: self._car}, Garage)
+
+        self.assertEqual(0, self._decoder.autodetect_cache_info().misses)
+
+    def test_list_of_json_objects(self):
+        actual = self._decoder.from_json_dict({Garage.CARS_NAME: [self._car, self._car]}, Garage)
+
+        self.assertEqual(2, len(actual.cars))
+        self.assertTrue(all(type(car) is Car for car in actual.cars))
+
+    def test_dict_of_json_objects(self):
+        actual = self._decoder.from_json_dict({Garage.CARS_BY_ID_NAME: {"1": self._car}}, Garage)
+
+        self.assertIs(Car, type(actual.cars_by_id["1"]))
+
+    def test_untyped_dict_is_left_alone(self):
+        d = {Garage.METADATA_NAME: {Container.CONTAINER_FIELD_NAME: "2018-08-03"}}
+        actual = self._decoder.from_json_dict(d, Garage)
+
+        self.assertEqual(d[Garage.METADATA_NAME], actual.metadata)
+
+    def test_type_declared_by_name(self):
+        actual = self._decoder.from_json_dict({Garage.NEXT_GARAGE_NAME: {Garage.CAR_NAME: None}}, Garage)
+
+        self.assertIsInstance(actual.next_garage, Garage)
+        self.assertIsNone(actual.next_garage.car)
+
+    def test_type_declared_by_name_is_searched_in_the_module_first(self):
+        class Local(JSONObject):
+            __slots__ = ()
+            value = slot_field("moduleFirstValue")
+
+        class Holder(JSONObject):
+            __slots__ = ()
+            target = slot_field("moduleFirstTarget", field_type="ModuleFirst")
+
+        class Foreign(JSONObject):
+            __module__ = unittest.__name__
+            __slots__ = ()
+            value = slot_field("moduleFirstValue")
+
+        Local.__name__ = Foreign.__name__ = "ModuleFirst"
+        actual = self._decoder.from_json_dict({"moduleFirstTarget": {"moduleFirstValue": 1}}, Holder)
+
+        self.assertIs(Local, type(actual.target))
+
+    def test_ambiguous_type_declared_by_name(self):
+        class First(JSONObject):
+            __module__ = Car.__module__
+            __slots__ = ()
+            value = slot_field("ambiguousValue")
+
+        class Second(JSONObject):
+            __module__ = unittest.__name__
+            __slots__ = ()
+            value = slot_field("ambiguousValue")
+
+        First.__name__ = Second.__name__ = "Ambiguous"
+
+        class Holder(JSONObject):
+            __slots__ = ()
+            ambiguous = slot_field("ambiguous", field_type="Ambiguous")
+
+        with self.assertRaises(ConfigurationError):
+            self._decoder.from_json_dict({"ambiguous": {"ambiguousValue": 1}}, Holder)
+
+    def test_none(self):
+        actual = self._decoder.from_json_dict({Garage.CAR_NAME: None, Garage.CARS_NAME: None}, Garage)
+
+        self.assertIsNone(actual.car)
+        self.assertIsNone(actual.cars)
+
+    def test_wrong_type(self):
+        with self.assertRaises(TypeError):
+            self._decoder.from_json_dict({Garage.CAR_NAME: [self._car]}, Garage)
+
+    def test_with_codegen(self):
+        actual = JSONDecoder(codegen=True).from_json_dict({Garage.CARS_BY_ID_NAME: {"1": self._car}}, Garage)
+
+        self.assertIs(Car, type(actual.cars_by_id["1"]))
+
+    def test_unsupported_type(self):
+        class UnsupportedType(JSONObject):
+            @property
+            @field(field_type=set)
+            def value(self):
+                return None
+
+            @value.setter
+            def value(self, value):
+                pass
+
+        with self.assertRaises(ConfigurationError):
+            self._decoder.from_json_dict({"value": []}, UnsupportedType)
+
+
+class DictDeserializationWithScalarFieldType(unittest.TestCase):
+    def test_str_is_not_sniffed(self):
+        actual = loadd({TypedScalars.TEXT_NAME: "2018-08-03"}, TypedScalars)
+
+        self.assertEqual("2018-08-03", actual.text)
+
+    def test_date(self):
+        actual = loadd({TypedScalars.DAY_NAME: "2018-08-03"}, TypedScalars)
+
+        self.assertEqual(datetime.date(2018, 8, 3), actual.day)
+        self.assertNotIsInstance(actual.day, datetime.datetime)
+
+    def test_datetime(self):
+        actual = loadd({TypedScalars.MOMENT_NAME: "2018-08-03T16:02:21Z"}, TypedScalars)
+
+        self.assertIsInstance(actual.moment, datetime.datetime)
+        self.assertEqual((2018, 8, 3, 16, 2, 21), actual.moment.timetuple()[:6])
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            loadd({TypedScalars.DAY_NAME: "not a date"}, TypedScalars)
+
+    def test_date_from_wrong_type(self):
+        with self.assertRaises(TypeError):
+            loadd({TypedScalars.DAY_NAME: 20180803}, TypedScalars)
+
+    def test_int_float_and_bool(self):
+        d = {TypedScalars.COUNT_NAME: 1, TypedScalars.RATIO_NAME: 2, TypedScalars.FLAG_NAME: True}
+        actual = loadd(d, TypedScalars)
+
+        self.assertEqual(1, actual.count)
+        self.assertIsInstance(actual.ratio, float)
+        self.assertIs(True, actual.flag)
+
+    def test_sniffing_can_be_disabled_for_untyped_fields(self):
+        decoder = JSONDecoder(sniff_dates=False)
+        actual = decoder.from_json_dict({Container.CONTAINER_FIELD_NAME: ["2018-08-03T16:02:21Z"]}, Container)
+
+        self.assertEqual(["2018-08-03T16:02:21Z"], actual.container)
+
+    def test_declared_date_without_sniffing(self):
+        actual = JSONDecoder(sniff_dates=False).from_json_dict({TypedScalars.DAY_NAME: "20180803"}, TypedScalars)
+
+        self.assertEqual(datetime.date(2018, 8, 3), actual.day)
+
+
+class ISO8601Parser(unittest.TestCase):
+    def test_date(self):
+        self.assertEqual(datetime.date(2018, 8, 13), _ISO8601.parse_date("2018-08-13"))
+        self.assertEqual(datetime.date(2018, 8, 13), _ISO8601.parse_date("20180813"))
+
+    def test_datetime_with_offset(self):
+        actual = _ISO8601.parse_datetime("2018-08-13T16:31:12.265-05:30")
+
+        self.assertEqual(datetime.datetime(2018, 8, 13, 16, 31, 12, 265000), actual.replace(tzinfo=None))
+        self.assertEqual(datetime.timedelta(hours=-5, minutes=-30), actual.utcoffset())
+
+    def test_naive_datetime(self):
+        self.assertIsNone(_ISO8601.parse_datetime("20180813T163112").tzinfo)
+
+    def test_tzinfo_matches_dateutil(self):
+        actual = _ISO8601.parse_datetime("2018-08-13T16:31:12+05:30")
+
+        self.assertEqual(tz.tzoffset(None, 19800), actual.tzinfo)
+        self.assertEqual(parser.isoparse("2018-08-13T16:31:12+05:30").tzinfo, actual.tzinfo)
+        self.assertIsNone(actual.tzname())
+
+    def test_tzinfo_is_shared(self):
+        first = _ISO8601.parse_datetime("2018-08-13T16:31:12+02:00")
+        second = _ISO8601.parse_datetime("2018-08-14T10:00:00+02:00")
+
+        self.assertIs(first.tzinfo, second.tzinfo)
+
+    def test_utc(self):
+        self.assertEqual(datetime.timedelta(0), _ISO8601.parse_datetime("2018-08-13T16:31:12Z").utcoffset())
+
+    def test_offset_out_of_range(self):
+        for offset in ("+24", "+25:00", "+05:60"):
+            with self.assertRaises(ValueError):
+                _ISO8601.parse_datetime("2018-01-01T10:00:00" + offset)
+
+    def test_end_of_day_falls_back_to_dateutil(self):
+        actual = _ISO8601.parse_datetime("2018-08-13T24:00:00Z")
+
+        self.assertEqual(datetime.datetime(2018, 8, 14), actual.replace(tzinfo=None))
+
+    def test_invalid_date(self):
+        with self.assertRaises(ValueError):
+            _ISO8601.parse_date("2018-02-30")
+
+
+class DictDeserializationWithDateCache(unittest.TestCase):
+    def setUp(self):
+        self._decoder = JSONDecoder(date_cache_size=2)
+
+    def test_repeated_date_is_parsed_once(self):
+        d = {Container.CONTAINER_FIELD_NAME: ["2018-08-03T16:02:21Z", "2018-08-03T16:02:21Z", "2018-08-03"]}
+        actual = self._decoder.from_json_dict(d, Container)
+
+        self.assertIs(actual.container[0], actual.container[1])
+        self.assertEqual(datetime.date(2018, 8, 3), actual.container[2])
+        self.assertEqual((1, 2, 2, 2), self._decoder.date_cache_info())
+
+    def test_date_and_datetime_of_the_same_str_are_cached_separately(self):
+        d = {TypedScalars.DAY_NAME: "2018-08-03", TypedScalars.MOMENT_NAME: "2018-08-03"}
+        actual = self._decoder.from_json_dict(d, TypedScalars)
+
+        self.assertNotIsInstance(actual.day, datetime.datetime)
+        self.assertIsInstance(actual.moment, datetime.datetime)
+
+    def test_least_recently_used_str_is_evicted(self):
+        d = {Container.CONTAINER_FIELD_NAME: ["2018-08-01", "2018-08-02", "2018-08-03", "2018-08-01"]}
+        self._decoder.from_json_dict(d, Container)
+
+        self.assertEqual(0, self._decoder.date_cache_info().hits)
+        self.assertEqual(2, self._decoder.date_cache_info().currsize)
+
+    def test_concurrent_decoding(self):
+        d = {Container.CONTAINER_FIELD_NAME: ["2018-08-{:02d}".format(day) for day in range(1, 29)] * 10}
+        results = []
+
+        def decode():
+            results.append(self._decoder.from_json_dict(d, Container).container)
+
+        threads = [threading.Thread(target=decode) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        expected = [datetime.date(2018, 8, day) for day in range(1, 29)] * 10
+        self.assertEqual([expected] * 8, results)
+
+    def test_disabled_cache(self):
+        self.assertIsNone(JSONDecoder().date_cache_info())
+
+
+class DictDeserializationWithCodec(unittest.TestCase):
+    def setUp(self):
+        register_codec(decimal.Decimal, str)
+        register_codec(uuid.UUID, str)
+        register_codec(enum.Enum, lambda member: member.value)
+
+    def tearDown(self):
+        for value_type in (decimal.Decimal, uuid.UUID, enum.Enum):
+            unregister_codec(value_type)
+
+    def test_registered_types(self):
+        d = {
+            Invoice.AMOUNT_NAME: "13.37",
+            Invoice.REFERENCE_NAME: "12345678-1234-5678-1234-567812345678",
+            Invoice.COLOR_NAME: "red"
+        }
+        actual = JSONDecoder().from_json_dict(d, Invoice)
+
+        self.assertEqual(decimal.Decimal("13.37"), actual.amount)
+        self.assertEqual(uuid.UUID(d[Invoice.REFERENCE_NAME]), actual.reference)
+        self.assertIs(Color.RED, actual.color)
+
+    def test_custom_decode(self):
+        register_codec(decimal.Decimal, str, lambda value: decimal.Decimal(value) * 2)
+
+        class Doubled(JSONObject):
+            @property
+            @field("doubled", field_type=decimal.Decimal)
+            def value(self):
+                return self._value
+
+            @value.setter
+            def value(self, value):
+                self._value = value
+
+        self.assertEqual(decimal.Decimal("3"), loadd({"doubled": "1.5"}, Doubled).value)
+
+
+class LazyDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._decoder = JSONDecoder(lazy=True)
+        self._car = {Car.FIELD_MODEL_NAME_NAME: "some model", Car.FIELD_MAX_SPEED_NAME: 200}
+        self._d = {
+            Garage.CAR_NAME: self._car,
+            Garage.CARS_NAME: [self._car],
+            Garage.CARS_BY_ID_NAME: {"1": self._car},
+            Garage.METADATA_NAME: {"opened": "2018-09-14"},
+            Garage.NEXT_GARAGE_NAME: None
+        }
+
+    def test_nested_values_are_pending_until_they_are_read(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+
+        self.assertIsInstance(actual, Garage)
+        self.assertIn(Garage.CAR_NAME, _JSONLazyDecoding.get_pending(actual))
+        self.assertIsNone(actual.next_garage)
+        self.assertIn(Garage.CAR_NAME, _JSONLazyDecoding.get_pending(actual))
+
+        self.assertIsInstance(actual.car, Car)
+        self.assertIs(actual.car, actual._car)
+        self.assertEqual("some model", actual.car.model_name)
+        self.assertEqual(200, actual.car.max_speed)
+
+    def test_values_are_decoded_like_eager_decoding(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+        expected = loadd(self._d, Garage)
+
+        self.assertEqual(expected.cars[0].model_name, actual.cars[0].model_name)
+        self.assertEqual(expected.cars_by_id["1"].max_speed, actual.cars_by_id["1"].max_speed)
+        self.assertEqual({"opened": "2018-09-14"}, actual.metadata)
+
+    def test_untyped_date_is_decoded_when_read(self):
+        actual = self._decoder.from_json_dict({Container.CONTAINER_FIELD_NAME: "2018-09-14"}, Container)
+
+        self.assertIn(Container.CONTAINER_FIELD_NAME, _JSONLazyDecoding.get_pending(actual))
+        self.assertEqual(datetime.date(2018, 9, 14), actual.container)
+
+    def test_str_is_set_immediately_without_date_sniffing(self):
+        decoder = JSONDecoder(lazy=True, sniff_dates=False)
+        actual = decoder.from_json_dict({Container.CONTAINER_FIELD_NAME: "2018-09-14"}, Container)
+
+        self.assertEqual("2018-09-14", actual._container)
+
+    def test_untouched_values_are_encoded_as_they_are(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+
+        self.assertEqual(self._d, dumpd(actual))
+        self.assertIs(self._d[Garage.CARS_NAME], dumpd(actual)[Garage.CARS_NAME])
+
+    def test_read_and_assigned_values_are_encoded(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+        actual.car.max_speed = 100
+        actual.cars = []
+
+        result = dumpd(actual)
+
+        self.assertEqual(100, result[Garage.CAR_NAME][Car.FIELD_MAX_SPEED_NAME])
+        self.assertEqual([], result[Garage.CARS_NAME])
+        self.assertEqual(self._d[Garage.CARS_BY_ID_NAME], result[Garage.CARS_BY_ID_NAME])
+
+    def test_nested_objects_are_lazy(self):
+        actual = self._decoder.from_json_dict({Garage.NEXT_GARAGE_NAME: self._d}, Garage)
+
+        self.assertIn(Garage.CAR_NAME, _JSONLazyDecoding.get_pending(actual.next_garage))
+        self.assertEqual("some model", actual.next_garage.car.model_name)
+
+    def test_private_attributes_and_methods_see_the_decoded_values(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+
+        self.assertEqual(200, actual.get_total_max_speed())
+        self.assertIsInstance(actual._car, Car)
+        self.assertEqual({}, _JSONLazyDecoding.get_pending(actual))
+
+    def test_autodetection_and_batch(self):
+        actual = self._decoder.from_json_dicts([self._car, self._d])
+
+        self.assertIsInstance(actual[0], Car)
+        self.assertIsInstance(actual[1], Garage)
+        self.assertEqual("some model", actual[1].car.model_name)
+
+    def test_required_fields_are_validated_immediately(self):
+        with self.assertRaises(ConstraintViolationError):
+            self._decoder.from_json_dict({JSONObjectWithRequiredField.SOME_FIELD_NAME: 1}, JSONObjectWithRequiredField)
+
+    def test_pickled_object_is_decoded_completely(self):
+        actual = pickle.loads(pickle.dumps(self._decoder.from_json_dict(self._d, Garage)))
+
+        self.assertIs(Garage, type(actual))
+        self.assertIs(Car, type(actual.car))
+        self.assertEqual(self._d, dumpd(actual))
+
+    def test_codegen_encoder(self):
+        actual = self._decoder.from_json_dict(self._d, Garage)
+
+        self.assertEqual(self._d, JSONEncoder(codegen=True).to_json_dict(actual))
+        self.assertEqual(json.loads(dumps(loadd(self._d, Garage))), json.loads(dumps(actual)))
+
+
+class ProjectedDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._car = {Car.FIELD_MODEL_NAME_NAME: "some model", Car.FIELD_MAX_SPEED_NAME: 200}
+        self._d = {
+            Garage.CAR_NAME: self._car,
+            Garage.CARS_NAME: [self._car],
+            Garage.CARS_BY_ID_NAME: {"1": self._car},
+            Garage.METADATA_NAME: {"opened": "2018-09-14"},
+            Garage.NEXT_GARAGE_NAME: {Garage.CAR_NAME: self._car}
+        }
+
+    def test_only_selected_fields_are_set(self):
+        actual = loadd(self._d, Garage, only=[Garage.METADATA_NAME])
+
+        self.assertEqual({"opened": "2018-09-14"}, actual.metadata)
+        self.assertIsNone(actual.car)
+        self.assertEqual([], actual.cars)
+        self.assertEqual({}, actual.cars_by_id)
+        self.assertIsNone(actual.next_garage)
+
+    def test_other_fields_are_not_decoded(self):
+        d = dict(self._d)
+        d[Garage.CAR_NAME] = "not a car"
+
+        with self.assertRaises(TypeError):
+            loadd(d, Garage)
+
+        self.assertIsNone(loadd(d, Garage, only=Garage.METADATA_NAME).car)
+
+    def test_unknown_name(self):
+        with self.assertRaises(ConfigurationError):
+            loadd(self._d, Garage, only=[Garage.METADATA_NAME, "metdata"])
+        with self.assertRaises(ConfigurationError):
+            loadd(self._d, Garage, only="nope.car")
+
+    def test_nested_path(self):
+        only = ["car.{}".format(Car.FIELD_MODEL_NAME_NAME), "nextGarage.car.{}".format(Car.FIELD_MAX_SPEED_NAME)]
+        actual = loadd(self._d, Garage, only=only)
+
+        self.assertEqual("some model", actual.car.model_name)
+        self.assertEqual(0, actual.car.max_speed)
+        self.assertEqual(200, actual.next_garage.car.max_speed)
+        self.assertEqual("", actual.next_garage.car.model_name)
+
+    def test_nested_path_into_list_and_dict(self):
+        only = ["cars.{}".format(Car.FIELD_MAX_SPEED_NAME), "carsById.{}".format(Car.FIELD_MODEL_NAME_NAME)]
+        actual = loadd(self._d, Garage, only=only)
+
+        self.assertEqual(200, actual.cars[0].max_speed)
+        self.assertEqual("", actual.cars[0].model_name)
+        self.assertEqual("some model", actual.cars_by_id["1"].model_name)
+        self.assertEqual(0, actual.cars_by_id["1"].max_speed)
+
+    def test_whole_field_wins_over_nested_path(self):
+        for only in (["car", "car.modelName"], ["car.modelName", "car"]):
+            actual = loadd(self._d, Garage, only=only)
+
+            self.assertEqual(200, actual.car.max_speed)
+
+    def test_untyped_field_with_nested_path(self):
+        d = {Container.CONTAINER_FIELD_NAME: dict(self._car, horsepower=30)}
+        actual = loadd(d, Container, only="container.{}".format(Car.FIELD_MODEL_NAME_NAME))
+
+        self.assertIsInstance(actual.container, ExtendedCar)
+        self.assertEqual("some model", actual.container.model_name)
+        self.assertEqual(0, actual.container.max_speed)
+
+    def test_untyped_dict_with_nested_path(self):
+        d = {Container.CONTAINER_FIELD_NAME: {"opened": "2018-09-14", "closed": "2018-09-15"}}
+        actual = loadd(d, Container, only="container.opened")
+
+        self.assertEqual({"opened": datetime.date(2018, 9, 14)}, actual.container)
+
+    def test_autodetection(self):
+        actual = loadd(dict(self._car, horsepower=30), only=[Car.FIELD_MAX_SPEED_NAME])
+
+        self.assertIsInstance(actual, ExtendedCar)
+        self.assertEqual(200, actual.max_speed)
+        self.assertEqual(0, actual.horsepower)
+
+    def test_only_selected_required_fields_are_validated(self):
+        d = {JSONObjectWithRequiredField.SOME_FIELD_NAME: 1}
+        actual = loadd(d, JSONObjectWithRequiredField, only=[JSONObjectWithRequiredField.SOME_FIELD_NAME])
+
+        self.assertEqual(1, actual.some_field)
+        with self.assertRaises(ConstraintViolationError):
+            loadd(d, JSONObjectWithRequiredField, only=[JSONObjectWithRequiredField.REQUIRED_FIELD_NAME])
+
+    def test_empty_only_decodes_all_fields(self):
+        for only in ([], (), iter([])):
+            actual = loadd(self._d, Garage, only=only)
+
+            self.assertEqual("some model", actual.car.model_name)
+            self.assertEqual(200, actual.cars[0].max_speed)
+
+    def test_signature_is_still_matched(self):
+        with self.assertRaises(TypeError):
+            loadd({"unknown": 1}, Car, only=[Car.FIELD_MODEL_NAME_NAME])
+
+    def test_batch_and_stream(self):
+        only = [Car.FIELD_MAX_SPEED_NAME]
+        results = [
+            loadd_many([self._car, self._car], only=only),
+            loads_many([json.dumps(self._car)], only=only),
+            list(iter_load(io.StringIO(json.dumps([self._car, self._car])), Car, only=only)),
+            load_lines(io.StringIO(json.dumps(self._car) + "\n"), only=only)
+        ]
+
+        for actual in results:
+            self.assertEqual(200, actual[0].max_speed)
+            self.assertEqual("", actual[0].model_name)
+
+    @unittest.skipIf(sys.version_info < (3, 7), "worker processes require Python 3.7 or newer")
+    def test_workers(self):
+        actual = loads_many([json.dumps(self._car)] * 3, Car, workers=2, only=[Car.FIELD_MODEL_NAME_NAME])
+
+        self.assertEqual(["some model"] * 3, [car.model_name for car in actual])
+        self.assertEqual([0] * 3, [car.max_speed for car in actual])
+
+
+class _CountingReader(object):
+    def __init__(self, data, chunk_size):
+        self._data = io.BytesIO(data)
+        self._chunk_size = chunk_size
+        self.reads = 0
+
+    def read(self, size=-1):
+        self.reads += 1
+        return self._data.read(min(size, self._chunk_size))
+
+
+class StreamDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._decoder = JSONDecoder()
+
+    def _iter(self, data, target=None, array_path=None, chunk_size=1):
+        reader = _CountingReader(data.encode("utf-8"), chunk_size)
+        return self._decoder.iter_json_file(reader, target, array_path), reader
+
+    def test_top_level_array(self):
+        objects, _ = self._iter(u'[{"container": 12345}, {"container": "über"}, {"container": [1, {"a": null}]}]')
+
+        self.assertEqual([12345, u"über", [1, {"a": None}]], [json_object.container for json_object in objects])
+
+    def test_empty_array(self):
+        objects, _ = self._iter(u" [ ] ")
+
+        self.assertEqual([], list(objects))
+
+    def test_nested_array_path(self):
+        objects, _ = self._iter(
+            u'{"meta": {"items": [1]}, "data": {"count": 1, "items": [{"container": 1.5}]}}', array_path="data.items"
+        )
+
+        self.assertEqual([1.5], [json_object.container for json_object in objects])
+
+    def test_target(self):
+        objects, _ = self._iter(u'[{"container": "2018-01-01"}]', target=Container)
+        actual = list(objects)
+
+        self.assertIs(Container, type(actual[0]))
+        self.assertEqual(datetime.date(2018, 1, 1), actual[0].container)
+
+    def test_elements_are_decoded_while_reading(self):
+        objects, reader = self._iter(u'[{"container": 1}, {"container": 2}]' + u" " * 1000, chunk_size=20)
+        next(objects)
+
+        self.assertLess(reader.reads, 5)
+
+    def test_text_file(self):
+        actual = list(self._decoder.iter_json_file(io.StringIO(u'{"items": [{"container": 1}]}'), array_path="items"))
+
+        self.assertEqual(1, actual[0].container)
+
+    def test_iter_load_shortcut(self):
+        actual = list(iter_load(io.BytesIO(b'[{"container": 1}]'), Container))
+
+        self.assertEqual(1, actual[0].container)
+
+    def test_truncated_array(self):
+        objects, _ = self._iter(u'[{"container": 1}, {"contai')
+
+        with self.assertRaises(ValueError):
+            list(objects)
+
+    def test_missing_separator(self):
+        objects, _ = self._iter(u'[{"container": 1} {"container": 2}]')
+
+        with self.assertRaises(ValueError):
+            list(objects)
+
+    def test_syntax_error_stops_reading(self):
+        objects, reader = self._iter(u'[{"container": x}, ' + u'{"container": 1}, ' * 1000 + u'{"container": 1}]',
+                                     chunk_size=20)
+
+        with self.assertRaises(ValueError):
+            list(objects)
+        self.assertLess(reader.reads, 10)
+
+    def test_number_across_chunks(self):
+        objects, _ = self._iter(u'{"count": 1.5e3, "items": [{"container": 1}]}', array_path="items", chunk_size=1)
+
+        self.assertEqual(1, next(objects).container)
+
+    def test_missing_array_path(self):
+        objects, _ = self._iter(u'{"data": []}', array_path="items")
+
+        with self.assertRaises(ValueError):
+            list(objects)
+
+    def test_not_an_array(self):
+        objects, _ = self._iter(u'{"container": 1}')
+
+        with self.assertRaises(ValueError):
+            list(objects)
+
+
+class JSONLinesDeserialization(unittest.TestCase):
+    def test_autodetection_per_line(self):
+        lines = io.StringIO(u'{"container": 1}\n\n{"@type": "dog", "petName": "Rex", "breed": "Pug"}\n')
+        actual = load_lines(lines)
+
+        self.assertIs(Container, type(actual[0]))
+        self.assertEqual(1, actual[0].container)
+        self.assertIs(Dog, type(actual[1]))
+
+    def test_target(self):
+        actual = list(iter_load_lines(io.BytesIO(b'{"container": "2018-01-01"}\r\n{"container": null}'), Container))
+
+        self.assertEqual([datetime.date(2018, 1, 1), None], [json_object.container for json_object in actual])
+
+    def test_invalid_json_contains_line_number(self):
+        with self.assertRaises(ValueError) as context:
+            load_lines(io.StringIO(u'{"container": 1}\n{"container": \n'))
+
+        self.assertTrue(str(context.exception).startswith("Line 2:"))
+
+    def test_constraint_violation_contains_line_number(self):
+        lines = io.StringIO(u'{"container": 1}\n\n{"container": 2}\n')
+
+        with self.assertRaises(ConstraintViolationError) as context:
+            load_lines(lines, JSONObjectWithRequiredField)
+
+        self.assertTrue(str(context.exception).startswith("Line 1:"))
+
+    def test_missing_object_contains_line_number(self):
+        with self.assertRaises(MissingObjectError) as context:
+            load_lines(io.StringIO(u'{"container": 1}\n{"unknown": 1}\n'))
+
+        self.assertTrue(str(context.exception).startswith("Line 2:"))
+
+    def test_invalid_date_contains_line_number(self):
+        with self.assertRaises(ValueError) as context:
+            load_lines(io.StringIO(u'{"container": 1}\n{"container": "2018-13-45"}\n'))
+
+        self.assertTrue(str(context.exception).startswith("Line 2:"))
+
+    def test_line_without_object_contains_line_number(self):
+        for line in (u"5", u"[]", u'"text"', u"null"):
+            with self.assertRaises(TypeError) as context:
+                load_lines(io.StringIO(u'{"container": 1}\n' + line + u"\n"))
+
+            self.assertTrue(str(context.exception).startswith("Line 2:"))
+
+    def test_round_trip(self):
+        containers = [Container() for _ in range(3)]
+        for index, container in enumerate(containers):
+            container.container = index
+        lines = io.StringIO()
+        dump_lines(containers, lines)
+        lines.seek(0)
+
+        self.assertEqual([0, 1, 2], [json_object.container for json_object in iter_load_lines(lines, Container)])
+
+
+class BatchDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._dicts = [
+            {Car.FIELD_MODEL_NAME_NAME: "car", Car.FIELD_MAX_SPEED_NAME: 200, ExtendedCar.FIELD_HORSEPOWER_NAME: 100},
+            {Container.CONTAINER_FIELD_NAME: "2018-01-01"},
+            {TYPE_KEY: Pet.TYPE_TAG, Pet.PET_NAME_NAME: "Tom"},
+            {Container.CONTAINER_FIELD_NAME: 1},
+        ]
+
+    def _assert_like_loadd(self, actual):
+        expected = [loadd(json_dict) for json_dict in self._dicts]
+
+        self.assertEqual([type(json_object) for json_object in expected], [type(json_object) for json_object in actual])
+        self.assertEqual(dumpd_many(expected), dumpd_many(actual))
+
+    def test_autodetection_in_input_order(self):
+        self._assert_like_loadd(loadd_many(self._dicts))
+
+    def test_with_codegen(self):
+        self._assert_like_loadd(JSONDecoder(codegen=True).from_json_dicts(self._dicts))
+
+    def test_strs(self):
+        self._assert_like_loadd(loads_many(json.dumps(json_dict) for json_dict in self._dicts))
+
+    def test_target_is_detected_once_per_key_set(self):
+        decoder = JSONDecoder(autodetect_cache_size=None)
+        detections = []
+        original = decoder._get_most_matching_json_object
+
+        def count_detections(json_dict):
+            detections.append(json_dict)
+            return original(json_dict)
+
+        decoder._get_most_matching_json_object = count_detections
+        decoder.from_json_dicts([{Container.CONTAINER_FIELD_NAME: index} for index in range(10)])
+
+        self.assertEqual(1, len(detections))
+
+    def test_target(self):
+        actual = loadd_many([{Container.CONTAINER_FIELD_NAME: 1}, {Container.CONTAINER_FIELD_NAME: 2}], Container)
+
+        self.assertEqual([1, 2], [json_object.container for json_object in actual])
+
+    def test_constraint_violation(self):
+        with self.assertRaises(ConstraintViolationError):
+            loadd_many([{JSONObjectWithRequiredField.SOME_FIELD_NAME: 1}], JSONObjectWithRequiredField)
+
+    def test_unknown_dict(self):
+        with self.assertRaises(MissingObjectError):
+            loadd_many([{Container.CONTAINER_FIELD_NAME: 1}, {"unknown": 1}])
+
+    @unittest.skipIf(sys.version_info >= (3, 7), "worker processes are supported since Python 3.7")
+    def test_workers_are_not_supported(self):
+        with self.assertRaises(ConfigurationError):
+            loads_many([json.dumps({Container.CONTAINER_FIELD_NAME: 1})], workers=2)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "worker processes require Python 3.7 or newer")
+class ParallelDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._strs = []
+        for index in range(50):
+            self._strs.append(json.dumps({Container.CONTAINER_FIELD_NAME: index}))
+            self._strs.append(json.dumps({TYPE_KEY: Dog.TYPE_TAG, Pet.PET_NAME_NAME: str(index)}).encode("utf-8"))
+
+    def test_results_are_in_input_order(self):
+        actual = loads_many(self._strs, workers=2)
+
+        self.assertEqual([type(json_object) for json_object in loads_many(self._strs)],
+                         [type(json_object) for json_object in actual])
+        self.assertEqual(dumpd_many(loads_many(self._strs)), dumpd_many(actual))
+
+    def test_chunks_are_yielded_lazily(self):
+        actual = list(itertools.islice(iter_loads_many(iter(self._strs), workers=2, chunk_size=3), 4))
+
+        self.assertEqual([0, "0", 1, "1"], [json_object.container if isinstance(json_object, Container)
+                                             else json_object.pet_name for json_object in actual])
+
+    def test_target_and_decoder_options(self):
+        decoder = JSONDecoder(codegen=True, sniff_dates=False)
+        actual = decoder.from_json_strs(['{"container": "2018-01-01"}'] * 3, Container, workers=2)
+
+        self.assertEqual(["2018-01-01"] * 3, [json_object.container for json_object in actual])
+
+    def test_errors_are_raised_in_the_calling_process(self):
+        with self.assertRaises(MissingObjectError):
+            loads_many(self._strs + ['{"unknown": 1}'], workers=2)
+
+    def test_without_workers(self):
+        actual = list(iter_loads_many(self._strs, chunk_size=7))
+
+        self.assertEqual(dumpd_many(loads_many(self._strs)), dumpd_many(actual))
+
+    def test_worker_initialization(self):
+        _JSONWorker.initialize(["tests.datastructure"], {"sniff_dates": False}, None)
+        actual = _JSONWorker.decode(['{"container": "2018-01-01"}'], None)
+
+        self.assertFalse(_JSONWorker.decoder.sniff_dates)
+        self.assertEqual("2018-01-01", actual[0].container)
+
+
+class MappedFileDeserialization(unittest.TestCase):
+    def setUp(self):
+        self._directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self._directory)
+
+    def _write(self, data):
+        path = os.path.join(self._directory, "document.json")
+        with open(path, "wb") as json_file:
+            json_file.write(data.encode("utf-8"))
+
+        return path
+
+    def test_document(self):
+        path = self._write(u'{"container": "über"}')
+
+        self.assertEqual(u"über", load_path(path).container)
+        self.assertEqual(u"über", JSONDecoder(backend="auto").from_json_path(path, Container).container)
+
+    def test_invalid_document(self):
+        path = self._write(u'{"container": x}')
+
+        for name in _get_installed_backend_names():
+            with self.assertRaises(ValueError):
+                JSONDecoder(backend=name).from_json_path(path)
+
+    def test_array(self):
+        path = self._write(u'{"data": {"items": [{"container": 1}, {"container": "2018-01-01"}]}}')
+        actual = list(iter_load_path(path, Container, array_path="data.items"))
+
+        self.assertEqual([1, datetime.date(2018, 1, 1)], [json_object.container for json_object in actual])
+
+    def test_lines(self):
+        path = self._write(u'{"container": 1}\n\n{"@type": "dog", "petName": "Rex", "breed": "Pug"}\n')
+        actual = list(iter_load_path(path, lines=True))
+
+        self.assertIs(Container, type(actual[0]))
+        self.assertIs(Dog, type(actual[1]))
+
+    def test_elements_after_released_pages(self):
+        path = self._write(u"[{}]".format(u", ".join([u'{"container": 1}'] * 5000)))
+        reader_type = _JSONMappedReader
+        release_size = reader_type.RELEASE_SIZE
+        reader_type.RELEASE_SIZE = 1
+        try:
+            self.assertEqual(5000, len(list(iter_load_path(path, Container))))
+        finally:
+            reader_type.RELEASE_SIZE = release_size
+
+    def test_empty_file(self):
+        path = self._write(u"")
+
+        self.assertEqual([], list(iter_load_path(path, lines=True)))
+        with self.assertRaises(ValueError):
+            list(iter_load_path(path))
+        with self.assertRaises(ValueError):
+            load_path(path)
+
+    def test_array_path_with_lines(self):
+        path = self._write(u'{"container": 1}')
+
+        with self.assertRaises(ConfigurationError):
+            list(iter_load_path(path, array_path="items", lines=True))
@@ -0,0 +1,251 @@
+# -*- coding: utf-8 -*-
+
+import copy
+import datetime
+import gc
+import pickle
+import unittest
+
+from jsontransform import (ConstraintViolationError, JSONDecoder, JSONEncoder, JSONObject, MissingObjectError,
+                           _JSONSchema, _registry, dumpd, field, loadd, slot_field)
+from .datastructure import Car, ExtendedCar, ExtendedExtendedCar, ExtendedSlotCar, SlotCar
+
+
+class CountingGetter(JSONObject):
+    GETTER_CALLS = 0
+
+    @property
+    @field()
+    def value(self):
+        CountingGetter.GETTER_CALLS += 1
+        return "some value"
+
+
+class NotInstantiable(JSONObject):
+    def __init__(self, value):
+        self._value = value
+
+    @property
+    @field("notInstantiableValue")
+    def value(self):
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+
+
+class JSONSchemaCache(unittest.TestCase):
+    def test_schema_is_built_once_per_class(self):
+        first = _JSONSchema.of(Car)
+        second = _JSONSchema.of(Car)
+
+        self.assertIs(first, second)
+
+    def test_subclass_has_its_own_schema(self):
+        car_schema = _JSONSchema.of(Car)
+        extended_car_schema = _JSONSchema.of(ExtendedCar)
+
+        self.assertIsNot(car_schema, extended_car_schema)
+        self.assertEqual(car_schema.names | {ExtendedCar.FIELD_HORSEPOWER_NAME}, extended_car_schema.names)
+
+    def test_fields_are_in_mro_order(self):
+        actual = [json_field.name for json_field in _JSONSchema.of(ExtendedExtendedCar).fields]
+
+        self.assertEqual([
+            ExtendedExtendedCar.FIELD_MODEL_NAME_NAME,
+            ExtendedExtendedCar.FIELD_MAX_SPEED_NAME,
+            ExtendedExtendedCar.FIELD_HORSEPOWER_NAME,
+            ExtendedExtendedCar.FIELD_COLOR_NAME
+        ], actual)
+
+    def test_redefined_class_gets_a_new_schema(self):
+        def define(field_name):
+            class Redefined(JSONObject):
+                @property
+                @field(field_name)
+                def value(self):
+                    return 1
+
+            return Redefined
+
+        self.assertEqual({"first": 1}, dumpd(define("first")()))
+        self.assertEqual({"second": 1}, dumpd(define("second")()))
+
+    def test_field_metadata_is_attached_at_class_definition(self):
+        self.assertEqual("value", CountingGetter.value.fget._json_field_name)
+
+    def test_getter_is_called_once_per_encode(self):
+        CountingGetter.GETTER_CALLS = 0
+        _JSONSchema.invalidate(CountingGetter)
+        dumpd(CountingGetter())
+
+        self.assertEqual(1, CountingGetter.GETTER_CALLS)
+
+    def test_invalidate(self):
+        schema = _JSONSchema.of(Car)
+        _JSONSchema.invalidate(Car)
+
+        self.assertIsNot(schema, _JSONSchema.of(Car))
+
+
+class JSONObjectRegistryIndex(unittest.TestCase):
+    def test_detection_does_not_instantiate_classes(self):
+        self.assertIs(NotInstantiable, _registry.get_most_matching_json_object({"notInstantiableValue": 1}))
+
+    def test_most_occurrences_win(self):
+        d = {
+            ExtendedExtendedCar.FIELD_MODEL_NAME_NAME: "some model",
+            ExtendedExtendedCar.FIELD_COLOR_NAME: "red"
+        }
+
+        self.assertIs(ExtendedExtendedCar, _registry.get_most_matching_json_object(d))
+
+    def test_exact_amount_of_fields_wins_a_tie(self):
+        d = {
+            Car.FIELD_MODEL_NAME_NAME: "some model",
+            Car.FIELD_MAX_SPEED_NAME: 200
+        }
+
+        self.assertIs(Car, _registry.get_most_matching_json_object(d))
+
+    def test_depth_first_order_wins_a_remaining_tie(self):
+        class First(JSONObject):
+            __slots__ = ()
+            a = slot_field("depthFirstA")
+            b = slot_field("depthFirstB")
+
+        class Second(JSONObject):
+            __slots__ = ()
+            a = slot_field("depthFirstA")
+            c = slot_field("depthFirstC")
+
+        class ExtendedFirst(First):
+            __slots__ = ()
+            d = slot_field("depthFirstD")
+
+        d = {"depthFirstD": 1, "depthFirstC": 2, "depthFirstZ": 3, "depthFirstW": 4}
+
+        self.assertIs(ExtendedFirst, _registry.get_most_matching_json_object(d))
+
+    def test_class_is_indexed_when_defined(self):
+        class DefinedLater(JSONObject):
+            @property
+            @field("definedLaterField")
+            def value(self):
+                return None
+
+            @value.setter
+            def value(self, value):
+                pass
+
+        self.assertIsInstance(loadd({"definedLaterField": 1}), DefinedLater)
+
+    def test_garbage_collected_class_is_removed(self):
+        def define():
+            class Temporary(JSONObject):
+                @property
+                @field("temporaryField")
+                def value(self):
+                    return None
+
+            return Temporary
+
+        self.assertIs(define(), _registry.get_most_matching_json_object({"temporaryField": 1}))
+        gc.collect()
+
+        with self.assertRaises(MissingObjectError):
+            _registry.get_most_matching_json_object({"temporaryField": 1})
+
+
+class SlotFields(unittest.TestCase):
+    def setUp(self):
+        self._car = ExtendedSlotCar(horsepower=250)
+        self._car.model_name = "some model"
+        self._car.max_speed = 200
+        self._car.extras.append("sunroof")
+
+    def test_instance_has_no_dict(self):
+        self.assertFalse(hasattr(self._car, "__dict__"))
+
+    def test_defaults_are_set_before_init(self):
+        car = SlotCar()
+
+        self.assertIsNone(car.model_name)
+        self.assertEqual(0, car.max_speed)
+        self.assertEqual([], car.extras)
+
+    def test_default_factory_creates_a_value_per_instance(self):
+        self.assertIsNot(SlotCar().extras, SlotCar().extras)
+
+    def test_fields_are_encoded_in_declaration_order(self):
+        expected = [
+            SlotCar.MODEL_NAME_NAME, SlotCar.MAX_SPEED_NAME, "extras", ExtendedSlotCar.HORSEPOWER_NAME
+        ]
+
+        self.assertEqual(expected, list(dumpd(self._car)))
+
+    def test_decode_only_field_is_not_encoded(self):
+        self.assertNotIn(ExtendedSlotCar.REGISTRATION_NAME, dumpd(self._car))
+
+    def test_decode(self):
+        d = {
+            SlotCar.MODEL_NAME_NAME: "some model",
+            SlotCar.MAX_SPEED_NAME: 200,
+            "extras": ["sunroof"],
+            ExtendedSlotCar.HORSEPOWER_NAME: 250,
+            ExtendedSlotCar.REGISTRATION_NAME: "2018-09-14"
+        }
+
+        actual = loadd(d)
+
+        self.assertIsInstance(actual, ExtendedSlotCar)
+        self.assertEqual("some model", actual.model_name)
+        self.assertEqual(200, actual.max_speed)
+        self.assertEqual(["sunroof"], actual.extras)
+        self.assertEqual(250, actual.horsepower)
+        self.assertEqual(datetime.date(2018, 9, 14), actual.registration)
+
+    def test_missing_field_is_decoded_like_a_property_field(self):
+        actual = loadd({SlotCar.MODEL_NAME_NAME: "some model"}, SlotCar)
+
+        self.assertIsNone(actual.max_speed)
+        self.assertIsNone(actual.extras)
+
+    def test_missing_required_field(self):
+        with self.assertRaises(ConstraintViolationError):
+            loadd({SlotCar.MAX_SPEED_NAME: 200}, SlotCar)
+
+    def test_codegen(self):
+        d = JSONEncoder(codegen=True).to_json_dict(self._car)
+        actual = JSONDecoder(codegen=True).from_json_dict(d, ExtendedSlotCar)
+
+        self.assertEqual(dumpd(self._car), d)
+        self.assertEqual(d, dumpd(actual))
+
+    def test_pickle_and_copy(self):
+        for actual in (pickle.loads(pickle.dumps(self._car)), copy.deepcopy(self._car)):
+            self.assertEqual(dumpd(self._car), dumpd(actual))
+
+    def test_additional_slots(self):
+        class WithCache(JSONObject):
+            __slots__ = "cache"
+
+            value = slot_field("withCacheValue")
+
+        actual = WithCache()
+        actual.cache = "not encoded"
+        actual.value = 1
+
+        self.assertEqual({"withCacheValue": 1}, dumpd(actual))
+
+    def test_slot_and_property_fields_can_be_mixed(self):
+        class Mixed(JSONObject):
+            slot_value = slot_field("mixedSlotValue", default=1)
+
+            @property
+            @field("mixedPropertyValue")
+            def property_value(self):
+                return 2
+
+        self.assertEqual({"mixedSlotValue": 1, "mixedPropertyValue": 2}, dumpd(Mixed()))
@@ -1,17 +1,22 @@
 # -*- coding: utf-8 -*-
 
 import datetime
+import decimal
+import enum
+import json
 import sys
 import unittest
+import uuid
 
 from dateutil import tz
 
-from jsontransform import ConfigurationError, JSONEncoder, dumpd
+from jsontransform import ConfigurationError, JSONEncoder, TYPE_KEY, _JSONSchema, _JSONWorker, _codecs, dump, \
+    dump_lines, dumpd, dumpd_many, dumps_many, enable_codegen, register_codec, unregister_codec
 from .common import get_new_york_utc_offset, get_berlin_utc_offset, get_london_utc_offset, get_istanbul_utc_offset,\
     get_tokyo_utc_offset
-from .datastructure import Container, ContainerWithFieldModeDecodeOnly, ContainerWithFieldModeEncodeOnly, \
-    ContainerWithSomeDecoratorAfterField, ContainerWithSomeDecoratorBeforeField, ExtendedCar, JSONObjectWithoutFields, \
-    NotSerializableObject
+from .datastructure import Color, Container, ContainerWithFieldModeDecodeOnly, ContainerWithFieldModeEncodeOnly, \
+    ContainerWithSomeDecoratorAfterField, ContainerWithSomeDecoratorBeforeField, Dog, ExtendedCar, Invoice, \
+    JSONObjectWithoutFields, NotSerializableObject, Pet
 
 
 class DictSerialization(unittest.TestCase):
@@ -911,3 +916,357 @@ class DictSerializationWithFieldMode(unittest.TestCase):
 
         actual = dumpd(container)
         self.assertNotIn(ContainerWithFieldModeDecodeOnly.DECODE_ONLY_NAME, actual.keys())
+
+
+class DictSerializationWithCodegen(DictSerialization):
+    def setUp(self):
+        super(DictSerializationWithCodegen, self).setUp()
+        enable_codegen()
+
+    def tearDown(self):
+        enable_codegen(False)
+
+    def test_encode_function_is_cached(self):
+        dumpd(self._container)
+        schema = _JSONSchema.of(Container)
+
+        self.assertIs(schema.get_encode_function(), schema.get_encode_function())
+
+    def test_encoder_instance_with_codegen(self):
+        self._container.container = ExtendedCar()
+        actual = JSONEncoder(codegen=True).to_json_dict(self._container)
+
+        self.assertEqual(dumpd(self._container), actual)
+
+
+class DictSerializationWithFieldModeAndCodegen(DictSerializationWithFieldMode):
+    def setUp(self):
+        enable_codegen()
+
+    def tearDown(self):
+        enable_codegen(False)
+
+
+class DictSerializationWithTypeTag(unittest.TestCase):
+    def test_tag_is_encoded(self):
+        actual = dumpd(Pet())
+
+        self.assertEqual(Pet.TYPE_TAG, actual[TYPE_KEY])
+
+    def test_tag_with_custom_key_is_encoded(self):
+        actual = dumpd(Dog())
+
+        self.assertEqual(Dog.TYPE_TAG, actual[Dog.TYPE_KEY])
+        self.assertNotIn(TYPE_KEY, actual)
+
+    def test_tag_is_encoded_with_codegen(self):
+        actual = JSONEncoder(codegen=True).to_json_dict(Dog())
+
+        self.assertEqual(Dog.TYPE_TAG, actual[Dog.TYPE_KEY])
+
+    def test_untagged_object_has_no_tag(self):
+        self.assertNotIn(TYPE_KEY, dumpd(Container()))
+
+
+class DictSerializationWithCodec(unittest.TestCase):
+    def setUp(self):
+        register_codec(decimal.Decimal, str)
+        register_codec(uuid.UUID, str)
+        register_codec(enum.Enum, lambda member: member.value)
+        self._container = Container()
+
+    def tearDown(self):
+        for value_type in (decimal.Decimal, uuid.UUID, enum.Enum):
+            unregister_codec(value_type)
+
+    def test_registered_types(self):
+        invoice = Invoice()
+        invoice.amount = decimal.Decimal("13.37")
+        invoice.reference = uuid.UUID("12345678-1234-5678-1234-567812345678")
+        invoice.color = Color.RED
+        actual = dumpd(invoice)
+
+        self.assertEqual("13.37", actual[Invoice.AMOUNT_NAME])
+        self.assertEqual("12345678-1234-5678-1234-567812345678", actual[Invoice.REFERENCE_NAME])
+        self.assertEqual("red", actual[Invoice.COLOR_NAME])
+
+    def test_codec_inside_list(self):
+        self._container.container = [Color.GREEN, decimal.Decimal("1")]
+        actual = dumpd(self._container)
+
+        self.assertEqual(["green", "1"], actual[Container.CONTAINER_FIELD_NAME])
+
+    def test_handler_is_cached_per_type(self):
+        self._container.container = Color.GREEN
+        dumpd(self._container)
+
+        self.assertIn(Color, _codecs.encode_handlers)
+
+    def test_unregistered_type(self):
+        unregister_codec(decimal.Decimal)
+        self._container.container = decimal.Decimal("1")
+
+        with self.assertRaises(TypeError):
+            dumpd(self._container)
+
+    def test_codec_with_codegen(self):
+        self._container.container = decimal.Decimal("2.5")
+        actual = JSONEncoder(codegen=True).to_json_dict(self._container)
+
+        self.assertEqual("2.5", actual[Container.CONTAINER_FIELD_NAME])
+
+    def test_simple_types_cannot_have_a_codec(self):
+        for value_type in (str, int, float, bool, type(None)):
+            with self.assertRaises(ConfigurationError):
+                register_codec(value_type, lambda value: "yes")
+
+        self._container.container = True
+        writer = _ChunkWriter()
+        JSONEncoder().to_json_file(self._container, writer, stream=True)
+        expected = {Container.CONTAINER_FIELD_NAME: True}
+
+        self.assertEqual(expected, dumpd(self._container))
+        self.assertEqual(expected, JSONEncoder(codegen=True).to_json_dict(self._container))
+        self.assertEqual(expected, json.loads(writer.getvalue()))
+
+
+class _ChunkWriter(object):
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, value):
+        self.chunks.append(value)
+
+    def getvalue(self):
+        return "".join(self.chunks)
+
+
+class StreamSerialization(unittest.TestCase):
+    def setUp(self):
+        self._container = Container()
+        self._writer = _ChunkWriter()
+
+    def _assert_streamed_like_dumps(self, json_object):
+        JSONEncoder().to_json_file(json_object, self._writer, stream=True)
+
+        self.assertEqual(json.dumps(dumpd(json_object)), self._writer.getvalue())
+
+    def test_simple_values(self):
+        for value in ("", u"über \"quoted\"\n", 0, -42, 13.37, True, False, None, [], {}):
+            self._writer = _ChunkWriter()
+            self._container.container = value
+            self._assert_streamed_like_dumps(self._container)
+
+    def test_nested_values(self):
+        self._container.container = {"a": [1, 2.5, {"b": None}], "c": {}, 1: "non string key"}
+        self._assert_streamed_like_dumps(self._container)
+
+    def test_nested_json_object(self):
+        nested = Container()
+        nested.container = [Container(), datetime.date(2018, 1, 1)]
+        self._container.container = nested
+        self._assert_streamed_like_dumps(self._container)
+
+    def test_type_tag(self):
+        self._assert_streamed_like_dumps(Dog())
+
+    def test_codec_of_str_subclass(self):
+        class Tag(str):
+            pass
+
+        register_codec(Tag, lambda value: "TAG:" + value)
+        try:
+            self._container.container = [Tag("x"), "y"]
+            self._assert_streamed_like_dumps(self._container)
+            self.assertIn("TAG:x", self._writer.getvalue())
+        finally:
+            unregister_codec(Tag)
+
+    def test_str_subclass_without_codec(self):
+        class Name(str):
+            pass
+
+        self._container.container = Name(u"über")
+        self._assert_streamed_like_dumps(self._container)
+
+    def test_generator_is_consumed_lazily(self):
+        consumed = []
+
+        def generate():
+            for i in range(3):
+                consumed.append(i)
+                yield i
+
+        self._container.container = generate()
+        pieces = JSONEncoder().iterencode(self._container)
+
+        next(pieces)
+        self.assertEqual([], consumed)
+        self.assertEqual('[0, 1, 2]}', "".join(pieces))
+        self.assertEqual([0, 1, 2], consumed)
+
+    def test_chunks_are_buffered(self):
+        self._container.container = list(range(1000))
+        encoder = JSONEncoder()
+        encoder.STREAM_CHUNK_SIZE = 100
+        encoder.to_json_file(self._container, self._writer, stream=True)
+
+        self.assertGreater(len(self._writer.chunks), 1)
+        self.assertTrue(all(len(chunk) >= 100 for chunk in self._writer.chunks[:-1]))
+        self.assertEqual(json.dumps(dumpd(self._container)), self._writer.getvalue())
+
+    def test_dump_shortcut(self):
+        self._container.container = [1, 2]
+        dump(self._container, self._writer, stream=True)
+
+        self.assertEqual('{"container": [1, 2]}', self._writer.getvalue())
+
+    def test_object_without_fields(self):
+        with self.assertRaises(ConfigurationError):
+            JSONEncoder().to_json_file(JSONObjectWithoutFields(), self._writer, stream=True)
+
+    def test_not_serializable_value(self):
+        self._container.container = NotSerializableObject()
+
+        with self.assertRaises(TypeError):
+            JSONEncoder().to_json_file(self._container, self._writer, stream=True)
+
+
+class JSONLinesSerialization(unittest.TestCase):
+    def test_every_object_in_its_own_line(self):
+        first = Container()
+        first.container = 1
+        second = Dog()
+        writer = _ChunkWriter()
+        dump_lines([first, second], writer)
+
+        self.assertEqual([json.dumps(dumpd(first)), json.dumps(dumpd(second)), ""], writer.getvalue().split("\n"))
+
+    def test_lines_are_written_in_chunks(self):
+        containers = [Container() for _ in range(100)]
+        writer = _ChunkWriter()
+        encoder = JSONEncoder()
+        encoder.STREAM_CHUNK_SIZE = 200
+        encoder.to_json_lines(containers, writer)
+
+        self.assertLess(len(writer.chunks), len(containers))
+        self.assertEqual(len(containers), writer.getvalue().count("\n"))
+
+    def test_no_objects(self):
+        writer = _ChunkWriter()
+        dump_lines(iter([]), writer)
+
+        self.assertEqual([], writer.chunks)
+
+
+class BatchSerialization(unittest.TestCase):
+    def setUp(self):
+        self._encoder = JSONEncoder()
+        self._objects = []
+        for index in range(3):
+            car = ExtendedCar()
+            car.model_name = "car {}".format(index)
+            car.horsepower = index
+            container = Container()
+            container.container = datetime.date(2018, 1, index + 1)
+            self._objects.extend([car, container, Dog()])
+
+    def test_results_are_in_input_order(self):
+        self.assertEqual([dumpd(json_object) for json_object in self._objects], dumpd_many(self._objects))
+
+    def test_with_codegen(self):
+        actual = JSONEncoder(codegen=True).to_json_dicts(self._objects)
+
+        self.assertEqual([dumpd(json_object) for json_object in self._objects], actual)
+
+    def test_fields_are_looked_up_once_per_class(self):
+        self._encoder.to_json_dicts(self._objects[:1])
+        calls = []
+        original = _JSONSchema.of
+
+        def count_calls(json_class):
+            calls.append(json_class)
+            return original(json_class)
+
+        _JSONSchema.of = staticmethod(count_calls)
+        try:
+            self._encoder.to_json_dicts(self._objects)
+        finally:
+            _JSONSchema.of = original
+
+        self.assertEqual(3, len(calls))
+
+    def test_strs(self):
+        self.assertEqual([json.dumps(dumpd(json_object)) for json_object in self._objects], dumps_many(self._objects))
+
+    def test_strs_as_array(self):
+        actual = dumps_many(iter(self._objects), as_array=True)
+
+        self.assertEqual(json.dumps([dumpd(json_object) for json_object in self._objects]), actual)
+
+    def test_no_objects(self):
+        self.assertEqual([], dumpd_many([]))
+        self.assertEqual("[]", dumps_many([], as_array=True))
+
+    def test_object_without_fields(self):
+        with self.assertRaises(ConfigurationError):
+            dumpd_many([Container(), JSONObjectWithoutFields()])
+
+    @unittest.skipIf(sys.version_info >= (3, 7), "worker processes are supported since Python 3.7")
+    def test_workers_are_not_supported(self):
+        with self.assertRaises(ConfigurationError):
+            dumps_many([Container()], workers=2)
+
+
+@unittest.skipIf(sys.version_info < (3, 7), "worker processes require Python 3.7 or newer")
+class ParallelSerialization(unittest.TestCase):
+    def setUp(self):
+        self._objects = []
+        for index in range(50):
+            container = Container()
+            container.container = {"index": index, "day": datetime.date(2018, 1, index % 28 + 1)}
+            self._objects.extend([container, Dog()])
+
+    def test_strs_in_input_order(self):
+        self.assertEqual(dumps_many(self._objects), dumps_many(iter(self._objects), workers=2))
+
+    def test_strs_as_array(self):
+        actual = JSONEncoder(codegen=True).to_json_strs(self._objects, as_array=True, workers=2)
+
+        self.assertEqual(dumps_many(self._objects, as_array=True), actual)
+
+    def test_lines(self):
+        expected = _ChunkWriter()
+        dump_lines(self._objects, expected)
+        actual = _ChunkWriter()
+        dump_lines(self._objects, actual, workers=2)
+
+        self.assertEqual(expected.getvalue(), actual.getvalue())
+
+    def test_no_objects(self):
+        writer = _ChunkWriter()
+        dump_lines([], writer, workers=2)
+
+        self.assertEqual([], dumps_many([], workers=2))
+        self.assertEqual("[]", dumps_many([], as_array=True, workers=2))
+        self.assertEqual("", writer.getvalue())
+
+    def test_chunk_size_depends_on_the_pickled_size(self):
+        small = Container()
+        big = Container()
+        big.container = "x" * 10000
+
+        self.assertGreater(_JSONWorker.get_chunk_size([small]), _JSONWorker.get_chunk_size([big]))
+        self.assertLessEqual(_JSONWorker.get_chunk_size([small]), _JSONWorker.MAX_CHUNK_SIZE)
+        self.assertEqual(1, _JSONWorker.get_chunk_size([self._huge_container()]))
+
+    def test_errors_are_raised_in_the_calling_process(self):
+        with self.assertRaises(ConfigurationError):
+            dumps_many(self._objects + [JSONObjectWithoutFields()], workers=2)
+
+    @staticmethod
+    def _huge_container():
+        container = Container()
+        container.container = "x" * (_JSONWorker.CHUNK_PAYLOAD_SIZE * 2)
+
+        return container